@@ -225,11 +225,27 @@ class OAuth2Manager:
                 # Force re-authentication
                 self.authorize(force_reauth=True)
         
+        # Imported here - youtube_client imports this package at load time
+        from youtube_client import api_http, response_model
+        
+        http = api_http(self.creds)
+        if http is None:
+            return build(
+                service_name,
+                version,
+                credentials=self.creds,
+                cache_discovery=False,
+                static_discovery=True,
+                model=response_model()
+            )
+        
         return build(
             service_name,
             version,
-            credentials=self.creds,
-            cache_discovery=False
+            http=http,
+            cache_discovery=False,
+            static_discovery=True,
+            model=response_model()
         )
     
     def revoke_credentials(self):
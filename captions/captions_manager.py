@@ -26,6 +26,8 @@ import re
 
 logger = logging.getLogger(__name__)
 
+_VIDEO_ID_RE = re.compile(r'^[A-Za-z0-9_-]{11}$')
+
 
 class CaptionsManager:
     """
@@ -503,7 +505,7 @@ class CaptionsManager:
     
     def _validate_video_id(self, video_id: str) -> None:
         """Validate video ID format."""
-        if not video_id or not re.match(r'^[A-Za-z0-9_-]{11}$', video_id):
+        if not video_id or not _VIDEO_ID_RE.match(video_id):
             raise ValueError(f"Invalid video ID: {video_id}")
     
     def _validate_language_code(self, language: str) -> None:
@@ -12,6 +12,7 @@ This module provides comprehensive playlist management capabilities:
 Part of Phase 2.3: Playlist Management
 """
 
+from .playlist_cache import PlaylistMetaCache, PlaylistItemsCache
 from .playlist_creator import PlaylistCreator
 from .playlist_updater import PlaylistUpdater
 from .playlist_manager import PlaylistManager
@@ -22,6 +23,8 @@ __all__ = [
     'PlaylistUpdater',
     'PlaylistManager',
     'PlaylistReorderer',
+    'PlaylistMetaCache',
+    'PlaylistItemsCache',
 ]
 
 __version__ = '1.0.0'
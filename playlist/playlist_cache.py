@@ -0,0 +1,193 @@
+"""
+YouTube MCP Server - Playlist Metadata Cache
+===========================================
+
+Caches for playlist resources and item listings.
+
+Features:
+- One playlists.list call serves snippet, status and item count
+- Bounded size with per-entry TTL
+- Explicit invalidation after writes
+- Persistent, ETag-revalidated item listings (SQLite)
+
+Part of Phase 2.3: Playlist Management
+"""
+
+from typing import Dict, Any, List, Optional
+from threading import Lock
+from cachetools import TTLCache
+from googleapiclient.discovery import Resource
+import json
+import logging
+import os
+import sqlite3
+import time
+
+# Optional faster codec for stored pages
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Fetched once per entry so every reader is served from the same response
+_META_PARTS = "snippet,status,contentDetails"
+
+
+class PlaylistMetaCache:
+    """
+    TTL cache of playlist resources keyed by playlist ID.
+
+    Share one instance between the playlist classes of a client so that
+    repeated info reads reuse the same playlists.list response. Writes read
+    with fresh=True so they never send back values edited elsewhere since,
+    then call put() with the written resource, or invalidate() when they
+    have no complete resource to store.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: int = 60):
+        """
+        Initialize PlaylistMetaCache.
+
+        Args:
+            maxsize: Maximum number of playlists kept
+            ttl: Seconds an entry stays valid
+        """
+        self._entries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = Lock()
+
+    def get_or_fetch(
+        self,
+        youtube: Resource,
+        playlist_id: str,
+        fresh: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a playlist resource, fetching it on a miss.
+
+        Args:
+            youtube: YouTube API resource used on a miss
+            playlist_id: Playlist ID
+            fresh: Skip the cached entry and fetch (and store) the current
+                resource; writers use this so they never build on a stale copy
+
+        Returns:
+            Playlist resource with snippet, status and contentDetails,
+            or None if the playlist does not exist
+
+        Raises:
+            HttpError: If the API request fails
+
+        Quota Cost: 1 unit on a miss or when fresh, 0 on a hit
+        """
+        with self._lock:
+            item = None if fresh else self._entries.get(playlist_id)
+        if item is not None:
+            logger.debug("Playlist metadata cache hit: %s", playlist_id)
+            return item
+
+        response = youtube.playlists().list(
+            part=_META_PARTS,
+            id=playlist_id
+        ).execute()
+
+        items = response.get("items")
+        if not items:
+            self.invalidate(playlist_id)
+            return None
+
+        with self._lock:
+            self._entries[playlist_id] = items[0]
+        return items[0]
+
+    def put(self, playlist_id: str, item: Dict[str, Any]) -> None:
+        """Store a playlist resource, e.g. one returned by a write."""
+        with self._lock:
+            self._entries[playlist_id] = item
+
+    def invalidate(self, playlist_id: str) -> None:
+        """Drop the cached entry for a playlist, if any."""
+        with self._lock:
+            self._entries.pop(playlist_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class PlaylistItemsCache:
+    """
+    SQLite-backed store of playlist item listings, page by page.
+
+    Each page is kept with the ETag it was served with, so a later listing
+    can revalidate every page with If-None-Match and reuse the stored items
+    on a 304 instead of downloading them again. Because every page is
+    revalidated, entries never need explicit invalidation.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize PlaylistItemsCache.
+
+        Args:
+            path: SQLite database file (created if missing)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS playlist_items ("
+                "playlist_id TEXT PRIMARY KEY, "
+                "pages_json BLOB NOT NULL, "
+                "fetched_at INTEGER NOT NULL)"
+            )
+
+    def get(self, playlist_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the stored pages of a playlist.
+
+        Returns:
+            List of pages ({"pageToken", "etag", "nextPageToken", "items"}),
+            or None if nothing is stored
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT pages_json FROM playlist_items WHERE playlist_id = ?",
+                (playlist_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            return orjson.loads(row[0]) if orjson else json.loads(row[0])
+        except ValueError:
+            logger.warning("Discarding unreadable playlist items entry: %s", playlist_id)
+            self.invalidate(playlist_id)
+            return None
+
+    def put(self, playlist_id: str, pages: List[Dict[str, Any]]) -> None:
+        """Store the pages of a playlist, replacing any previous entry."""
+        if orjson:
+            pages_json = orjson.dumps(pages)
+        else:
+            pages_json = json.dumps(pages, separators=(",", ":"))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO playlist_items "
+                "(playlist_id, pages_json, fetched_at) VALUES (?, ?, ?)",
+                (playlist_id, pages_json, int(time.time()))
+            )
+
+    def invalidate(self, playlist_id: str) -> None:
+        """Drop the stored pages of a playlist, if any."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM playlist_items WHERE playlist_id = ?",
+                (playlist_id,)
+            )
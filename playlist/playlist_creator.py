@@ -19,8 +19,14 @@ from googleapiclient.discovery import Resource
 from googleapiclient.errors import HttpError
 import logging
 
+from .playlist_cache import PlaylistMetaCache
+
 logger = logging.getLogger(__name__)
 
+# Allowed privacy levels (hoisted so validation allocates nothing per call)
+_VALID_PRIVACY: frozenset = frozenset({"public", "private", "unlisted"})
+_VALID_PRIVACY_MSG = "public, private, unlisted"
+
 
 class PlaylistCreator:
     """
@@ -30,14 +36,19 @@ class PlaylistCreator:
     including privacy settings, descriptions, and localization.
     """
     
-    def __init__(self, youtube: Resource):
+    __slots__ = ("youtube", "_meta_cache")
+    
+    def __init__(self, youtube: Resource, meta_cache: Optional[PlaylistMetaCache] = None):
         """
         Initialize PlaylistCreator.
         
         Args:
             youtube: Authenticated YouTube API resource
+            meta_cache: Playlist metadata cache to share with the other
+                playlist classes (a private one is created if omitted)
         """
         self.youtube = youtube
+        self._meta_cache = meta_cache or PlaylistMetaCache()
         logger.info("PlaylistCreator initialized")
     
     def create_playlist(
@@ -95,7 +106,7 @@ class PlaylistCreator:
         self._validate_description(description)
         self._validate_privacy_status(privacy_status)
         
-        logger.info(f"Creating playlist: {title} (privacy: {privacy_status})")
+        logger.info("Creating playlist: %s (privacy: %s)", title, privacy_status)
         
         # Prepare request body
         playlist_body = {
@@ -133,12 +144,11 @@ class PlaylistCreator:
                 "tags": response["snippet"].get("tags", [])
             }
             
-            logger.info(f"✅ Playlist created successfully: {playlist_id}")
+            logger.info("✅ Playlist created successfully: %s", playlist_id)
             return result
             
         except HttpError as e:
-            error_msg = f"Failed to create playlist: {str(e)}"
-            logger.error(error_msg)
+            logger.error("Failed to create playlist: %s", e)
             raise
     
     def _validate_title(self, title: str) -> None:
@@ -180,11 +190,10 @@ class PlaylistCreator:
         Raises:
             ValueError: If privacy status is invalid
         """
-        valid_statuses = {"public", "private", "unlisted"}
-        if privacy_status not in valid_statuses:
+        if privacy_status not in _VALID_PRIVACY:
             raise ValueError(
                 f"Invalid privacy status: {privacy_status}. "
-                f"Must be one of: {', '.join(valid_statuses)}"
+                f"Must be one of: {_VALID_PRIVACY_MSG}"
             )
     
     def delete_playlist(self, playlist_id: str) -> Dict[str, Any]:
@@ -213,12 +222,13 @@ class PlaylistCreator:
         if not playlist_id or not playlist_id.strip():
             raise ValueError("Playlist ID cannot be empty")
         
-        logger.info(f"Deleting playlist: {playlist_id}")
+        logger.info("Deleting playlist: %s", playlist_id)
         
         try:
             self.youtube.playlists().delete(id=playlist_id).execute()
+            self._meta_cache.invalidate(playlist_id)
             
-            logger.info(f"✅ Playlist deleted successfully: {playlist_id}")
+            logger.info("✅ Playlist deleted successfully: %s", playlist_id)
             return {
                 "success": True,
                 "message": "Playlist deleted successfully",
@@ -227,9 +237,7 @@ class PlaylistCreator:
             
         except HttpError as e:
             if e.resp.status == 404:
-                error_msg = f"Playlist not found: {playlist_id}"
+                logger.error("Playlist not found: %s", playlist_id)
             else:
-                error_msg = f"Failed to delete playlist: {str(e)}"
-            
-            logger.error(error_msg)
+                logger.error("Failed to delete playlist: %s", e)
             raise
@@ -14,14 +14,71 @@ Features:
 Part of Phase 2.3: Playlist Management
 """
 
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from googleapiclient.discovery import Resource
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+import google_auth_httplib2
+import asyncio
 import logging
+import re
+import threading
 import time
 
+from .playlist_cache import PlaylistMetaCache
+from .token_bucket import WRITE_LIMITER
+
 logger = logging.getLogger(__name__)
 
+# Precompiled ID formats - reject malformed IDs before they cost an API call.
+# Playlist prefixes vary (PL, UU, OLAK5uy_, LL, WL, ...), so only the
+# charset and length are checked and the API decides whether one exists.
+_VIDEO_ID_RE = re.compile(r'[A-Za-z0-9_-]{11}')
+_PLAYLIST_ID_RE = re.compile(r'[A-Za-z0-9_-]{2,64}')
+
+# Partial response for membership scans - only the video IDs are read.
+# The etag is per page and every page is revalidated with it, so no
+# playlist-wide field (e.g. pageInfo/totalResults) is needed to spot changes
+_VIDEO_ID_FIELDS = "etag,nextPageToken,items(snippet/resourceId/videoId)"
+
+# Delay between sequential write requests in batch operations
+_BATCH_DELAY_SECONDS = 0.5
+
+# API error reason -> user-facing message
+_ERROR_REASON_MAP = {
+    "videoNotFound": "Video not found or unavailable: {video_id}",
+    "playlistNotFound": "Playlist not found: {playlist_id}",
+    "forbidden": "Video cannot be added (private/restricted)",
+    "playlistItemsNotAccessible": "Playlist not accessible: {playlist_id}",
+    "videoAlreadyInPlaylist": "Video already exists in playlist: {video_id}",
+    "duplicate": "Video already exists in playlist: {video_id}",
+}
+
+# Fallback when the response carries no recognised reason
+_ERROR_STATUS_MAP = {
+    403: _ERROR_REASON_MAP["forbidden"],
+    404: _ERROR_REASON_MAP["videoNotFound"],
+    409: _ERROR_REASON_MAP["duplicate"],
+}
+
+
+def _classify_http_error(error: HttpError) -> Optional[str]:
+    """
+    Map an HttpError to a message template.
+    
+    Reads the structured reasons HttpError already parsed from the response
+    body instead of formatting and searching the whole error string.
+    """
+    details = getattr(error, "error_details", None)
+    if isinstance(details, list):
+        for detail in details:
+            if isinstance(detail, dict):
+                template = _ERROR_REASON_MAP.get(detail.get("reason"))
+                if template:
+                    return template
+    return _ERROR_STATUS_MAP.get(error.resp.status)
+
 
 class PlaylistManager:
     """
@@ -31,14 +88,24 @@ class PlaylistManager:
     including batch operations with progress tracking.
     """
     
-    def __init__(self, youtube: Resource):
+    __slots__ = ("youtube", "_meta_cache", "_playlist_cache", "_local")
+    
+    def __init__(self, youtube: Resource, meta_cache: Optional[PlaylistMetaCache] = None):
         """
         Initialize PlaylistManager.
         
         Args:
             youtube: Authenticated YouTube API resource
+            meta_cache: Playlist metadata cache to share with the other
+                playlist classes (a private one is created if omitted)
         """
         self.youtube = youtube
+        self._meta_cache = meta_cache or PlaylistMetaCache()
+        # playlist_id -> pages ({"pageToken", "etag", "nextPageToken",
+        # "video_ids"}) for conditional re-reads
+        self._playlist_cache: Dict[str, List[Dict[str, Any]]] = {}
+        # Per-thread HTTP transports for the concurrent batch paths
+        self._local = threading.local()
         logger.info("PlaylistManager initialized")
     
     def add_video(
@@ -95,8 +162,16 @@ class PlaylistManager:
         if position is not None and position < 0:
             raise ValueError("Position must be non-negative")
         
-        logger.info(f"Adding video {video_id} to playlist {playlist_id}")
-        
+        return self._add_video_unchecked(playlist_id, video_id, position, note)
+    
+    def _add_video_unchecked(
+        self,
+        playlist_id: str,
+        video_id: str,
+        position: Optional[int] = None,
+        note: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Add a video without re-validating IDs the caller has already checked."""
         # Prepare request body
         body = {
             "snippet": {
@@ -116,6 +191,21 @@ class PlaylistManager:
         if note:
             body["snippet"]["note"] = note
         
+        return self._insert_item(body)
+    
+    def _insert_item(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Insert a playlist item from a prepared request body.
+        
+        The body is serialized when the request is built, so callers may
+        reuse and mutate the same dict between calls.
+        """
+        snippet = body["snippet"]
+        playlist_id = snippet["playlistId"]
+        video_id = snippet["resourceId"]["videoId"]
+        
+        logger.info("Adding video %s to playlist %s", video_id, playlist_id)
+        
         try:
             response = self.youtube.playlistItems().insert(
                 part="snippet",
@@ -130,18 +220,22 @@ class PlaylistManager:
                 "added_at": response["snippet"]["publishedAt"]
             }
             
-            logger.info(f"✅ Video added successfully: {video_id} at position {result['position']}")
+            # Playlist contents changed - cached snapshot is stale
+            self._playlist_cache.pop(playlist_id, None)
+            self._meta_cache.invalidate(playlist_id)
+            
+            logger.info(
+                "✅ Video added successfully: %s at position %s",
+                video_id, result["position"]
+            )
             return result
             
         except HttpError as e:
-            if "videoNotFound" in str(e) or e.resp.status == 404:
-                error_msg = f"Video not found or unavailable: {video_id}"
-            elif "forbidden" in str(e).lower():
-                error_msg = "Video cannot be added (private/restricted)"
-            elif "duplicate" in str(e).lower():
-                error_msg = f"Video already exists in playlist: {video_id}"
+            template = _classify_http_error(e)
+            if template:
+                error_msg = template.format(video_id=video_id, playlist_id=playlist_id)
             else:
-                error_msg = f"Failed to add video: {str(e)}"
+                error_msg = f"Failed to add video: {e}"
             
             logger.error(error_msg)
             raise ValueError(error_msg) from e
@@ -151,7 +245,8 @@ class PlaylistManager:
         playlist_id: str,
         video_ids: List[str],
         skip_duplicates: bool = True,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        verify_videos: bool = True
     ) -> Dict[str, Any]:
         """
         Add multiple videos to a playlist.
@@ -161,12 +256,16 @@ class PlaylistManager:
             video_ids: List of video IDs to add
             skip_duplicates: Skip videos already in playlist
             progress_callback: Function(current, total, video_id) called for each video
+            verify_videos: Check that videos exist with one videos.list call
+                per 50 IDs before inserting, so deleted/unknown IDs fail
+                without spending an insert
         
         Returns:
             Dictionary containing:
             - added: List of successfully added video IDs
             - failed: List of failed video IDs with error messages
             - skipped: List of skipped (duplicate) video IDs
+            - duplicate_input: Repeated IDs dropped from the input list
             - total: Total videos processed
         
         Example:
@@ -177,7 +276,7 @@ class PlaylistManager:
             manager = PlaylistManager(youtube)
             result = manager.add_videos_batch(
                 playlist_id="PLxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx",
-                video_ids=["video1", "video2", "video3"],
+                video_ids=["dQw4w9WgXcQ", "9bZkp7q19f0", "kJQP7kiw5Fk"],
                 progress_callback=progress
             )
             
@@ -185,51 +284,111 @@ class PlaylistManager:
             print(f"Failed: {len(result['failed'])}")
             ```
         
-        Quota Cost: 50 units per video
+        Quota Cost: 50 units per video (+1 unit per 50 videos when verify_videos)
         """
         self._validate_playlist_id(playlist_id)
         
         if not video_ids:
             raise ValueError("video_ids list cannot be empty")
         
+        # Drop repeated IDs up front (first occurrence wins, order preserved)
+        seen = set()
+        ordered = []
+        duplicate_input = []
+        for video_id in video_ids:
+            if video_id in seen:
+                duplicate_input.append(video_id)
+            else:
+                seen.add(video_id)
+                ordered.append(video_id)
+        
         added = []
         failed = []
         skipped = []
         
+        # Reject malformed IDs offline - no API call needed
+        valid_ids = []
+        for video_id in ordered:
+            if isinstance(video_id, str) and _VIDEO_ID_RE.fullmatch(video_id):
+                valid_ids.append(video_id)
+            else:
+                failed.append({
+                    "video_id": video_id,
+                    "error": "Malformed video ID"
+                })
+        
         # Get existing videos if skip_duplicates is enabled
         existing_videos = set()
-        if skip_duplicates:
+        if skip_duplicates and valid_ids:
             try:
-                existing_videos = self._get_playlist_video_ids(playlist_id)
+                if len(valid_ids) < 50:
+                    # Small batch - stop paging once every input is located
+                    existing_videos = self._contains_videos(playlist_id, set(valid_ids))
+                else:
+                    existing_videos = self._get_playlist_video_ids(playlist_id)
             except Exception as e:
-                logger.warning(f"Could not fetch existing videos: {e}")
+                logger.warning("Could not fetch existing videos: %s", e)
+        
+        # Partition once so the insert loop only sees genuinely new IDs
+        if existing_videos:
+            new_ids = [v for v in valid_ids if v not in existing_videos]
+            skipped = [v for v in valid_ids if v in existing_videos]
+        else:
+            new_ids = valid_ids
+        
+        # Drop unknown/deleted videos before they cost an insert each
+        if new_ids and verify_videos:
+            missing = self._find_missing_videos(new_ids)
+            if missing:
+                new_ids = [v for v in new_ids if v not in missing]
+                failed.extend(
+                    {"video_id": v, "error": f"Video not found or unavailable: {v}"}
+                    for v in valid_ids if v in missing
+                )
+        
+        total = len(ordered)
+        
+        if not new_ids:
+            logger.info(
+                "Nothing to add to playlist %s: %d already present, %d failed",
+                playlist_id, len(skipped), len(failed)
+            )
+            return {
+                "added": added,
+                "failed": failed,
+                "skipped": skipped,
+                "duplicate_input": duplicate_input,
+                "total": total
+            }
+        
+        pending = len(new_ids)
+        logger.info(
+            "Adding %d videos to playlist %s (%d already present)",
+            pending, playlist_id, len(skipped)
+        )
         
-        total = len(video_ids)
-        logger.info(f"Adding {total} videos to playlist {playlist_id}")
+        # One request body for the whole batch; only the video ID changes
+        resource = {"kind": "youtube#video", "videoId": None}
+        body = {"snippet": {"playlistId": playlist_id, "resourceId": resource}}
         
-        for idx, video_id in enumerate(video_ids, 1):
+        for idx, video_id in enumerate(new_ids, 1):
             # Progress callback
             if progress_callback:
-                progress_callback(idx, total, video_id)
-            
-            # Skip duplicates
-            if skip_duplicates and video_id in existing_videos:
-                logger.info(f"Skipping duplicate: {video_id}")
-                skipped.append(video_id)
-                continue
+                progress_callback(idx, pending, video_id)
             
             # Attempt to add video
             try:
-                self.add_video(playlist_id, video_id)
+                resource["videoId"] = video_id
+                self._insert_item(body)
                 added.append(video_id)
                 
                 # Rate limiting - wait between requests
-                if idx < total:
-                    time.sleep(0.5)  # 500ms delay
+                if idx < pending:
+                    self._sleep(_BATCH_DELAY_SECONDS)
                     
             except Exception as e:
                 error_msg = str(e)
-                logger.error(f"Failed to add {video_id}: {error_msg}")
+                logger.error("Failed to add %s: %s", video_id, error_msg)
                 failed.append({
                     "video_id": video_id,
                     "error": error_msg
@@ -239,12 +398,13 @@ class PlaylistManager:
             "added": added,
             "failed": failed,
             "skipped": skipped,
+            "duplicate_input": duplicate_input,
             "total": total
         }
         
         logger.info(
-            f"✅ Batch complete: {len(added)} added, "
-            f"{len(failed)} failed, {len(skipped)} skipped"
+            "✅ Batch complete: %d added, %d failed, %d skipped",
+            len(added), len(failed), len(skipped)
         )
         
         return result
@@ -275,17 +435,25 @@ class PlaylistManager:
         
         Quota Cost: 50 units
         """
+        return self._remove_video(playlist_item_id)
+    
+    def _remove_video(self, playlist_item_id: str, http=None) -> Dict[str, Any]:
+        """Remove a playlist item, optionally over a caller-supplied HTTP transport."""
         if not playlist_item_id or not playlist_item_id.strip():
             raise ValueError("Playlist item ID cannot be empty")
         
-        logger.info(f"Removing playlist item: {playlist_item_id}")
+        logger.info("Removing playlist item: %s", playlist_item_id)
         
         try:
             self.youtube.playlistItems().delete(
                 id=playlist_item_id
-            ).execute()
+            ).execute(http=http)
+            
+            # Parent playlist is unknown here, so drop every snapshot
+            self._playlist_cache.clear()
+            self._meta_cache.clear()
             
-            logger.info(f"✅ Playlist item removed: {playlist_item_id}")
+            logger.info("✅ Playlist item removed: %s", playlist_item_id)
             return {
                 "success": True,
                 "message": "Video removed from playlist successfully",
@@ -305,7 +473,9 @@ class PlaylistManager:
         self,
         playlist_item_ids: List[str],
         continue_on_error: bool = True,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        max_workers: int = 1,
+        use_batch_api: bool = False
     ) -> Dict[str, Any]:
         """
         Remove multiple videos from playlists.
@@ -314,6 +484,12 @@ class PlaylistManager:
             playlist_item_ids: List of playlist item IDs to remove
             continue_on_error: Continue if individual removals fail
             progress_callback: Function(current, total, item_id) called for each video
+            max_workers: Number of concurrent deletions (1 = sequential with
+                a 500ms delay between requests; more are paced by the
+                shared playlist write limiter)
+            use_batch_api: Send deletions as batch HTTP requests of up to 50
+                calls each instead of one round-trip per item (takes
+                precedence over max_workers)
         
         Returns:
             Dictionary containing:
@@ -321,16 +497,37 @@ class PlaylistManager:
             - failed: List of failed item IDs with error messages
             - total: Total items processed
         
+        Note:
+            With max_workers > 1 or use_batch_api, progress_callback fires in
+            completion order rather than input order. With use_batch_api and
+            continue_on_error=False, the rest of the failing 50-item chunk
+            has already been sent when the error is raised.
+        
         Quota Cost: 50 units per video
         """
         if not playlist_item_ids:
             raise ValueError("playlist_item_ids list cannot be empty")
         
+        if use_batch_api:
+            return self._remove_videos_batched(
+                playlist_item_ids,
+                continue_on_error,
+                progress_callback
+            )
+        
+        if max_workers > 1:
+            return self._remove_videos_parallel(
+                playlist_item_ids,
+                continue_on_error,
+                progress_callback,
+                max_workers
+            )
+        
         removed = []
         failed = []
         total = len(playlist_item_ids)
         
-        logger.info(f"Removing {total} videos from playlists")
+        logger.info("Removing %d videos from playlists", total)
         
         for idx, item_id in enumerate(playlist_item_ids, 1):
             if progress_callback:
@@ -342,11 +539,11 @@ class PlaylistManager:
                 
                 # Rate limiting
                 if idx < total:
-                    time.sleep(0.5)
+                    self._sleep(_BATCH_DELAY_SECONDS)
                     
             except Exception as e:
                 error_msg = str(e)
-                logger.error(f"Failed to remove {item_id}: {error_msg}")
+                logger.error("Failed to remove %s: %s", item_id, error_msg)
                 failed.append({
                     "playlist_item_id": item_id,
                     "error": error_msg
@@ -361,43 +558,399 @@ class PlaylistManager:
             "total": total
         }
         
-        logger.info(f"✅ Batch removal complete: {len(removed)} removed, {len(failed)} failed")
+        logger.info(
+            "✅ Batch removal complete: %d removed, %d failed",
+            len(removed), len(failed)
+        )
         return result
     
+    async def remove_videos_batch_async(
+        self,
+        playlist_item_ids: List[str],
+        max_concurrency: int = 8,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Remove multiple videos concurrently from within an event loop.
+        
+        Each deletion runs in a worker thread (googleapiclient is blocking),
+        with at most max_concurrency requests in flight. Failures are
+        collected rather than raised.
+        
+        Args:
+            playlist_item_ids: List of playlist item IDs to remove
+            max_concurrency: Maximum simultaneous deletions
+            progress_callback: Function(current, total, item_id) called as
+                each removal completes
+        
+        Returns:
+            Same structure as remove_videos_batch()
+        
+        Quota Cost: 50 units per video
+        """
+        if not playlist_item_ids:
+            raise ValueError("playlist_item_ids list cannot be empty")
+        
+        total = len(playlist_item_ids)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        logger.info(
+            "Removing %d videos from playlists (concurrency=%d)",
+            total, max_concurrency
+        )
+        
+        async def remove_one(item_id: str) -> Tuple[str, Optional[str]]:
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(self._remove_video_threaded, item_id)
+                    return item_id, None
+                except Exception as e:
+                    return item_id, str(e)
+        
+        tasks = [asyncio.ensure_future(remove_one(item_id)) for item_id in playlist_item_ids]
+        
+        removed = []
+        failed = []
+        for idx, task in enumerate(asyncio.as_completed(tasks), 1):
+            item_id, error_msg = await task
+            if progress_callback:
+                progress_callback(idx, total, item_id)
+            
+            if error_msg is None:
+                removed.append(item_id)
+            else:
+                logger.error("Failed to remove %s: %s", item_id, error_msg)
+                failed.append({
+                    "playlist_item_id": item_id,
+                    "error": error_msg
+                })
+        
+        logger.info(
+            "✅ Batch removal complete: %d removed, %d failed",
+            len(removed), len(failed)
+        )
+        return {
+            "removed": removed,
+            "failed": failed,
+            "total": total
+        }
+    
+    def _remove_videos_parallel(
+        self,
+        playlist_item_ids: List[str],
+        continue_on_error: bool,
+        progress_callback: Optional[Callable[[int, int, str], None]],
+        max_workers: int
+    ) -> Dict[str, Any]:
+        """Thread-pool implementation of remove_videos_batch()."""
+        total = len(playlist_item_ids)
+        removed = []
+        failed = []
+        
+        logger.info(
+            "Removing %d videos from playlists (workers=%d)",
+            total, max_workers
+        )
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._remove_video_threaded, item_id): item_id
+                for item_id in playlist_item_ids
+            }
+            
+            for idx, future in enumerate(as_completed(futures), 1):
+                item_id = futures[future]
+                if progress_callback:
+                    progress_callback(idx, total, item_id)
+                
+                try:
+                    future.result()
+                    removed.append(item_id)
+                except Exception as e:
+                    error_msg = str(e)
+                    logger.error("Failed to remove %s: %s", item_id, error_msg)
+                    failed.append({
+                        "playlist_item_id": item_id,
+                        "error": error_msg
+                    })
+                    
+                    if not continue_on_error:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
+        
+        logger.info(
+            "✅ Batch removal complete: %d removed, %d failed",
+            len(removed), len(failed)
+        )
+        return {
+            "removed": removed,
+            "failed": failed,
+            "total": total
+        }
+    
+    def _find_missing_videos(self, video_ids: List[str]) -> Set[str]:
+        """
+        Return the IDs that videos.list does not know about.
+        
+        Looks up 50 IDs per request (1 quota unit each). If a lookup fails
+        the batch is treated as unverified and nothing is reported missing.
+        
+        Args:
+            video_ids: Well-formed video IDs to check
+        
+        Returns:
+            Set of IDs that do not exist or are unavailable
+        """
+        found = set()
+        try:
+            for start in range(0, len(video_ids), 50):
+                chunk = video_ids[start:start + 50]
+                response = self.youtube.videos().list(
+                    part="id",
+                    id=",".join(chunk),
+                    maxResults=50,
+                    fields="items/id"
+                ).execute()
+                found.update(item["id"] for item in response.get("items", []))
+        except HttpError as e:
+            logger.warning("Could not verify videos exist: %s", e)
+            return set()
+        
+        return set(video_ids) - found
+    
+    @staticmethod
+    def _sleep(seconds: float) -> None:
+        """
+        Pause between sequential batch requests.
+        
+        The synchronous batch methods cannot yield to an event loop, so when
+        one is running on this thread the pause would stall it; warn and
+        point at the async API instead of silently blocking.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            logger.warning(
+                "Blocking batch delay on the event loop thread; "
+                "use remove_videos_batch_async() from async code"
+            )
+        time.sleep(seconds)
+    
+    def _remove_videos_batched(
+        self,
+        playlist_item_ids: List[str],
+        continue_on_error: bool,
+        progress_callback: Optional[Callable[[int, int, str], None]]
+    ) -> Dict[str, Any]:
+        """BatchHttpRequest implementation of remove_videos_batch()."""
+        total = len(playlist_item_ids)
+        removed = []
+        failed = []
+        
+        logger.info("Removing %d videos from playlists (batch API)", total)
+        
+        def on_response(request_id, response, exception):
+            if progress_callback:
+                progress_callback(len(removed) + len(failed) + 1, total, request_id)
+            
+            if exception is None:
+                removed.append(request_id)
+                return
+            
+            if isinstance(exception, HttpError) and exception.resp.status == 404:
+                error_msg = f"Playlist item not found: {request_id}"
+            else:
+                error_msg = str(exception)
+            logger.error("Failed to remove %s: %s", request_id, error_msg)
+            failed.append({
+                "playlist_item_id": request_id,
+                "error": error_msg
+            })
+        
+        try:
+            # The API accepts at most 50 calls per batch request
+            for start in range(0, total, 50):
+                batch = self.youtube.new_batch_http_request(callback=on_response)
+                for item_id in playlist_item_ids[start:start + 50]:
+                    batch.add(
+                        self.youtube.playlistItems().delete(id=item_id),
+                        request_id=item_id
+                    )
+                batch.execute()
+                
+                if failed and not continue_on_error:
+                    raise ValueError(
+                        f"Failed to remove {failed[0]['playlist_item_id']}: "
+                        f"{failed[0]['error']}"
+                    )
+        finally:
+            if removed:
+                self._playlist_cache.clear()
+                self._meta_cache.clear()
+        
+        logger.info(
+            "✅ Batch removal complete: %d removed, %d failed",
+            len(removed), len(failed)
+        )
+        return {
+            "removed": removed,
+            "failed": failed,
+            "total": total
+        }
+    
+    def _remove_video_threaded(self, playlist_item_id: str) -> Dict[str, Any]:
+        """
+        Remove a playlist item using the calling thread's own transport.
+        
+        Used by the concurrent removal paths, which have no delay between
+        requests; the shared write limiter paces them instead.
+        """
+        WRITE_LIMITER.acquire()
+        return self._remove_video(playlist_item_id, http=self._thread_http())
+    
+    def _thread_http(self):
+        """
+        Get this thread's HTTP transport.
+        
+        httplib2.Http is not thread-safe, so each worker thread gets its own
+        instance, authorized with the client's credentials when it has any.
+        """
+        http = getattr(self._local, "http", None)
+        if http is None:
+            credentials = getattr(getattr(self.youtube, "_http", None), "credentials", None)
+            http = build_http()
+            if credentials is not None:
+                http = google_auth_httplib2.AuthorizedHttp(credentials, http=http)
+            self._local.http = http
+        return http
+    
     def _get_playlist_video_ids(self, playlist_id: str) -> set:
-        """Get set of video IDs currently in playlist."""
-        video_ids = set()
+        """
+        Get set of video IDs currently in playlist.
+        
+        When a previous snapshot exists, each page is requested with
+        ``If-None-Match`` and the stored page is reused on a 304 reply.
+        Every page is revalidated, since a change on a later page does not
+        change the ETag of the pages before it.
+        """
+        cached_pages = self._playlist_cache.get(playlist_id)
+        pages = []
         next_page_token = None
         
         try:
             while True:
+                request = self.youtube.playlistItems().list(
+                    part="snippet",
+                    playlistId=playlist_id,
+                    maxResults=50,
+                    pageToken=next_page_token,
+                    fields=_VIDEO_ID_FIELDS
+                )
+                
+                cached = None
+                if cached_pages and len(pages) < len(cached_pages):
+                    candidate = cached_pages[len(pages)]
+                    if candidate["pageToken"] == next_page_token and candidate["etag"]:
+                        cached = candidate
+                        request.headers["If-None-Match"] = cached["etag"]
+                
+                try:
+                    response = request.execute()
+                    page = {
+                        "pageToken": next_page_token,
+                        "etag": response.get("etag"),
+                        "nextPageToken": response.get("nextPageToken"),
+                        "video_ids": [
+                            item["snippet"]["resourceId"]["videoId"]
+                            for item in response.get("items", [])
+                        ],
+                    }
+                except HttpError as e:
+                    if cached is None or e.resp.status != 304:
+                        raise
+                    logger.debug("Playlist page not modified: %s", playlist_id)
+                    page = cached
+                
+                pages.append(page)
+                
+                next_page_token = page["nextPageToken"]
+                if not next_page_token:
+                    break
+            
+            if all(page["etag"] for page in pages):
+                self._playlist_cache[playlist_id] = pages
+            else:
+                self._playlist_cache.pop(playlist_id, None)
+            
+            return {video_id for page in pages for video_id in page["video_ids"]}
+            
+        except HttpError as e:
+            logger.error("Failed to get playlist videos: %s", e)
+            raise
+    
+    def _contains_videos(self, playlist_id: str, needles: Set[str]) -> Set[str]:
+        """
+        Find which of the given video IDs are already in a playlist.
+        
+        Pages through the playlist only until every needle has been found,
+        so a handful of IDs near the top of a long playlist costs a single
+        request. When a snapshot is cached the ETag-revalidated full read
+        is used instead, since 304 replies carry no items.
+        
+        Args:
+            playlist_id: Playlist to search
+            needles: Video IDs to look for
+        
+        Returns:
+            Subset of needles present in the playlist
+        """
+        if playlist_id in self._playlist_cache:
+            return needles & self._get_playlist_video_ids(playlist_id)
+        
+        remaining = set(needles)
+        found = set()
+        next_page_token = None
+        
+        try:
+            while remaining:
                 response = self.youtube.playlistItems().list(
                     part="snippet",
                     playlistId=playlist_id,
                     maxResults=50,
-                    pageToken=next_page_token
+                    pageToken=next_page_token,
+                    fields=_VIDEO_ID_FIELDS
                 ).execute()
                 
                 for item in response.get("items", []):
                     video_id = item["snippet"]["resourceId"]["videoId"]
-                    video_ids.add(video_id)
+                    if video_id in remaining:
+                        remaining.discard(video_id)
+                        found.add(video_id)
                 
                 next_page_token = response.get("nextPageToken")
                 if not next_page_token:
                     break
             
-            return video_ids
+            return found
             
         except HttpError as e:
-            logger.error(f"Failed to get playlist videos: {e}")
+            logger.error("Failed to get playlist videos: %s", e)
             raise
     
     def _validate_playlist_id(self, playlist_id: str) -> None:
         """Validate playlist ID format."""
         if not playlist_id or not playlist_id.strip():
             raise ValueError("Playlist ID cannot be empty")
+        
+        if not _PLAYLIST_ID_RE.fullmatch(playlist_id):
+            raise ValueError(f"Invalid playlist ID format: {playlist_id}")
     
     def _validate_video_id(self, video_id: str) -> None:
         """Validate video ID format."""
         if not video_id or not video_id.strip():
             raise ValueError("Video ID cannot be empty")
+        
+        if not _VIDEO_ID_RE.fullmatch(video_id):
+            raise ValueError(f"Invalid video ID format: {video_id}")
@@ -14,14 +14,97 @@ Features:
 Part of Phase 2.3: Playlist Management
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from googleapiclient.discovery import Resource
 from googleapiclient.errors import HttpError
+import asyncio
+import bisect
 import logging
-import time
+
+from .playlist_cache import PlaylistMetaCache, PlaylistItemsCache
+from .token_bucket import WRITE_LIMITER
 
 logger = logging.getLogger(__name__)
 
+_REVERSE_STRATEGIES = ("minimal", "naive")
+
+# Partial response for item listings - only what reordering reads
+_ITEM_FIELDS = "etag,nextPageToken,items(id,snippet(position,resourceId/videoId))"
+# Same item fields for lookups by playlist item ID
+_ITEM_BY_ID_FIELDS = "items(id,snippet(position,resourceId/videoId))"
+
+
+def _plan_moves(current: List[str], target: List[str]) -> List[Tuple[str, int]]:
+    """
+    Plan the fewest position updates that turn one ordering into another.
+    
+    playlistItems.update inserts the item at the new position and shifts the
+    rest, so every item on a longest subsequence already in target order can
+    stay put; each remaining item is moved, in target order, to just after
+    its target predecessor. Reversing N items therefore takes N - 1 moves.
+    
+    Args:
+        current: Item IDs in their current order
+        target: The same item IDs in the desired order
+    
+    Returns:
+        List of (item_id, new_position) to apply in sequence
+    """
+    n = len(current)
+    
+    # Full reversal: keep the last item, move the others to the end in turn
+    if n > 1 and current == target[::-1]:
+        return [(current[i], n - 1) for i in range(n - 2, -1, -1)]
+    
+    # Work on target ranks (ints) rather than item ID strings
+    rank = {item_id: idx for idx, item_id in enumerate(target)}
+    ranks = [rank[item_id] for item_id in current]
+    
+    # Longest increasing subsequence of target ranks (patience sorting)
+    tails: List[int] = []
+    tail_idx: List[int] = []
+    parent = [-1] * n
+    for i, r in enumerate(ranks):
+        k = bisect.bisect_left(tails, r)
+        if k == len(tails):
+            tails.append(r)
+            tail_idx.append(i)
+        else:
+            tails[k] = r
+            tail_idx[k] = i
+        parent[i] = tail_idx[k - 1] if k else -1
+    
+    keep = [False] * n
+    i = tail_idx[-1] if tail_idx else -1
+    while i != -1:
+        keep[ranks[i]] = True
+        i = parent[i]
+    
+    # Simulate the moves to compute each insert position
+    order = ranks
+    moves = []
+    for r in range(n):
+        if keep[r]:
+            continue
+        order.remove(r)
+        new_position = order.index(r - 1) + 1 if r else 0
+        order.insert(new_position, r)
+        moves.append((target[r], new_position))
+    
+    return moves
+
+
+def _new_update_body(playlist_id: str) -> Dict[str, Any]:
+    """playlistItems.update body for a playlist; per-move fields are filled in by the caller."""
+    return {
+        "id": None,
+        "snippet": {
+            "playlistId": playlist_id,
+            "resourceId": {"kind": "youtube#video", "videoId": None},
+            "position": 0
+        }
+    }
+
 
 class PlaylistReorderer:
     """
@@ -31,21 +114,33 @@ class PlaylistReorderer:
     including moving, swapping, and batch reordering operations.
     """
     
-    def __init__(self, youtube: Resource):
+    def __init__(
+        self,
+        youtube: Resource,
+        meta_cache: Optional[PlaylistMetaCache] = None,
+        items_cache: Optional[PlaylistItemsCache] = None
+    ):
         """
         Initialize PlaylistReorderer.
         
         Args:
             youtube: Authenticated YouTube API resource
+            meta_cache: Playlist metadata cache to share with the other
+                playlist classes (a private one is created if omitted)
+            items_cache: Persistent item listing cache; listings are
+                revalidated by ETag instead of re-downloaded when given
         """
         self.youtube = youtube
+        self._meta_cache = meta_cache or PlaylistMetaCache()
+        self._items_cache = items_cache
         logger.info("PlaylistReorderer initialized")
     
     def move_video(
         self,
         playlist_id: str,
         playlist_item_id: str,
-        new_position: int
+        new_position: int,
+        video_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Move a video to a new position in the playlist.
@@ -54,6 +149,8 @@ class PlaylistReorderer:
             playlist_id: Playlist ID containing the video
             playlist_item_id: ID of the playlist item to move
             new_position: New position (0-based index)
+            video_id: Video ID of the item, if already known. Skips the
+                lookup request (and the already-in-place check).
         
         Returns:
             Dictionary containing:
@@ -80,7 +177,7 @@ class PlaylistReorderer:
             print(f"Moved from position {result['old_position']} to {result['new_position']}")
             ```
         
-        Quota Cost: 50 units
+        Quota Cost: 51 units (50 when video_id is given)
         """
         self._validate_playlist_id(playlist_id)
         
@@ -90,13 +187,17 @@ class PlaylistReorderer:
         if new_position < 0:
             raise ValueError("Position must be non-negative")
         
-        logger.info(f"Moving playlist item {playlist_item_id} to position {new_position}")
+        if video_id:
+            return self._move_video_unchecked(
+                playlist_id, playlist_item_id, video_id, new_position
+            )
         
         # Get current item info
         try:
             item_response = self.youtube.playlistItems().list(
                 part="snippet",
-                id=playlist_item_id
+                id=playlist_item_id,
+                fields=_ITEM_BY_ID_FIELDS
             ).execute()
             
             if not item_response.get("items"):
@@ -108,7 +209,7 @@ class PlaylistReorderer:
             
             # Check if already at target position
             if old_position == new_position:
-                logger.info(f"Item already at position {new_position}")
+                logger.info("Item already at position %s", new_position)
                 return {
                     "playlist_item_id": playlist_item_id,
                     "old_position": old_position,
@@ -117,19 +218,43 @@ class PlaylistReorderer:
                     "moved": False
                 }
             
-            # Update position
-            update_body = {
-                "id": playlist_item_id,
-                "snippet": {
-                    "playlistId": playlist_id,
-                    "resourceId": {
-                        "kind": "youtube#video",
-                        "videoId": video_id
-                    },
-                    "position": new_position
-                }
-            }
-            
+        except HttpError as e:
+            logger.error("Failed to move video: %s", e)
+            raise ValueError(f"Failed to move video: {e}") from e
+        
+        return self._move_video_unchecked(
+            playlist_id, playlist_item_id, video_id, new_position, old_position
+        )
+    
+    def _move_video_unchecked(
+        self,
+        playlist_id: str,
+        playlist_item_id: str,
+        video_id: str,
+        new_position: int,
+        old_position: Optional[int] = None,
+        update_body: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Update an item's position from details the caller already has.
+        
+        No validation or lookup request; old_position is only reported back.
+        Paced by the shared write limiter. Loops can pass the same
+        update_body (from _new_update_body) to every call; the body is
+        serialized when the request is built, so refilling it is safe.
+        """
+        WRITE_LIMITER.acquire()
+        
+        logger.info("Moving playlist item %s to position %s", playlist_item_id, new_position)
+        
+        if update_body is None:
+            update_body = _new_update_body(playlist_id)
+        update_body["id"] = playlist_item_id
+        snippet = update_body["snippet"]
+        snippet["resourceId"]["videoId"] = video_id
+        snippet["position"] = new_position
+        
+        try:
             response = self.youtube.playlistItems().update(
                 part="snippet",
                 body=update_body
@@ -144,14 +269,13 @@ class PlaylistReorderer:
             }
             
             logger.info(
-                f"✅ Video moved: position {old_position} → {result['new_position']}"
+                "✅ Video moved: position %s → %s", old_position, result["new_position"]
             )
             return result
             
         except HttpError as e:
-            error_msg = f"Failed to move video: {str(e)}"
-            logger.error(error_msg)
-            raise ValueError(error_msg) from e
+            logger.error("Failed to move video: %s", e)
+            raise ValueError(f"Failed to move video: {e}") from e
     
     def move_to_top(
         self,
@@ -207,25 +331,21 @@ class PlaylistReorderer:
         
         Quota Cost: 51 units (1 to get count + 50 to move)
         """
-        # Get playlist item count
+        # Get the current item count; a cached count may miss recent additions
         try:
-            playlist_response = self.youtube.playlists().list(
-                part="contentDetails",
-                id=playlist_id
-            ).execute()
+            playlist = self._meta_cache.get_or_fetch(self.youtube, playlist_id, fresh=True)
             
-            if not playlist_response.get("items"):
+            if playlist is None:
                 raise ValueError(f"Playlist not found: {playlist_id}")
             
-            item_count = playlist_response["items"][0]["contentDetails"]["itemCount"]
+            item_count = playlist["contentDetails"]["itemCount"]
             last_position = max(0, item_count - 1)
             
             return self.move_video(playlist_id, playlist_item_id, last_position)
             
         except HttpError as e:
-            error_msg = f"Failed to move video to bottom: {str(e)}"
-            logger.error(error_msg)
-            raise ValueError(error_msg) from e
+            logger.error("Failed to move video to bottom: %s", e)
+            raise ValueError(f"Failed to move video to bottom: {e}") from e
     
     def swap_videos(
         self,
@@ -254,38 +374,48 @@ class PlaylistReorderer:
             )
             ```
         
-        Quota Cost: 102 units (2 units to fetch + 100 to swap)
+        Quota Cost: 51 units for adjacent items, 101 otherwise
+            (1 unit to fetch + 50 per update)
         """
         # Get both items' positions
         try:
             items_response = self.youtube.playlistItems().list(
                 part="snippet",
-                id=f"{item_id_1},{item_id_2}"
+                id=f"{item_id_1},{item_id_2}",
+                fields=_ITEM_BY_ID_FIELDS
             ).execute()
             
             items = items_response.get("items", [])
             if len(items) != 2:
                 raise ValueError("Could not find both playlist items")
             
-            # Extract positions
-            item_1 = items[0]
-            item_2 = items[1]
+            # Extract positions (the API does not preserve request order)
+            by_id = {item["id"]: item for item in items}
+            item_1 = by_id.get(item_id_1, items[0])
+            item_2 = by_id.get(item_id_2, items[1])
             pos_1 = item_1["snippet"]["position"]
             pos_2 = item_2["snippet"]["position"]
             
-            logger.info(f"Swapping items at positions {pos_1} and {pos_2}")
+            logger.info("Swapping items at positions %s and %s", pos_1, pos_2)
             
-            # Perform swaps (order matters - move to higher position first)
+            video_1 = item_1["snippet"]["resourceId"]["videoId"]
+            video_2 = item_2["snippet"]["resourceId"]["videoId"]
+            
+            # Moves insert and shift, so the two writes cannot be issued
+            # together: the later item goes up first, which leaves the
+            # earlier one exactly one slot below its target
             if pos_1 > pos_2:
-                result_1 = self.move_video(playlist_id, item_id_1, pos_2)
-                time.sleep(0.5)  # Rate limiting
-                result_2 = self.move_video(playlist_id, item_id_2, pos_1)
+                result_1 = self._move_video_unchecked(
+                    playlist_id, item_1["id"], video_1, pos_2, pos_1
+                )
+                result_2 = self._swap_partner(playlist_id, item_2["id"], video_2, pos_2, pos_1)
             else:
-                result_2 = self.move_video(playlist_id, item_id_2, pos_1)
-                time.sleep(0.5)  # Rate limiting
-                result_1 = self.move_video(playlist_id, item_id_1, pos_2)
+                result_2 = self._move_video_unchecked(
+                    playlist_id, item_2["id"], video_2, pos_1, pos_2
+                )
+                result_1 = self._swap_partner(playlist_id, item_1["id"], video_1, pos_1, pos_2)
             
-            logger.info(f"✅ Videos swapped successfully")
+            logger.info("✅ Videos swapped successfully")
             return {
                 "item_1": result_1,
                 "item_2": result_2,
@@ -293,13 +423,39 @@ class PlaylistReorderer:
             }
             
         except HttpError as e:
-            error_msg = f"Failed to swap videos: {str(e)}"
-            logger.error(error_msg)
-            raise ValueError(error_msg) from e
+            logger.error("Failed to swap videos: %s", e)
+            raise ValueError(f"Failed to swap videos: {e}") from e
+    
+    def _swap_partner(
+        self,
+        playlist_id: str,
+        item_id: str,
+        video_id: str,
+        old_position: int,
+        new_position: int
+    ) -> Dict[str, Any]:
+        """
+        Finish a swap by moving the item that was shifted down.
+        
+        When the two items were adjacent the first move already put this
+        item in place, so no write is issued.
+        """
+        if new_position - old_position == 1:
+            return {
+                "playlist_item_id": item_id,
+                "old_position": old_position,
+                "new_position": new_position,
+                "video_id": video_id,
+                "moved": True
+            }
+        return self._move_video_unchecked(
+            playlist_id, item_id, video_id, new_position, old_position
+        )
     
     def reverse_playlist(
         self,
-        playlist_id: str
+        playlist_id: str,
+        strategy: str = "minimal"
     ) -> Dict[str, Any]:
         """
         Reverse the order of all videos in a playlist.
@@ -308,6 +464,8 @@ class PlaylistReorderer:
         
         Args:
             playlist_id: Playlist ID to reverse
+            strategy: "minimal" to skip items that can keep their place, or
+                "naive" to move every item in turn (kept for comparison)
         
         Returns:
             Dictionary containing:
@@ -322,82 +480,198 @@ class PlaylistReorderer:
             print(f"Reversed {result['reversed']} videos")
             ```
         
-        Quota Cost: 1 unit (fetch) + 50 units per video
-        """
-        logger.info(f"Reversing playlist: {playlist_id}")
+        With the "minimal" strategy, items that can keep their place are not
+        touched, so a full reversal costs one update fewer than the item count.
         
-        # Get all items in current order
-        items = self._get_all_playlist_items(playlist_id)
+        Quota Cost: 1 unit (fetch) + 50 units per moved video
+        """
+        items, moves = self._plan_reverse(playlist_id, strategy)
         total = len(items)
         
         if total == 0:
-            return {
-                "total_items": 0,
-                "reversed": 0,
-                "failed": 0,
-                "message": "Playlist is empty"
-            }
+            return self._empty_reverse_result()
+        
+        # Items left in place count as reversed
+        reversed_count = total - len(moves)
+        failed_count = 0
+        
+        update_body = _new_update_body(playlist_id)
+        
+        for item_id, video_id, new_position in moves:
+            try:
+                self._move_video_unchecked(
+                    playlist_id, item_id, video_id, new_position,
+                    update_body=update_body
+                )
+                reversed_count += 1
+                
+            except Exception as e:
+                logger.error("Failed to move item %s: %s", item_id, e)
+                failed_count += 1
+        
+        return self._reverse_result(total, reversed_count, failed_count)
+    
+    async def reverse_playlist_async(
+        self,
+        playlist_id: str,
+        strategy: str = "minimal"
+    ) -> Dict[str, Any]:
+        """
+        Reverse a playlist without blocking the event loop.
+        
+        Same moves and result as reverse_playlist(). Each move depends on
+        the positions left by the previous one, so they still run one at
+        a time; the blocking API calls (and any rate-limit wait) run in a
+        worker thread.
+        
+        Args:
+            playlist_id: Playlist ID to reverse
+            strategy: "minimal" or "naive", as for reverse_playlist()
+        
+        Returns:
+            Same structure as reverse_playlist()
+        
+        Quota Cost: 1 unit (fetch) + 50 units per moved video
+        """
+        items, moves = await asyncio.to_thread(self._plan_reverse, playlist_id, strategy)
+        total = len(items)
         
-        logger.info(f"Found {total} items to reverse")
+        if total == 0:
+            return self._empty_reverse_result()
         
-        # Reverse order
-        reversed_count = 0
+        reversed_count = total - len(moves)
         failed_count = 0
         
-        for idx, item in enumerate(reversed(items)):
+        update_body = _new_update_body(playlist_id)
+        
+        for item_id, video_id, new_position in moves:
             try:
-                self.move_video(
-                    playlist_id=playlist_id,
-                    playlist_item_id=item["id"],
-                    new_position=idx
+                await asyncio.to_thread(
+                    self._move_video_unchecked,
+                    playlist_id, item_id, video_id, new_position,
+                    update_body=update_body
                 )
                 reversed_count += 1
                 
-                # Rate limiting
-                if idx < total - 1:
-                    time.sleep(0.5)
-                    
             except Exception as e:
-                logger.error(f"Failed to move item {item['id']}: {e}")
+                logger.error("Failed to move item %s: %s", item_id, e)
                 failed_count += 1
         
-        result = {
+        return self._reverse_result(total, reversed_count, failed_count)
+    
+    def _plan_reverse(
+        self,
+        playlist_id: str,
+        strategy: str
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str, int]]]:
+        """Fetch a playlist and plan its reversal as (item_id, video_id, position) moves."""
+        if strategy not in _REVERSE_STRATEGIES:
+            raise ValueError(
+                f"Invalid strategy: {strategy}. "
+                f"Must be one of: {', '.join(_REVERSE_STRATEGIES)}"
+            )
+        
+        logger.info("Reversing playlist: %s", playlist_id)
+        
+        # Get all items in current order
+        items = self._get_all_playlist_items(playlist_id)
+        if not items:
+            return items, []
+        
+        logger.info("Found %d items to reverse", len(items))
+        
+        current_ids = [item["id"] for item in items]
+        video_ids = {
+            item["id"]: item["snippet"]["resourceId"]["videoId"] for item in items
+        }
+        if strategy == "naive":
+            moves = [(item_id, idx) for idx, item_id in enumerate(reversed(current_ids))]
+        else:
+            moves = _plan_moves(current_ids, current_ids[::-1])
+        
+        return items, [
+            (item_id, video_ids[item_id], new_position)
+            for item_id, new_position in moves
+        ]
+    
+    @staticmethod
+    def _empty_reverse_result() -> Dict[str, Any]:
+        return {
+            "total_items": 0,
+            "reversed": 0,
+            "failed": 0,
+            "message": "Playlist is empty"
+        }
+    
+    @staticmethod
+    def _reverse_result(total: int, reversed_count: int, failed_count: int) -> Dict[str, Any]:
+        logger.info(
+            "✅ Playlist reversed: %d/%d successful, %d failed",
+            reversed_count, total, failed_count
+        )
+        return {
             "total_items": total,
             "reversed": reversed_count,
             "failed": failed_count
         }
-        
-        logger.info(
-            f"✅ Playlist reversed: {reversed_count}/{total} successful, "
-            f"{failed_count} failed"
-        )
-        
-        return result
     
     def _get_all_playlist_items(self, playlist_id: str) -> List[Dict[str, Any]]:
-        """Get all items from a playlist."""
-        items = []
+        """
+        Get all items from a playlist.
+        
+        Only id, snippet.position and snippet.resourceId.videoId are
+        returned; the rest of the snippet is masked out server-side.
+        With an items cache, each page is requested with If-None-Match
+        and the stored page is reused when the server answers 304.
+        """
+        cached_pages = self._items_cache.get(playlist_id) if self._items_cache else None
+        pages = []
         next_page_token = None
         
         try:
             while True:
-                response = self.youtube.playlistItems().list(
+                request = self.youtube.playlistItems().list(
                     part="snippet",
                     playlistId=playlist_id,
                     maxResults=50,
-                    pageToken=next_page_token
-                ).execute()
+                    pageToken=next_page_token,
+                    fields=_ITEM_FIELDS
+                )
                 
-                items.extend(response.get("items", []))
+                cached = None
+                if cached_pages and len(pages) < len(cached_pages):
+                    candidate = cached_pages[len(pages)]
+                    if candidate.get("pageToken") == next_page_token and candidate.get("etag"):
+                        cached = candidate
+                        request.headers["If-None-Match"] = cached["etag"]
                 
-                next_page_token = response.get("nextPageToken")
+                try:
+                    response = request.execute()
+                    page = {
+                        "pageToken": next_page_token,
+                        "etag": response.get("etag"),
+                        "nextPageToken": response.get("nextPageToken"),
+                        "items": response.get("items", []),
+                    }
+                except HttpError as e:
+                    if cached is None or e.resp.status != 304:
+                        raise
+                    logger.debug("Playlist page not modified: %s", playlist_id)
+                    page = cached
+                
+                pages.append(page)
+                
+                next_page_token = page["nextPageToken"]
                 if not next_page_token:
                     break
             
-            return items
+            if self._items_cache and pages != cached_pages:
+                self._items_cache.put(playlist_id, pages)
+            
+            return [item for page in pages for item in page["items"]]
             
         except HttpError as e:
-            logger.error(f"Failed to get playlist items: {e}")
+            logger.error("Failed to get playlist items: %s", e)
             raise
     
     def _validate_playlist_id(self, playlist_id: str) -> None:
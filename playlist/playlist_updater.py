@@ -19,6 +19,9 @@ from googleapiclient.discovery import Resource
 from googleapiclient.errors import HttpError
 import logging
 
+from .playlist_cache import PlaylistMetaCache
+from .playlist_creator import _VALID_PRIVACY, _VALID_PRIVACY_MSG
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,14 +33,17 @@ class PlaylistUpdater:
     preserving unchanged fields.
     """
     
-    def __init__(self, youtube: Resource):
+    def __init__(self, youtube: Resource, meta_cache: Optional[PlaylistMetaCache] = None):
         """
         Initialize PlaylistUpdater.
         
         Args:
             youtube: Authenticated YouTube API resource
+            meta_cache: Playlist metadata cache to share with the other
+                playlist classes (a private one is created if omitted)
         """
         self.youtube = youtube
+        self._meta_cache = meta_cache or PlaylistMetaCache()
         logger.info("PlaylistUpdater initialized")
     
     def update_playlist(
@@ -90,25 +96,21 @@ class PlaylistUpdater:
             print(f"Updated fields: {result['changes_made']}")
             ```
         
-        Quota Cost: 50 units
+        Quota Cost: 51 units (1 to read current values + 50 to write; 1 if nothing changed)
         """
         if not playlist_id or not playlist_id.strip():
             raise ValueError("Playlist ID cannot be empty")
         
-        # Get current playlist data
+        # Get current playlist data; the update sends back every field, so it
+        # is built from a fresh read rather than a possibly stale cached copy
         try:
-            current = self.youtube.playlists().list(
-                part="snippet,status",
-                id=playlist_id
-            ).execute()
+            current_data = self._meta_cache.get_or_fetch(self.youtube, playlist_id, fresh=True)
             
-            if not current.get("items"):
+            if current_data is None:
                 raise ValueError(f"Playlist not found: {playlist_id}")
             
-            current_data = current["items"][0]
-            
         except HttpError as e:
-            logger.error(f"Failed to fetch playlist: {str(e)}")
+            logger.error("Failed to fetch playlist: %s", e)
             raise
         
         # Track changes
@@ -126,37 +128,48 @@ class PlaylistUpdater:
             }
         }
         
+        snippet = current_data["snippet"]
+        
+        # Apply provided fields; only differences from the live playlist count
+        # as changes, so a request that matches the current values costs no write
+        
         # Update title if provided
         if title is not None:
             self._validate_title(title)
             update_body["snippet"]["title"] = title.strip()
-            changes_made.append("title")
+            if title.strip() != snippet["title"]:
+                changes_made.append("title")
         
         # Update description if provided
         if description is not None:
             self._validate_description(description)
             update_body["snippet"]["description"] = description.strip()
-            changes_made.append("description")
+            if description.strip() != snippet.get("description", ""):
+                changes_made.append("description")
         
         # Update tags if provided
         if tags is not None:
-            update_body["snippet"]["tags"] = [tag.strip() for tag in tags if tag.strip()]
-            changes_made.append("tags")
+            clean_tags = [tag.strip() for tag in tags if tag.strip()]
+            update_body["snippet"]["tags"] = clean_tags
+            if sorted(clean_tags) != sorted(snippet.get("tags", [])):
+                changes_made.append("tags")
         
         # Update default language if provided
         if default_language is not None:
             update_body["snippet"]["defaultLanguage"] = default_language
-            changes_made.append("default_language")
+            if default_language != snippet.get("defaultLanguage"):
+                changes_made.append("default_language")
         
         # Update privacy status if provided
         if privacy_status is not None:
             self._validate_privacy_status(privacy_status)
             update_body["status"]["privacyStatus"] = privacy_status
-            changes_made.append("privacy_status")
+            if privacy_status != current_data["status"]["privacyStatus"]:
+                changes_made.append("privacy_status")
         
         # If no changes, return current data
         if not changes_made:
-            logger.warning(f"No changes specified for playlist: {playlist_id}")
+            logger.info("No changes to apply for playlist: %s", playlist_id)
             return {
                 "id": playlist_id,
                 "title": current_data["snippet"]["title"],
@@ -167,7 +180,7 @@ class PlaylistUpdater:
                 "changes_made": []
             }
         
-        logger.info(f"Updating playlist {playlist_id}: {', '.join(changes_made)}")
+        logger.info("Updating playlist %s: %s", playlist_id, ", ".join(changes_made))
         
         # Perform update
         try:
@@ -175,6 +188,13 @@ class PlaylistUpdater:
                 part="snippet,status",
                 body=update_body
             ).execute()
+            # The write returns snippet and status; keep the rest of the
+            # cached resource so a follow-up info read needs no fetch
+            self._meta_cache.put(playlist_id, {
+                **current_data,
+                "snippet": response["snippet"],
+                "status": response["status"],
+            })
             
             result = {
                 "id": response["id"],
@@ -187,11 +207,11 @@ class PlaylistUpdater:
                 "tags": response["snippet"].get("tags", [])
             }
             
-            logger.info(f"✅ Playlist updated successfully: {playlist_id}")
+            logger.info("✅ Playlist updated successfully: %s", playlist_id)
             return result
             
         except HttpError as e:
-            logger.error(f"Failed to update playlist: {str(e)}")
+            logger.error("Failed to update playlist: %s", e)
             raise
     
     def _validate_title(self, title: str) -> None:
@@ -209,11 +229,10 @@ class PlaylistUpdater:
     
     def _validate_privacy_status(self, privacy_status: str) -> None:
         """Validate privacy status."""
-        valid_statuses = {"public", "private", "unlisted"}
-        if privacy_status not in valid_statuses:
+        if privacy_status not in _VALID_PRIVACY:
             raise ValueError(
                 f"Invalid privacy status: {privacy_status}. "
-                f"Must be one of: {', '.join(valid_statuses)}"
+                f"Must be one of: {_VALID_PRIVACY_MSG}"
             )
     
     def get_playlist_info(self, playlist_id: str) -> Dict[str, Any]:
@@ -238,22 +257,17 @@ class PlaylistUpdater:
             print(f"Privacy: {info['privacy_status']}")
             ```
         
-        Quota Cost: 1 unit
+        Quota Cost: 1 unit (0 when cached)
         """
         if not playlist_id or not playlist_id.strip():
             raise ValueError("Playlist ID cannot be empty")
         
         try:
-            response = self.youtube.playlists().list(
-                part="snippet,status,contentDetails",
-                id=playlist_id
-            ).execute()
+            item = self._meta_cache.get_or_fetch(self.youtube, playlist_id)
             
-            if not response.get("items"):
+            if item is None:
                 raise ValueError(f"Playlist not found: {playlist_id}")
             
-            item = response["items"][0]
-            
             return {
                 "id": item["id"],
                 "title": item["snippet"]["title"],
@@ -269,5 +283,5 @@ class PlaylistUpdater:
             }
             
         except HttpError as e:
-            logger.error(f"Failed to get playlist info: {str(e)}")
+            logger.error("Failed to get playlist info: %s", e)
             raise
@@ -0,0 +1,69 @@
+"""
+YouTube MCP Server - Token Bucket
+================================
+
+Client-side pacing for playlist write requests.
+
+Features:
+- Sustained rate with a burst allowance
+- Waits only when the bucket is empty, so slow requests add no delay
+- Safe to share between threads
+
+Part of Phase 2.3: Playlist Management
+"""
+
+from threading import Lock
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at rate_per_sec up to burst. Taking a token
+    from an empty bucket reserves the next one, so concurrent callers are
+    served in order rather than racing for the refill.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int):
+        """
+        Initialize TokenBucket.
+
+        Args:
+            rate_per_sec: Sustained tokens per second
+            burst: Maximum tokens available at once
+        """
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated) * self.rate_per_sec
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_sec
+
+    def acquire(self) -> None:
+        """Take a token, blocking until one is available."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Paces playlist writes across all playlist classes (they share one project quota)
+WRITE_LIMITER = TokenBucket(rate_per_sec=5, burst=10)
@@ -21,15 +21,34 @@ Provides tools for:
 """
 
 import os
+import sys
+import asyncio
 import logging
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
+from threading import Lock, local
 from typing import Optional, Dict, Any, List
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from cachetools import TTLCache
+from tenacity import retry, stop_after_attempt, wait_random_exponential, retry_if_exception
 
 from fastmcp import FastMCP
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+import requests
+
+# Lower-level fetcher that accepts our own session (youtube-transcript-api < 1.0)
+try:
+    from youtube_transcript_api._transcripts import TranscriptListFetcher
+except ImportError:
+    TranscriptListFetcher = None
 from googleapiclient.errors import HttpError
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import YouTube client manager
 from youtube_client import YouTubeClient
 
@@ -47,8 +66,18 @@ from utils import (
     sanitize_text,
     ValidationError,
     cache_stats,
-    get_rate_stats
+    cache_manager,
+    set_cached,
+    get_negative,
+    set_negative,
+    get_rate_stats,
+    get_quota_stats,
+    spend_quota,
+    BatchScheduler,
+    PagePrefetcher,
+    singleflight
 )
+from utils.batch_scheduler import MAX_IDS_PER_REQUEST
 
 # Import security utilities
 from utils.security import (
@@ -62,14 +91,6 @@ from utils.security import (
     SecurityLogger
 )
 
-# Import OAuth 2.1 metadata utilities
-from utils.oauth_metadata import (
-    OAuthMetadataProvider,
-    BearerTokenValidator,
-    OAuthMiddleware,
-    create_oauth_config
-)
-
 # Import Prometheus and Health Check utilities
 from utils.prometheus_exporter import (
     PrometheusExporter,
@@ -87,19 +108,8 @@ from utils.health_check import (
     get_liveness
 )
 
-# Import Playlist Management modules
-from playlist import (
-    PlaylistCreator,
-    PlaylistManager,
-    PlaylistUpdater,
-    PlaylistReorderer
-)
-
-# Import Captions Management modules
-from captions import (
-    CaptionsManager,
-    CaptionsAnalyzer
-)
+# Playlist and captions modules are imported on first use (see the
+# factories below), so sessions that never touch them skip the cost
 
 # Load environment variables
 load_dotenv()
@@ -111,8 +121,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _serialize_tool_result(data: Any) -> str:
+    """Serialize a tool result with orjson (unknown types fall back to str)"""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Initialize MCP server
-mcp = FastMCP("YouTube MCP Server Enhanced")
+# Tool results are serialized with orjson when installed (FastMCP default otherwise)
+mcp = FastMCP(
+    "YouTube MCP Server Enhanced",
+    tool_serializer=_serialize_tool_result if orjson else None
+)
 
 # Initialize IP Rate Limiter (enabled for HTTP mode)
 ip_limiter = IPRateLimiter(
@@ -164,6 +183,8 @@ logger.info("✅ Health Checker initialized")
 # Initialize OAuth 2.1 Metadata Provider (for HTTP mode)
 oauth_provider = None
 if config.server.transport == "http":
+    from utils.oauth_metadata import OAuthMetadataProvider
+    
     server_url = f"http://{config.server.host}:{config.server.port}"
     oauth_provider = OAuthMetadataProvider(
         resource_uri=server_url,
@@ -208,24 +229,66 @@ try:
     else:
         logger.info("ℹ️  Using API key only - write operations disabled")
     
-    # Initialize Playlist Management modules
-    # These will use OAuth2 client when needed
-    playlist_creator = PlaylistCreator(youtube)
-    playlist_manager = PlaylistManager(youtube)
-    playlist_updater = PlaylistUpdater(youtube)
-    playlist_reorderer = PlaylistReorderer(youtube)
-    logger.info("Playlist management modules initialized successfully")
-    
-    # Initialize Captions Management modules
-    captions_manager = CaptionsManager(youtube)
-    captions_analyzer = CaptionsAnalyzer()
-    logger.info("Captions management modules initialized successfully")
-    
 except Exception as e:
     logger.error(f"Failed to initialize YouTube API client: {e}")
     raise
 
 
+# Playlist and captions modules are created on first use
+# (they use the OAuth2 client when needed)
+
+@lru_cache(maxsize=None)
+def _playlist_meta_cache():
+    """One metadata cache so reads/writes across playlist modules stay consistent"""
+    from playlist import PlaylistMetaCache
+    return PlaylistMetaCache()
+
+
+@lru_cache(maxsize=None)
+def _playlist_items_cache():
+    """Persistent playlist item listings (None when caching is disabled)"""
+    from playlist import PlaylistItemsCache
+    if not config.cache.enabled:
+        return None
+    return PlaylistItemsCache(os.path.join(config.cache.cache_dir, "playlist_items.sqlite3"))
+
+
+@lru_cache(maxsize=None)
+def _playlist_creator():
+    from playlist import PlaylistCreator
+    return PlaylistCreator(youtube, _playlist_meta_cache())
+
+
+@lru_cache(maxsize=None)
+def _playlist_manager():
+    from playlist import PlaylistManager
+    return PlaylistManager(youtube, _playlist_meta_cache())
+
+
+@lru_cache(maxsize=None)
+def _playlist_updater():
+    from playlist import PlaylistUpdater
+    return PlaylistUpdater(youtube, _playlist_meta_cache())
+
+
+@lru_cache(maxsize=None)
+def _playlist_reorderer():
+    from playlist import PlaylistReorderer
+    return PlaylistReorderer(youtube, _playlist_meta_cache(), _playlist_items_cache())
+
+
+@lru_cache(maxsize=None)
+def _captions_manager():
+    from captions import CaptionsManager
+    return CaptionsManager(youtube)
+
+
+@lru_cache(maxsize=None)
+def _captions_analyzer():
+    from captions import CaptionsAnalyzer
+    return CaptionsAnalyzer()
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -286,48 +349,570 @@ def validate_request_security(
     return True, None
 
 
+# Resolved @handle -> channel ID; handles rarely change, so a long TTL is safe.
+# Kept in process and in the persistent cache, so restarts do not re-resolve.
+CHANNEL_HANDLE_TTL = 86400
+_channel_handle_cache: TTLCache = TTLCache(maxsize=1024, ttl=CHANNEL_HANDLE_TTL)
+_channel_handle_lock = Lock()
+
+
+def _cached_channel_handle(username: str) -> Optional[str]:
+    """Get the channel ID of a handle resolved earlier, if any"""
+    key = username.lower()
+    with _channel_handle_lock:
+        channel_id = _channel_handle_cache.get(key)
+    if channel_id:
+        return channel_id
+    
+    channel_id = cache_manager.get(cache_manager._generate_key("resolve_channel_handle", key))
+    if channel_id:
+        with _channel_handle_lock:
+            _channel_handle_cache[key] = channel_id
+    return channel_id
+
+
+def _remember_channel_handle(username: str, channel_id: str) -> None:
+    """Store a resolved handle in process and in the persistent cache"""
+    key = username.lower()
+    with _channel_handle_lock:
+        _channel_handle_cache[key] = channel_id
+    set_cached(
+        cache_manager._generate_key("resolve_channel_handle", key), channel_id,
+        ttl=CHANNEL_HANDLE_TTL
+    )
+
+
+def _channel_handle(validated_id: str) -> Optional[str]:
+    """Handle (without @) of a validate_channel_id result, or None for a channel ID"""
+    if validated_id.startswith('@') or '/@' in validated_id:
+        return validated_id.lstrip('@').split('/@')[-1]
+    return None
+
+
+def _canonical_channel_id(channel_id: str) -> str:
+    """
+    validate_channel_id, with handles resolved earlier replaced by their ID
+    Used as the get_channel_info cache key, so @handle and UC... share an entry
+    """
+    validated_id = validate_channel_id(channel_id)
+    username = _channel_handle(validated_id)
+    if username:
+        return _cached_channel_handle(username) or validated_id
+    return validated_id
+
+
+@singleflight(key=lambda username: username.lower())
 def resolve_channel_handle(username: str) -> Optional[str]:
     """
     Resolve @username to channel ID via API
-    Uses caching and rate limiting
+    Successful lookups are cached for 24 hours (handles are case-insensitive)
     """
+    channel_id = _cached_channel_handle(username)
+    if channel_id:
+        return channel_id
+    
     try:
         response = youtube.channels().list(
             part='id',
-            forHandle=username
+            forHandle=username,
+            fields='items/id'
         ).execute()
         
         if response.get('items'):
-            return response['items'][0]['id']
+            channel_id = response['items'][0]['id']
+            _remember_channel_handle(username, channel_id)
+            return channel_id
     except HttpError as e:
-        logger.warning(f"Failed to resolve channel handle {username}: {e}")
+        logger.warning("Failed to resolve channel handle %s: %s", username, e)
     
     return None
 
 
+# Partial-response masks: only the fields the tools below actually read
+_VIDEO_FIELDS = (
+    "etag,items(id,snippet(title,description,channelId,channelTitle,publishedAt,"
+    "tags,thumbnails,categoryId,defaultLanguage,liveBroadcastContent),contentDetails/duration,"
+    "statistics(viewCount,likeCount,commentCount))"
+)
+_CHANNEL_FIELDS = (
+    "etag,items(id,snippet(title,description,customUrl,publishedAt,thumbnails,country),"
+    "statistics(subscriberCount,videoCount,viewCount,hiddenSubscriberCount))"
+)
+_COMMENT_FIELDS = (
+    "etag,nextPageToken,items(id,snippet(totalReplyCount,topLevelComment/snippet("
+    "authorDisplayName,textDisplay,likeCount,publishedAt,updatedAt)),"
+    "replies/comments(id,snippet(authorDisplayName,textDisplay,likeCount,publishedAt)))"
+)
+_REPLY_FIELDS = "items(id,snippet(authorDisplayName,textDisplay,likeCount,publishedAt))"
+_SEARCH_FIELDS = (
+    "items(id/videoId,snippet(title,description,channelId,channelTitle,"
+    "publishedAt,thumbnails))"
+)
+_PLAYLIST_LIST_FIELDS = (
+    "etag,items(id,snippet(title,description,publishedAt,thumbnails),"
+    "contentDetails/itemCount,status/privacyStatus)"
+)
+
+
+# Last response per list request, revalidated with If-None-Match once the
+# tool-level cache has expired; kept much longer than that cache
+_etag_responses: TTLCache = TTLCache(maxsize=2048, ttl=86400)
+# Comment pages are much larger, so fewer of them are kept
+_etag_comment_pages: TTLCache = TTLCache(maxsize=256, ttl=86400)
+_etag_lock = Lock()
+
+# Failures worth retrying; others (e.g. 403 quotaExceeded) cannot succeed
+_TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Whether a failed API request may succeed when retried"""
+    return isinstance(error, HttpError) and error.resp.status in _TRANSIENT_STATUSES
+
+
+# 3 attempts with jittered exponential backoff, so clients recovering from
+# the same outage do not retry in lockstep
+_retry_transient = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_random_exponential(multiplier=1, max=10),
+    retry=retry_if_exception(_is_transient),
+    reraise=True
+)
+
+
+@_retry_transient
+def _execute(request) -> Dict[str, Any]:
+    """Execute an API request, retrying transient failures"""
+    return request.execute()
+
+
+@_retry_transient
+def _execute_conditional(request, key: str, store: TTLCache = _etag_responses) -> Dict[str, Any]:
+    """
+    Execute a list request, reusing the stored response on 304 Not Modified
+    Transient failures are retried like _execute's
+    """
+    with _etag_lock:
+        stored = store.get(key)
+    if stored:
+        request.headers['If-None-Match'] = stored[0]
+    
+    try:
+        response = request.execute()
+    except HttpError as e:
+        if stored and e.resp.status == 304:
+            logger.debug("Not modified: %s", key)
+            # Still current, so keep it for another full TTL
+            with _etag_lock:
+                store[key] = stored
+            return stored[1]
+        raise
+    
+    if response.get('etag'):
+        with _etag_lock:
+            store[key] = (response['etag'], response)
+    return response
+
+
+def _fetch_videos(video_ids: List[str]) -> Dict[str, Any]:
+    """Fetch up to 50 videos in one videos.list call, keyed by ID"""
+    ids = ','.join(video_ids)
+    response = _execute_conditional(
+        youtube.videos().list(
+            part='snippet,contentDetails,statistics',
+            id=ids,
+            fields=_VIDEO_FIELDS
+        ),
+        f"videos:{ids}"
+    )
+    return {item['id']: item for item in response.get('items', [])}
+
+
+def _fetch_channels(channel_ids: List[str]) -> Dict[str, Any]:
+    """Fetch up to 50 channels in one channels.list call, keyed by ID"""
+    ids = ','.join(channel_ids)
+    response = _execute_conditional(
+        youtube.channels().list(
+            part='snippet,statistics',
+            id=ids,
+            fields=_CHANNEL_FIELDS
+        ),
+        f"channels:{ids}"
+    )
+    return {item['id']: item for item in response.get('items', [])}
+
+
+@singleflight(key=lambda username: username.lower())
+def _fetch_channel_by_handle(username: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a channel by @handle in one channels.list call
+    The resolved channel ID is remembered like resolve_channel_handle's
+    """
+    response = _execute(youtube.channels().list(
+        part='snippet,statistics',
+        forHandle=username,
+        fields=_CHANNEL_FIELDS
+    ))
+    
+    items = response.get('items')
+    if not items:
+        return None
+    _remember_channel_handle(username, items[0]['id'])
+    return items[0]
+
+
+# Concurrent info lookups are coalesced into one list call (1 quota unit)
+video_batcher = BatchScheduler(_fetch_videos)
+channel_batcher = BatchScheduler(_fetch_channels)
+
+
+def _compact_segments(segments: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Transpose transcript segments into parallel texts/starts/durations lists"""
+    return {
+        "texts": [segment['text'] for segment in segments],
+        "starts": [segment['start'] for segment in segments],
+        "durations": [segment['duration'] for segment in segments]
+    }
+
+
+# One keep-alive session per worker thread (requests.Session is not thread-safe)
+_transcript_http = local()
+
+
+def _list_transcripts(video_id: str):
+    """
+    List a video's transcripts over a reused keep-alive session
+    
+    YouTubeTranscriptApi.list_transcripts opens and closes a session per
+    call, so both the watch page and the caption fetch paid a new TLS
+    handshake every time.
+    """
+    if TranscriptListFetcher is None:
+        return YouTubeTranscriptApi.list_transcripts(video_id)
+    
+    session = getattr(_transcript_http, 'session', None)
+    if session is None:
+        session = _transcript_http.session = requests.Session()
+    return TranscriptListFetcher(session).fetch(video_id)
+
+
+# commentThreads.list failures that will not change on retry
+_PERMANENT_COMMENT_ERRORS = frozenset({"commentsDisabled", "videoNotFound"})
+
+
+def _http_error_reasons(error: HttpError) -> set:
+    """Structured reasons HttpError parsed from the response body"""
+    details = getattr(error, "error_details", None)
+    if not isinstance(details, list):
+        return set()
+    return {detail.get("reason") for detail in details if isinstance(detail, dict)}
+
+
+def _fetch_comment_page(video_id: str, page_token: Optional[str], max_results: int) -> Dict[str, Any]:
+    """Fetch one page of comment threads (replies are embedded)"""
+    return _execute_conditional(
+        youtube.commentThreads().list(
+            part='snippet,replies',
+            videoId=video_id,
+            maxResults=max_results,
+            pageToken=page_token,
+            textFormat='plainText',
+            order='relevance',
+            fields=_COMMENT_FIELDS
+        ),
+        f"comments:{video_id}:{page_token}:{max_results}",
+        _etag_comment_pages
+    )
+
+
+# Required snippet fields, read with one call per resource
+_VIDEO_SNIPPET_FIELDS = itemgetter('title', 'channelId', 'channelTitle', 'publishedAt', 'categoryId')
+_CHANNEL_SNIPPET_FIELDS = itemgetter('title', 'publishedAt')
+
+
+def _format_video(video_id: str, video: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the get_video_info result for one videos.list item"""
+    snippet = video['snippet']
+    statistics = video.get('statistics', {})
+    title, channel_id, channel_title, publish_date, category_id = _VIDEO_SNIPPET_FIELDS(snippet)
+    
+    return {
+        "success": True,
+        "video_id": video_id,
+        "title": sanitize_text(title, 500),
+        "description": sanitize_text(snippet.get('description', ''), 5000),
+        "channel_id": channel_id,
+        "channel_title": sanitize_text(channel_title, 200),
+        "publish_date": publish_date,
+        "duration": video['contentDetails']['duration'],
+        "view_count": int(statistics.get('viewCount', 0)),
+        "like_count": int(statistics.get('likeCount', 0)),
+        "comment_count": int(statistics.get('commentCount', 0)),
+        "tags": snippet.get('tags', [])[:20],  # Limit to 20 tags
+        "thumbnails": snippet.get('thumbnails', {}),
+        "category_id": category_id,
+        "default_language": snippet.get('defaultLanguage'),
+        "live_broadcast_content": snippet.get('liveBroadcastContent', 'none'),
+        "cached": False
+    }
+
+
+def _video_age(video_info: Dict[str, Any]) -> Optional[float]:
+    """Seconds since a get_video_info result's video was published"""
+    try:
+        published = datetime.fromisoformat(video_info["publish_date"].replace("Z", "+00:00"))
+    except (KeyError, AttributeError, ValueError):
+        return None
+    return (datetime.now(timezone.utc) - published).total_seconds()
+
+
+def _video_info_ttl(result: Dict[str, Any]) -> int:
+    """
+    Cache TTL for a get_video_info result
+    
+    Live and upcoming streams change by the minute; otherwise statistics
+    settle as a video ages, so the TTL grows with age (30 min to 7 days).
+    """
+    if result.get("live_broadcast_content", "none") != "none":
+        return 60
+    age = _video_age(result)
+    if age is None:
+        return 1800
+    return int(min(7 * 86400, max(1800, age / 100)))
+
+
+def _transcript_ttl(result: Dict[str, Any]) -> int:
+    """
+    Cache TTL for a get_video_transcript result
+    
+    Captions of videos older than a year rarely change and are kept for 30
+    days. The age comes from a cached get_video_info result, if any.
+    """
+    info = cache_manager.get(cache_manager._generate_key("get_video_info", result.get("video_id")))
+    if info:
+        age = _video_age(info)
+        if age is not None and age > 365 * 86400:
+            return 30 * 86400
+    return 3600
+
+
+def _prime_video_info(video_id: str, result: Dict[str, Any]) -> None:
+    """Store a _format_video result so get_video_info(video_id) is a cache hit"""
+    ttl = _video_info_ttl(result)
+    set_cached(
+        cache_manager._generate_key("get_video_info", video_id), result,
+        ttl=ttl, stale_ttl=ttl * 2
+    )
+
+
+# Warm-up tasks are referenced until done so they are not garbage collected
+_background_tasks = set()
+
+
+async def _warm_video_info(video_ids: List[str]) -> None:
+    """Fetch and prime get_video_info results for videos not cached yet"""
+    missing = [
+        video_id for video_id in video_ids
+        if cache_manager.get(cache_manager._generate_key("get_video_info", video_id)) is None
+    ]
+    if not missing:
+        return
+    
+    # No tool call pays for the warm-up: charge 1 unit per videos.list
+    # batch, and skip it when the budget is short
+    if not spend_quota(-(-len(missing) // MAX_IDS_PER_REQUEST)):
+        logger.debug("Skipping video info warm-up: quota budget is low")
+        return
+    
+    try:
+        items = await asyncio.gather(*(video_batcher.get(video_id) for video_id in missing))
+    except HttpError as e:
+        logger.warning("Failed to warm video info cache: %s", e)
+        return
+    
+    for video_id, item in zip(missing, items):
+        if item is not None:
+            _prime_video_info(video_id, _format_video(video_id, item))
+
+
+# Author names and channel fields repeat heavily within one response, so
+# they are interned to share a single string object per distinct value
+
+def _format_reply(reply: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the tool output for one comment reply"""
+    snippet = reply['snippet']
+    return {
+        "id": reply['id'],
+        "author": sys.intern(sanitize_text(snippet['authorDisplayName'], 100)),
+        "text": sanitize_text(snippet['textDisplay'], 10000),
+        "like_count": snippet['likeCount'],
+        "published_at": snippet['publishedAt']
+    }
+
+
+def _format_comment_thread(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the tool output for one comment thread, without replies"""
+    thread = item['snippet']
+    top_comment = thread['topLevelComment']['snippet']
+    return {
+        "id": item['id'],
+        "author": sys.intern(sanitize_text(top_comment['authorDisplayName'], 100)),
+        "text": sanitize_text(top_comment['textDisplay'], 10000),
+        "like_count": top_comment['likeCount'],
+        "published_at": top_comment['publishedAt'],
+        "updated_at": top_comment['updatedAt'],
+        "reply_count": thread['totalReplyCount'],
+        "replies": []
+    }
+
+
+# Replies returned per comment thread
+MAX_REPLIES_PER_THREAD = 10
+
+# Threads whose missing replies are fetched per get_video_comments call
+# (1 quota unit each); the rest keep their embedded replies
+MAX_REPLY_FETCHES_PER_CALL = 10
+
+
+def _format_comment_thread_with_replies(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the tool output for one comment thread with its embedded replies"""
+    comment = _format_comment_thread(item)
+    replies = item.get('replies')
+    if replies:
+        comment['replies'] = list(map(_format_reply, replies['comments'][:MAX_REPLIES_PER_THREAD]))
+    return comment
+
+
+# Replies of threads whose embedded replies were incomplete, by thread ID
+_thread_replies: TTLCache = TTLCache(maxsize=1024, ttl=1800)
+
+
+def _fetch_replies(thread_id: str) -> List[Dict[str, Any]]:
+    """Fetch the first replies of a comment thread (1 quota unit)"""
+    response = _execute(youtube.comments().list(
+        part='snippet',
+        parentId=thread_id,
+        maxResults=MAX_REPLIES_PER_THREAD,
+        textFormat='plainText',
+        fields=_REPLY_FIELDS
+    ))
+    return list(map(_format_reply, response.get('items', [])))
+
+
+async def _complete_replies(comments: List[Dict[str, Any]]) -> None:
+    """
+    Fill in replies that commentThreads.list left out
+    
+    The API embeds only some replies per thread (usually up to 5), so
+    threads with more are fetched with comments.list, concurrently and at
+    most once per thread every 30 minutes. At most MAX_REPLY_FETCHES_PER_CALL
+    threads are fetched, and only if the quota budget covers them. On
+    failure the embedded replies are kept.
+    """
+    incomplete = []
+    for comment in comments:
+        if len(comment['replies']) >= min(comment['reply_count'], MAX_REPLIES_PER_THREAD):
+            continue
+        replies = _thread_replies.get(comment['id'])
+        if replies is not None:
+            comment['replies'] = replies
+        else:
+            incomplete.append(comment)
+    
+    incomplete = incomplete[:MAX_REPLY_FETCHES_PER_CALL]
+    if not incomplete:
+        return
+    if not spend_quota(len(incomplete)):
+        logger.debug("Skipping reply completion: quota budget is low")
+        return
+    
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_fetch_replies, comment['id']) for comment in incomplete),
+        return_exceptions=True
+    )
+    for comment, replies in zip(incomplete, results):
+        if isinstance(replies, Exception):
+            logger.warning("Failed to fetch replies of %s: %s", comment['id'], replies)
+            continue
+        _thread_replies[comment['id']] = replies
+        comment['replies'] = replies
+
+
+# get_video_info fields added to search results by enrich=True
+_ENRICHED_FIELDS = ("duration", "view_count", "like_count", "comment_count")
+
+
+async def _enrich_search_results(videos: List[Dict[str, Any]]) -> None:
+    """
+    Add video details to search results in place
+    
+    The lookups are coalesced into one videos.list call and primed into the
+    get_video_info cache. On failure the results are left as they are.
+    """
+    try:
+        items = await asyncio.gather(*(video_batcher.get(video["video_id"]) for video in videos))
+    except HttpError as e:
+        logger.warning("Failed to enrich search results: %s", e)
+        return
+    
+    for video, item in zip(videos, items):
+        if item is None:
+            continue
+        info = _format_video(video["video_id"], item)
+        _prime_video_info(video["video_id"], info)
+        for field in _ENRICHED_FIELDS:
+            video[field] = info[field]
+
+
+def _format_search_result(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the search_videos output for one search.list item"""
+    snippet = item['snippet']
+    return {
+        "video_id": item['id']['videoId'],
+        "title": sanitize_text(snippet['title'], 200),
+        "description": sanitize_text(snippet.get('description', ''), 500),
+        "channel_id": sys.intern(snippet['channelId']),
+        "channel_title": sys.intern(sanitize_text(snippet['channelTitle'], 100)),
+        "published_at": snippet['publishedAt'],
+        "thumbnails": snippet.get('thumbnails', {})
+    }
+
+
+# The next comment page is fetched while the caller reads the current one
+# (1 quota unit, charged when the read-ahead starts and refunded if claimed)
+comment_prefetcher = PagePrefetcher(_fetch_comment_page)
+
+
+def _error(error: str, message: str, **extra) -> Dict[str, Any]:
+    """Build a failed tool result"""
+    return {"success": False, "error": error, "message": message, **extra}
+
+
 # ============================================================================
 # MCP TOOLS - ENHANCED VERSIONS
 # ============================================================================
 
 @mcp.tool()
-@rate_limited(endpoint="get_video_transcript")
-@cached(ttl=3600)  # Cache transcripts for 1 hour
-def get_video_transcript(
+@rate_limited(endpoint="get_video_transcript", cost=0)
+@cached(ttl=_transcript_ttl, normalize={"video_url": validate_video_url, "language": validate_language})
+async def get_video_transcript(
     video_url: str,
-    language: str = "en"
+    language: str = "en",
+    compact: bool = False
 ) -> Dict[str, Any]:
     """
     Extract video transcript/subtitles from a YouTube video.
     
     ✨ Enhanced with:
     - Input validation
-    - Caching (1 hour TTL)
+    - Caching (1 hour TTL, 30 days for videos older than a year)
     - Rate limiting
     - Better error messages
     
     Args:
         video_url: YouTube video URL or video ID
         language: Language code (e.g., 'en', 'es', 'fr', 'he', 'ar')
+        compact: Return segments as parallel lists instead of one dict per segment
     
     Returns:
         Dictionary containing:
@@ -335,7 +920,9 @@ def get_video_transcript(
         - video_id: The video ID
         - language: Language of the transcript
         - is_generated: Whether transcript is auto-generated
-        - transcript: List of transcript segments with text and timestamps
+        - transcript: List of transcript segments with text and timestamps,
+          or with compact=True {"texts": [...], "starts": [...], "durations": [...]}
+          where index i of each list describes segment i
         - full_text: Complete transcript as a single string
         - segment_count: Number of segments
         - cached: Whether result came from cache
@@ -351,11 +938,10 @@ def get_video_transcript(
                 f"🚨 Prompt injection detected in get_video_transcript: "
                 f"pattern={pattern_type}, video_url={video_url[:100]}"
             )
-            return {
-                "success": False,
-                "error": "Invalid input detected",
-                "message": "The input contains suspicious patterns and was rejected for security reasons."
-            }
+            return _error(
+                "Invalid input detected",
+                "The input contains suspicious patterns and was rejected for security reasons."
+            )
         
         # Also check language parameter
         is_injection, pattern_type, details = PromptInjectionDetector.detect(language)
@@ -364,87 +950,97 @@ def get_video_transcript(
                 f"🚨 Prompt injection detected in language parameter: "
                 f"pattern={pattern_type}, language={language}"
             )
-            return {
-                "success": False,
-                "error": "Invalid input detected",
-                "message": "The language parameter contains suspicious patterns."
-            }
+            return _error(
+                "Invalid input detected",
+                "The language parameter contains suspicious patterns."
+            )
         
         # Validate inputs
         video_id = validate_video_url(video_url)
         language = validate_language(language)
         
-        logger.info(f"Fetching transcript for video {video_id} in language {language}")
+        missing = get_negative(("transcript", video_id, language))
+        if missing:
+            return missing
+        
+        logger.info("Fetching transcript for video %s in language %s", video_id, language)
         
         # Get transcript
-        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+        transcript_list = await asyncio.to_thread(_list_transcripts, video_id)
         
         # Try to get transcript in requested language
+        # (both lookups read the index fetched above; only fetch() hits the network)
         try:
             transcript = transcript_list.find_transcript([language])
         except (NoTranscriptFound, TranscriptsDisabled):
             # Fallback to English auto-generated
             try:
                 transcript = transcript_list.find_generated_transcript(['en'])
-                logger.info(f"Falling back to English auto-generated transcript")
-            except:
-                return {
-                    "success": False,
-                    "error": "No transcript available",
-                    "message": f"No transcript found in {language} or English. "
-                               f"The video may not have captions enabled."
-                }
+                logger.info("Falling back to English auto-generated transcript")
+            except NoTranscriptFound:
+                return set_negative(("transcript", video_id, language), _error(
+                    "No transcript available",
+                    f"No transcript found in {language} or English. "
+                    f"The video may not have captions enabled."
+                ))
         
         # Fetch the transcript
-        transcript_data = transcript.fetch()
+        transcript_data = await asyncio.to_thread(transcript.fetch)
         
-        # Create full text (sanitized)
-        full_text = " ".join([
-            sanitize_text(entry['text'], max_length=10000) 
-            for entry in transcript_data
-        ])
+        # Create full text (sanitized), stopping once the 50K character
+        # limit is covered instead of sanitizing and joining every segment
+        max_chars = 50000
+        parts = []
+        length = -1  # no separator before the first segment
+        for entry in transcript_data:
+            text = sanitize_text(entry['text'], max_length=10000)
+            parts.append(text)
+            length += len(text) + 1
+            if length >= max_chars:
+                break
+        full_text = " ".join(parts)[:max_chars]  # Limit to 50K characters
+        
+        # Keep only what is returned; the full list can be freed before
+        # the response is built and serialized
+        segment_count = len(transcript_data)
+        segments = transcript_data[:100]  # Limit to first 100 segments
+        del transcript_data, parts
         
         return {
             "success": True,
             "video_id": video_id,
             "language": transcript.language_code,
             "is_generated": transcript.is_generated,
-            "transcript": transcript_data[:100],  # Limit to first 100 segments
-            "full_text": full_text[:50000],  # Limit to 50K characters
-            "segment_count": len(transcript_data),
+            "transcript": _compact_segments(segments) if compact else segments,
+            "full_text": full_text,
+            "segment_count": segment_count,
             "cached": False  # Will be overridden by cache decorator
         }
         
     except ValidationError as e:
-        return {
-            "success": False,
-            "error": "Validation error",
-            "message": str(e)
-        }
+        return _error("Validation error", str(e))
     except Exception as e:
         logger.error(f"Failed to get transcript: {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Failed to retrieve transcript. The video may not have captions available."
-        }
+        response = _error(
+            str(e),
+            "Failed to retrieve transcript. The video may not have captions available."
+        )
+        if isinstance(e, (TranscriptsDisabled, NoTranscriptFound)):
+            set_negative(("transcript", video_id, language), response)
+        return response
 
 
 @mcp.tool()
 @rate_limited(endpoint="get_video_info")
-@cached(ttl=1800)  # Cache for 30 minutes
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    retry=retry_if_exception_type(HttpError)
-)
-def get_video_info(video_url: str) -> Dict[str, Any]:
+@cached(ttl=_video_info_ttl, stale_ok=True, normalize={"video_url": validate_video_url})  # Scaled with video age
+async def get_video_info(video_url: str) -> Dict[str, Any]:
     """
     Get comprehensive metadata for a YouTube video.
     
     ✨ Enhanced with:
     - Input validation
-    - Caching (30 min TTL)
+    - Caching (1 min for live streams, else 30 min to 7 days by video age;
+      then stale-while-revalidate)
     - Rate limiting
     - Retry logic (3 attempts)
     - Sanitized output
@@ -467,85 +1063,120 @@ def get_video_info(video_url: str) -> Dict[str, Any]:
                 f"🚨 Prompt injection detected in get_video_info: "
                 f"pattern={pattern_type}, video_url={video_url[:100]}"
             )
-            return {
-                "success": False,
-                "error": "Invalid input detected",
-                "message": "The input contains suspicious patterns and was rejected for security reasons."
-            }
+            return _error(
+                "Invalid input detected",
+                "The input contains suspicious patterns and was rejected for security reasons."
+            )
         
         # Validate input
         video_id = validate_video_url(video_url)
         
-        logger.info(f"Fetching info for video {video_id}")
+        missing = get_negative(("video", video_id))
+        if missing:
+            return missing
         
-        # Request video details
-        response = youtube.videos().list(
-            part='snippet,contentDetails,statistics',
-            id=video_id
-        ).execute()
+        logger.info("Fetching info for video %s", video_id)
+        
+        # Request video details (batched with concurrent lookups)
+        video = await video_batcher.get(video_id)
         
-        if not response.get('items'):
-            return {
+        if video is None:
+            return set_negative(("video", video_id), {
                 "success": False,
                 "error": "Video not found",
                 "video_id": video_id
-            }
+            })
         
-        video = response['items'][0]
-        snippet = video['snippet']
-        statistics = video.get('statistics', {})
-        content_details = video['contentDetails']
-        
-        return {
-            "success": True,
-            "video_id": video_id,
-            "title": sanitize_text(snippet['title'], 500),
-            "description": sanitize_text(snippet.get('description', ''), 5000),
-            "channel_id": snippet['channelId'],
-            "channel_title": sanitize_text(snippet['channelTitle'], 200),
-            "publish_date": snippet['publishedAt'],
-            "duration": content_details['duration'],
-            "view_count": int(statistics.get('viewCount', 0)),
-            "like_count": int(statistics.get('likeCount', 0)),
-            "comment_count": int(statistics.get('commentCount', 0)),
-            "tags": snippet.get('tags', [])[:20],  # Limit to 20 tags
-            "thumbnails": snippet.get('thumbnails', {}),
-            "category_id": snippet['categoryId'],
-            "default_language": snippet.get('defaultLanguage'),
-            "cached": False
-        }
+        return _format_video(video_id, video)
         
     except ValidationError as e:
-        return {
-            "success": False,
-            "error": "Validation error",
-            "message": str(e)
-        }
+        return _error("Validation error", str(e))
     except HttpError as e:
         logger.error(f"YouTube API error: {e}")
-        return {
-            "success": False,
-            "error": f"API error: {e.status_code}",
-            "message": "Failed to retrieve video information"
-        }
+        return _error(f"API error: {e.status_code}", "Failed to retrieve video information")
+
+
+# Most videos accepted by get_videos_info_batch in one call
+MAX_BATCH_VIDEOS = 200
+
+
+@mcp.tool()
+@rate_limited(endpoint="get_videos_info_batch", cost=4)
+async def get_videos_info_batch(video_urls: List[str]) -> Dict[str, Any]:
+    """
+    Get metadata for many YouTube videos at once.
+    
+    ✨ Enhanced with:
+    - One videos.list call per 50 videos (1 quota unit each)
+    - Per-video results primed into the get_video_info cache
+    - Input validation
+    
+    Args:
+        video_urls: YouTube video URLs or IDs (max 200)
+    
+    Returns:
+        Dictionary with:
+        - videos: get_video_info results for the videos found, in input order
+        - not_found: Video IDs that do not exist
+        - invalid: Inputs that are not valid video URLs or IDs
+    
+    Example:
+        get_videos_info_batch(["dQw4w9WgXcQ", "https://youtu.be/9bZkp7q19f0"])
+    """
+    if len(video_urls) > MAX_BATCH_VIDEOS:
+        return _error("Validation error", f"At most {MAX_BATCH_VIDEOS} videos per call")
+    
+    video_ids = []
+    invalid = []
+    for video_url in video_urls:
+        try:
+            video_id = validate_video_url(video_url)
+        except ValidationError:
+            invalid.append(video_url)
+            continue
+        if video_id not in video_ids:
+            video_ids.append(video_id)
+    
+    logger.info("Fetching info for %d videos", len(video_ids))
+    
+    try:
+        # The batcher splits the IDs into videos.list calls of up to 50
+        items = await asyncio.gather(*(video_batcher.get(video_id) for video_id in video_ids))
+    except HttpError as e:
+        logger.error(f"YouTube API error: {e}")
+        return _error(f"API error: {e.status_code}", "Failed to retrieve video information")
+    
+    videos = []
+    not_found = []
+    for video_id, item in zip(video_ids, items):
+        if item is None:
+            not_found.append(video_id)
+            continue
+        result = _format_video(video_id, item)
+        # Later get_video_info(video_id) calls become cache hits
+        _prime_video_info(video_id, result)
+        videos.append(result)
+    
+    return {
+        "success": True,
+        "videos": videos,
+        "not_found": not_found,
+        "invalid": invalid,
+        "cached": False
+    }
 
 
 @mcp.tool()
 @rate_limited(endpoint="get_channel_info")
-@cached(ttl=3600)  # Cache for 1 hour
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    retry=retry_if_exception_type(HttpError)
-)
-def get_channel_info(channel_id: str) -> Dict[str, Any]:
+@cached(ttl=3600, stale_ok=True, normalize={"channel_id": _canonical_channel_id})  # 1 hour, then stale while refreshing
+async def get_channel_info(channel_id: str) -> Dict[str, Any]:
     """
     Get information and statistics for a YouTube channel.
     
     ✨ Enhanced with:
     - Support for @username resolution
     - Input validation
-    - Caching (1 hour TTL)
+    - Caching (1 hour TTL, then stale-while-revalidate)
     - Rate limiting
     - Retry logic
     
@@ -563,44 +1194,50 @@ def get_channel_info(channel_id: str) -> Dict[str, Any]:
         # Validate and resolve channel ID
         validated_id = validate_channel_id(channel_id)
         
+        missing_key = ("channel", validated_id)
+        missing = get_negative(missing_key)
+        if missing:
+            return missing
+        
         # Handle @username format
-        if validated_id.startswith('@') or '/@' in validated_id:
-            username = validated_id.lstrip('@').split('/@')[-1]
-            resolved_id = resolve_channel_handle(username)
+        username = _channel_handle(validated_id)
+        if username:
+            resolved_id = _cached_channel_handle(username)
             if not resolved_id:
-                return {
-                    "success": False,
-                    "error": "Channel not found",
-                    "message": f"Could not resolve @{username} to a channel ID"
-                }
+                # Unknown handle: fetch the channel itself by handle (one call)
+                logger.info("Fetching info for channel @%s", username)
+                channel = await asyncio.to_thread(_fetch_channel_by_handle, username)
+                if channel is None:
+                    return set_negative(missing_key, _error(
+                        "Channel not found",
+                        f"Could not resolve @{username} to a channel ID"
+                    ))
             validated_id = resolved_id
         
-        logger.info(f"Fetching info for channel {validated_id}")
-        
-        # Request channel details
-        response = youtube.channels().list(
-            part='snippet,statistics,contentDetails',
-            id=validated_id
-        ).execute()
+        if validated_id:
+            logger.info("Fetching info for channel %s", validated_id)
+            
+            # Request channel details (batched with concurrent lookups)
+            channel = await channel_batcher.get(validated_id)
         
-        if not response.get('items'):
-            return {
+        if channel is None:
+            return set_negative(missing_key, {
                 "success": False,
                 "error": "Channel not found",
                 "channel_id": channel_id
-            }
+            })
         
-        channel = response['items'][0]
         snippet = channel['snippet']
         statistics = channel.get('statistics', {})
+        title, published_at = _CHANNEL_SNIPPET_FIELDS(snippet)
         
         return {
             "success": True,
             "channel_id": channel['id'],
-            "title": sanitize_text(snippet['title'], 200),
+            "title": sanitize_text(title, 200),
             "description": sanitize_text(snippet.get('description', ''), 2000),
             "custom_url": snippet.get('customUrl'),
-            "published_at": snippet['publishedAt'],
+            "published_at": published_at,
             "subscriber_count": int(statistics.get('subscriberCount', 0)),
             "video_count": int(statistics.get('videoCount', 0)),
             "view_count": int(statistics.get('viewCount', 0)),
@@ -611,44 +1248,40 @@ def get_channel_info(channel_id: str) -> Dict[str, Any]:
         }
         
     except ValidationError as e:
-        return {
-            "success": False,
-            "error": "Validation error",
-            "message": str(e)
-        }
+        return _error("Validation error", str(e))
     except HttpError as e:
         logger.error(f"YouTube API error: {e}")
-        return {
-            "success": False,
-            "error": f"API error: {e.status_code}",
-            "message": "Failed to retrieve channel information"
-        }
+        return _error(f"API error: {e.status_code}", "Failed to retrieve channel information")
 
 
 @mcp.tool()
 @rate_limited(endpoint="get_video_comments")
-@cached(ttl=1800)  # Cache for 30 minutes
-def get_video_comments(
+@cached(ttl=1800, stale_ok=True, normalize={"video_url": validate_video_url})  # 30 minutes, then stale while refreshing
+async def get_video_comments(
     video_url: str,
     max_results: int = 100,
-    include_replies: bool = True
+    include_replies: bool = True,
+    page_token: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Fetch comments from a YouTube video.
     
     ✨ Enhanced with:
     - Input validation
-    - Caching (30 min TTL)
+    - Caching (30 min TTL, then stale-while-revalidate)
     - Rate limiting
     - Comment sanitization
     
     Args:
         video_url: YouTube video URL or video ID
         max_results: Maximum comments (1-100, default: 100)
-        include_replies: Include replies (default: True)
+        include_replies: Include up to 10 replies per comment (default: True;
+            threads with more than the API embeds cost 1 extra unit each,
+            for up to 10 threads per call)
+        page_token: next_page_token from a previous call, to read the next page
     
     Returns:
-        Dictionary with comment data
+        Dictionary with comment data and next_page_token (None on the last page)
     
     Example:
         get_video_comments("https://www.youtube.com/watch?v=dQw4w9WgXcQ", max_results=50)
@@ -658,98 +1291,83 @@ def get_video_comments(
         video_id = validate_video_url(video_url)
         max_results = validate_max_results(max_results, "comments")
         
-        logger.info(f"Fetching {max_results} comments for video {video_id}")
+        missing = get_negative(("comments", video_id))
+        if missing:
+            return missing
         
-        comments = []
+        logger.info("Fetching %d comments for video %s", max_results, video_id)
         
-        # Request top-level comments
-        response = youtube.commentThreads().list(
-            part='snippet,replies',
-            videoId=video_id,
-            maxResults=max_results,
-            textFormat='plainText',
-            order='relevance'
-        ).execute()
+        # Request top-level comments (replies are embedded in the same call)
+        response = await comment_prefetcher.get(video_id, page_token, max_results)
+        
+        next_page_token = response.get('nextPageToken')
+        if next_page_token:
+            comment_prefetcher.prefetch(video_id, next_page_token, max_results)
+        
+        # Pick the formatter once instead of checking include_replies per thread
+        format_thread = _format_comment_thread_with_replies if include_replies else _format_comment_thread
         
+        comments = []
+        total_reply_count = 0
         for item in response.get('items', []):
-            top_comment = item['snippet']['topLevelComment']['snippet']
-            
-            comment_data = {
-                "id": item['id'],
-                "author": sanitize_text(top_comment['authorDisplayName'], 100),
-                "text": sanitize_text(top_comment['textDisplay'], 10000),
-                "like_count": top_comment['likeCount'],
-                "published_at": top_comment['publishedAt'],
-                "updated_at": top_comment['updatedAt'],
-                "reply_count": item['snippet']['totalReplyCount'],
-                "replies": []
-            }
-            
-            # Add replies if available and requested
-            if include_replies and item.get('replies'):
-                for reply in item['replies']['comments'][:10]:  # Limit to 10 replies
-                    reply_snippet = reply['snippet']
-                    comment_data['replies'].append({
-                        "id": reply['id'],
-                        "author": sanitize_text(reply_snippet['authorDisplayName'], 100),
-                        "text": sanitize_text(reply_snippet['textDisplay'], 10000),
-                        "like_count": reply_snippet['likeCount'],
-                        "published_at": reply_snippet['publishedAt']
-                    })
-            
-            comments.append(comment_data)
+            comment = format_thread(item)
+            total_reply_count += comment['reply_count']
+            comments.append(comment)
+        
+        if include_replies:
+            await _complete_replies(comments)
         
         return {
             "success": True,
             "video_id": video_id,
             "comment_count": len(comments),
-            "total_reply_count": sum(c['reply_count'] for c in comments),
+            "total_reply_count": total_reply_count,
             "comments": comments,
+            "next_page_token": next_page_token,
             "cached": False
         }
         
     except ValidationError as e:
-        return {
-            "success": False,
-            "error": "Validation error",
-            "message": str(e)
-        }
+        return _error("Validation error", str(e))
     except HttpError as e:
         logger.error(f"YouTube API error: {e}")
-        return {
-            "success": False,
-            "error": f"API error: {e.status_code}",
-            "message": "Failed to retrieve comments. Comments may be disabled for this video."
-        }
+        response = _error(
+            f"API error: {e.status_code}",
+            "Failed to retrieve comments. Comments may be disabled for this video."
+        )
+        # Disabled comments and missing videos are remembered; quota and
+        # transient errors are not
+        if _http_error_reasons(e) & _PERMANENT_COMMENT_ERRORS:
+            set_negative(("comments", video_id), response)
+        return response
 
 
 @mcp.tool()
-@rate_limited(endpoint="search_videos")
-@cached(ttl=600)  # Cache for 10 minutes
-@retry(
-    stop=stop_after_attempt(2),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type(HttpError)
-)
-def search_videos(
+@rate_limited(endpoint="search_videos", cost=100)
+@cached(ttl=600, stale_ok=True)  # Cache for 10 minutes, then serve stale while refreshing
+async def search_videos(
     query: str,
     max_results: int = 10,
-    order: str = "relevance"
+    order: str = "relevance",
+    enrich: bool = False
 ) -> Dict[str, Any]:
     """
     Search for YouTube videos.
     
     ✨ Enhanced with:
     - Query validation and sanitization
-    - Caching (10 min TTL)
+    - Caching (10 min TTL, then stale-while-revalidate)
     - Rate limiting
     - Retry logic
     - Smart order mapping
+    - Result details prefetched into the get_video_info cache
     
     Args:
         query: Search query string
         max_results: Maximum results (1-50, default: 10)
         order: Sort order - 'relevance', 'date', 'viewCount', 'rating', 'title'
+        enrich: Add duration and view/like/comment counts to each result
+            (one videos.list call, 1 quota unit)
     
     Returns:
         Dictionary with search results
@@ -765,40 +1383,39 @@ def search_videos(
                 f"🚨 Prompt injection detected in search_videos: "
                 f"pattern={pattern_type}, query={query[:100]}"
             )
-            return {
-                "success": False,
-                "error": "Invalid input detected",
-                "message": "The search query contains suspicious patterns and was rejected for security reasons."
-            }
+            return _error(
+                "Invalid input detected",
+                "The search query contains suspicious patterns and was rejected for security reasons."
+            )
         
         # Validate inputs
         query = validate_search_query(query)
         max_results = validate_max_results(max_results, "results")
         order = validate_order(order)
         
-        logger.info(f"Searching videos: '{query}' (max={max_results}, order={order})")
+        logger.info("Searching videos: '%s' (max=%d, order=%s)", query, max_results, order)
         
         # Search for videos
-        response = youtube.search().list(
+        request = youtube.search().list(
             part='snippet',
             q=query,
             type='video',
             maxResults=max_results,
-            order=order
-        ).execute()
+            order=order,
+            fields=_SEARCH_FIELDS
+        )
+        response = await asyncio.to_thread(_execute, request)
         
-        videos = []
-        for item in response.get('items', []):
-            snippet = item['snippet']
-            videos.append({
-                "video_id": item['id']['videoId'],
-                "title": sanitize_text(snippet['title'], 200),
-                "description": sanitize_text(snippet.get('description', ''), 500),
-                "channel_id": snippet['channelId'],
-                "channel_title": sanitize_text(snippet['channelTitle'], 100),
-                "published_at": snippet['publishedAt'],
-                "thumbnails": snippet.get('thumbnails', {})
-            })
+        videos = list(map(_format_search_result, response.get('items', [])))
+        
+        if videos and enrich:
+            await _enrich_search_results(videos)
+        # Details of search results are usually requested next; fetch them in
+        # the background (1 quota unit per 50 videos) so those are cache hits
+        elif videos and cache_manager.enabled:
+            task = asyncio.ensure_future(_warm_video_info([video["video_id"] for video in videos]))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
         
         return {
             "success": True,
@@ -810,26 +1427,57 @@ def search_videos(
         }
         
     except ValidationError as e:
-        return {
-            "success": False,
-            "error": "Validation error",
-            "message": str(e)
-        }
+        return _error("Validation error", str(e))
     except HttpError as e:
         logger.error(f"YouTube API error: {e}")
-        return {
-            "success": False,
-            "error": f"API error: {e.status_code}",
-            "message": "Failed to search videos"
-        }
+        return _error(f"API error: {e.status_code}", "Failed to search videos")
 
 
+@mcp.tool()
+async def get_video_report(
+    video_url: str,
+    language: str = "en",
+    max_comments: int = 20
+) -> Dict[str, Any]:
+    """
+    Get metadata, top comments and transcript of a video in one call.
+    
+    ✨ Enhanced with:
+    - The three lookups run concurrently (latency of the slowest, not the sum)
+    - Each part keeps its own validation, caching and rate limiting
+    
+    Args:
+        video_url: YouTube video URL or video ID
+        language: Transcript language code (default: 'en')
+        max_comments: Maximum comments (1-100, default: 20)
+    
+    Returns:
+        Dictionary with the get_video_info, get_video_comments and
+        get_video_transcript results under info, comments and transcript;
+        success is True if any part succeeded
+    
+    Example:
+        get_video_report("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+    """
+    info, comments, transcript = await asyncio.gather(
+        get_video_info.fn(video_url),
+        get_video_comments.fn(video_url, max_results=max_comments, include_replies=False),
+        get_video_transcript.fn(video_url, language=language)
+    )
+    
+    return {
+        "success": any(part.get("success") for part in (info, comments, transcript)),
+        "info": info,
+        "comments": comments,
+        "transcript": transcript
+    }
+
 # ============================================================================
 # PLAYLIST MANAGEMENT TOOLS
 # ============================================================================
 
 @mcp.tool()
-@rate_limited(endpoint="create_playlist")
+@rate_limited(endpoint="create_playlist", cost=50)
 def create_playlist(
     title: str,
     description: str = "",
@@ -867,7 +1515,7 @@ def create_playlist(
         )
     """
     try:
-        result = playlist_creator.create_playlist(
+        result = _playlist_creator().create_playlist(
             title=title,
             description=description,
             privacy_status=privacy_status,
@@ -880,22 +1528,17 @@ def create_playlist(
         }
         
     except ValueError as e:
-        return {
-            "success": False,
-            "error": "Validation error",
-            "message": str(e)
-        }
+        return _error("Validation error", str(e))
     except HttpError as e:
         logger.error(f"Failed to create playlist: {e}")
-        return {
-            "success": False,
-            "error": f"API error: {e.status_code}",
-            "message": "Failed to create playlist. Make sure OAuth2 authentication is configured."
-        }
+        return _error(
+            f"API error: {e.status_code}",
+            "Failed to create playlist. Make sure OAuth2 authentication is configured."
+        )
 
 
 @mcp.tool()
-@rate_limited(endpoint="add_video_to_playlist")
+@rate_limited(endpoint="add_video_to_playlist", cost=50)
 def add_video_to_playlist(
     playlist_id: str,
     video_id: str,
@@ -931,7 +1574,7 @@ def add_video_to_playlist(
         # Validate and extract video ID if URL provided
         video_id = validate_video_url(video_id)
         
-        result = playlist_manager.add_video(
+        result = _playlist_manager().add_video(
             playlist_id=playlist_id,
             video_id=video_id,
             position=position
@@ -943,22 +1586,14 @@ def add_video_to_playlist(
         }
         
     except (ValueError, ValidationError) as e:
-        return {
-            "success": False,
-            "error": "Validation error",
-            "message": str(e)
-        }
+        return _error("Validation error", str(e))
     except HttpError as e:
         logger.error(f"Failed to add video to playlist: {e}")
-        return {
-            "success": False,
-            "error": f"API error: {e.status_code}",
-            "message": "Failed to add video to playlist"
-        }
+        return _error(f"API error: {e.status_code}", "Failed to add video to playlist")
 
 
 @mcp.tool()
-@rate_limited(endpoint="remove_video_from_playlist")
+@rate_limited(endpoint="remove_video_from_playlist", cost=51)
 def remove_video_from_playlist(
     playlist_id: str,
     playlist_item_id: Optional[str] = None,
@@ -995,7 +1630,7 @@ def remove_video_from_playlist(
         )
     """
     try:
-        result = playlist_manager.remove_video(
+        result = _playlist_manager().remove_video(
             playlist_id=playlist_id,
             playlist_item_id=playlist_item_id,
             video_id=video_id,
@@ -1008,22 +1643,14 @@ def remove_video_from_playlist(
         }
         
     except ValueError as e:
-        return {
-            "success": False,
-            "error": "Validation error",
-            "message": str(e)
-        }
+        return _error("Validation error", str(e))
     except HttpError as e:
         logger.error(f"Failed to remove video from playlist: {e}")
-        return {
-            "success": False,
-            "error": f"API error: {e.status_code}",
-            "message": "Failed to remove video from playlist"
-        }
+        return _error(f"API error: {e.status_code}", "Failed to remove video from playlist")
 
 
 @mcp.tool()
-@rate_limited(endpoint="update_playlist")
+@rate_limited(endpoint="update_playlist", cost=50)
 def update_playlist(
     playlist_id: str,
     title: Optional[str] = None,
@@ -1051,7 +1678,7 @@ def update_playlist(
         - description: Updated description
         - privacy_status: Updated privacy
     
-    Quota Cost: 50 units
+    Quota Cost: 51 units (1 if nothing changed)
     
     Example:
         update_playlist(
@@ -1061,7 +1688,7 @@ def update_playlist(
         )
     """
     try:
-        result = playlist_updater.update_playlist(
+        result = _playlist_updater().update_playlist(
             playlist_id=playlist_id,
             title=title,
             description=description,
@@ -1075,22 +1702,14 @@ def update_playlist(
         }
         
     except ValueError as e:
-        return {
-            "success": False,
-            "error": "Validation error",
-            "message": str(e)
-        }
+        return _error("Validation error", str(e))
     except HttpError as e:
         logger.error(f"Failed to update playlist: {e}")
-        return {
-            "success": False,
-            "error": f"API error: {e.status_code}",
-            "message": "Failed to update playlist"
-        }
+        return _error(f"API error: {e.status_code}", "Failed to update playlist")
 
 
 @mcp.tool()
-@rate_limited(endpoint="reorder_playlist")
+@rate_limited(endpoint="reorder_playlist", cost=50)
 def reorder_playlist_video(
     playlist_id: str,
     video_id: str,
@@ -1124,7 +1743,7 @@ def reorder_playlist_video(
         )
     """
     try:
-        result = playlist_reorderer.move_video(
+        result = _playlist_reorderer().move_video(
             playlist_id=playlist_id,
             video_id=video_id,
             new_position=new_position
@@ -1136,18 +1755,10 @@ def reorder_playlist_video(
         }
         
     except ValueError as e:
-        return {
-            "success": False,
-            "error": "Validation error",
-            "message": str(e)
-        }
+        return _error("Validation error", str(e))
     except HttpError as e:
         logger.error(f"Failed to reorder playlist: {e}")
-        return {
-            "success": False,
-            "error": f"API error: {e.status_code}",
-            "message": "Failed to reorder playlist"
-        }
+        return _error(f"API error: {e.status_code}", "Failed to reorder playlist")
 
 
 @mcp.tool()
@@ -1181,11 +1792,16 @@ def list_user_playlists(
         if not 1 <= max_results <= 50:
             raise ValueError("max_results must be between 1 and 50")
         
-        response = youtube.playlists().list(
-            part='snippet,contentDetails,status',
-            mine=True,
-            maxResults=max_results
-        ).execute()
+        # Revalidated with If-None-Match; any write to a playlist changes the ETag
+        response = _execute_conditional(
+            youtube.playlists().list(
+                part='snippet,contentDetails,status',
+                mine=True,
+                maxResults=max_results,
+                fields=_PLAYLIST_LIST_FIELDS
+            ),
+            f"playlists:mine:{max_results}"
+        )
         
         playlists = []
         for item in response.get('items', []):
@@ -1208,18 +1824,13 @@ def list_user_playlists(
         }
         
     except ValueError as e:
-        return {
-            "success": False,
-            "error": "Validation error",
-            "message": str(e)
-        }
+        return _error("Validation error", str(e))
     except HttpError as e:
         logger.error(f"Failed to list playlists: {e}")
-        return {
-            "success": False,
-            "error": f"API error: {e.status_code}",
-            "message": "Failed to list playlists. Make sure OAuth2 authentication is configured."
-        }
+        return _error(
+            f"API error: {e.status_code}",
+            "Failed to list playlists. Make sure OAuth2 authentication is configured."
+        )
 
 
 # ============================================================================
@@ -1235,6 +1846,7 @@ def get_server_stats() -> Dict[str, Any]:
         Dictionary with:
         - cache_stats: Cache hit/miss statistics
         - rate_limits: Rate limit status per endpoint
+        - quota: Remaining daily API quota units
         - server_config: Current configuration
         - security_status: Security components status
         - oauth_status: OAuth2 authentication status
@@ -1245,10 +1857,12 @@ def get_server_stats() -> Dict[str, Any]:
         "rate_limits": {
             "transcript": get_rate_stats("get_video_transcript"),
             "video_info": get_rate_stats("get_video_info"),
+            "videos_info_batch": get_rate_stats("get_videos_info_batch"),
             "channel_info": get_rate_stats("get_channel_info"),
             "comments": get_rate_stats("get_video_comments"),
             "search": get_rate_stats("search_videos")
         },
+        "quota": get_quota_stats(),
         "config": {
             "transport": config.server.transport,
             "cache_enabled": config.cache.enabled,
@@ -1379,11 +1993,10 @@ def get_oauth_metadata() -> Dict[str, Any]:
         get_oauth_metadata()
     """
     if not oauth_provider:
-        return {
-            "success": False,
-            "error": "OAuth metadata not available",
-            "message": "OAuth metadata is only available in HTTP mode. Current mode: stdio"
-        }
+        return _error(
+            "OAuth metadata not available",
+            "OAuth metadata is only available in HTTP mode. Current mode: stdio"
+        )
     
     metadata = oauth_provider.get_metadata()
     
@@ -1425,12 +2038,17 @@ async def server_health() -> Dict[str, Any]:
         }
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return {
-            "success": False,
-            "status": "unhealthy",
-            "error": str(e),
-            "message": "Health check failed"
-        }
+        return _error(str(e), "Health check failed", status="unhealthy")
+
+
+def _export_usage_metrics() -> None:
+    """Copy the cache hit/miss totals and remaining quota into the exporter"""
+    for name, total in (
+        ("mcp_cache_hits", cache_manager.hits),
+        ("mcp_cache_misses", cache_manager.misses)
+    ):
+        increment(name, total - (prometheus_exporter.get_metric_value(name) or 0))
+    set_gauge("mcp_youtube_quota_remaining", get_quota_stats()["units_remaining"])
 
 
 @mcp.tool()
@@ -1458,6 +2076,7 @@ def server_metrics() -> Dict[str, Any]:
         server_metrics()
     """
     try:
+        _export_usage_metrics()
         metrics_text = generate_metrics()
         
         # Count metric families (lines starting with # HELP)
@@ -1471,19 +2090,28 @@ def server_metrics() -> Dict[str, Any]:
         }
     except Exception as e:
         logger.error(f"Failed to generate metrics: {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Failed to generate metrics"
-        }
+        return _error(str(e), "Failed to generate metrics")
 
 
 # ============================================================================
 # SERVER INITIALIZATION
 # ============================================================================
 
+def _install_uvloop() -> None:
+    """Use uvloop's event loop when it is installed (not available on Windows)"""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
+
 if __name__ == "__main__":
     logger.info(f"Starting YouTube MCP Server Enhanced v2.0")
+    _install_uvloop()
     logger.info(f"Transport: {config.server.transport}")
     logger.info(f"Cache enabled: {config.cache.enabled}")
     logger.info(f"Rate limiting enabled: {config.rate_limit.enabled}")
@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the playlist management modules
+Uses a mocked YouTube API resource - no network access required
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import MagicMock, Mock, patch
+from googleapiclient.errors import HttpError
+
+from playlist import (
+    PlaylistItemsCache,
+    PlaylistManager,
+    PlaylistMetaCache,
+    PlaylistReorderer,
+    PlaylistUpdater,
+)
+from playlist.playlist_reorderer import _plan_moves
+from playlist.token_bucket import TokenBucket
+
+
+def _insert_response(playlist_id, video_id, position=0):
+    """Build a fake playlistItems().insert() response"""
+    return {
+        "id": f"item_{video_id}",
+        "snippet": {
+            "playlistId": playlist_id,
+            "position": position,
+            "publishedAt": "2024-01-01T00:00:00Z",
+            "resourceId": {"kind": "youtube#video", "videoId": video_id}
+        }
+    }
+
+
+@pytest.fixture
+def youtube():
+    """Mocked YouTube API resource with an empty playlist"""
+    mock_youtube = MagicMock()
+    mock_youtube.playlistItems.return_value.list.return_value.execute.return_value = {
+        "items": []
+    }
+
+    # videos().list() reports every requested ID as existing
+    def videos_list(id, **kwargs):
+        request = MagicMock()
+        request.execute.return_value = {"items": [{"id": v} for v in id.split(",")]}
+        return request
+
+    mock_youtube.videos.return_value.list.side_effect = videos_list
+    return mock_youtube
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    """Skip the rate-limiting delays between API calls"""
+    with patch("playlist.playlist_manager.time.sleep"), \
+            patch("playlist.token_bucket.time.sleep"):
+        yield
+
+
+class TestAddVideosBatch:
+    """Test PlaylistManager.add_videos_batch"""
+
+    PLAYLIST_ID = "PLxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
+
+    def test_duplicate_input_ids_are_dropped(self, youtube):
+        """Test that repeated IDs are only inserted once"""
+        youtube.playlistItems.return_value.insert.return_value.execute.side_effect = [
+            _insert_response(self.PLAYLIST_ID, "aaaaaaaaaaa"),
+            _insert_response(self.PLAYLIST_ID, "bbbbbbbbbbb"),
+        ]
+        manager = PlaylistManager(youtube)
+
+        result = manager.add_videos_batch(
+            self.PLAYLIST_ID,
+            ["aaaaaaaaaaa", "bbbbbbbbbbb", "aaaaaaaaaaa"]
+        )
+
+        assert result["added"] == ["aaaaaaaaaaa", "bbbbbbbbbbb"]
+        assert result["duplicate_input"] == ["aaaaaaaaaaa"]
+        assert result["total"] == 2
+        assert youtube.playlistItems.return_value.insert.call_count == 2
+
+    def test_malformed_ids_fail_without_api_call(self, youtube):
+        """Test that malformed IDs are rejected before reaching the API"""
+        youtube.playlistItems.return_value.insert.return_value.execute.return_value = (
+            _insert_response(self.PLAYLIST_ID, "aaaaaaaaaaa")
+        )
+        manager = PlaylistManager(youtube)
+
+        result = manager.add_videos_batch(self.PLAYLIST_ID, ["aaaaaaaaaaa", "bad id"])
+
+        assert result["added"] == ["aaaaaaaaaaa"]
+        assert result["failed"] == [{"video_id": "bad id", "error": "Malformed video ID"}]
+        assert youtube.playlistItems.return_value.insert.call_count == 1
+
+    def test_all_present_returns_without_inserting(self, youtube):
+        """Test the early return when every input is already in the playlist"""
+        youtube.playlistItems.return_value.list.return_value.execute.return_value = {
+            "items": [
+                {"snippet": {"resourceId": {"videoId": "aaaaaaaaaaa"}}},
+                {"snippet": {"resourceId": {"videoId": "bbbbbbbbbbb"}}},
+            ]
+        }
+        progress = Mock()
+        manager = PlaylistManager(youtube)
+
+        result = manager.add_videos_batch(
+            self.PLAYLIST_ID,
+            ["aaaaaaaaaaa", "bbbbbbbbbbb"],
+            progress_callback=progress
+        )
+
+        assert result["added"] == []
+        assert result["skipped"] == ["aaaaaaaaaaa", "bbbbbbbbbbb"]
+        assert not youtube.playlistItems.return_value.insert.called
+        assert not progress.called
+
+    def test_unknown_videos_fail_without_insert(self, youtube):
+        """Test that videos missing from videos.list are never inserted"""
+        youtube.videos.return_value.list.side_effect = None
+        youtube.videos.return_value.list.return_value.execute.return_value = {
+            "items": [{"id": "aaaaaaaaaaa"}]
+        }
+        youtube.playlistItems.return_value.insert.return_value.execute.return_value = (
+            _insert_response(self.PLAYLIST_ID, "aaaaaaaaaaa")
+        )
+        manager = PlaylistManager(youtube)
+
+        result = manager.add_videos_batch(self.PLAYLIST_ID, ["aaaaaaaaaaa", "bbbbbbbbbbb"])
+
+        assert result["added"] == ["aaaaaaaaaaa"]
+        assert [f["video_id"] for f in result["failed"]] == ["bbbbbbbbbbb"]
+        assert youtube.playlistItems.return_value.insert.call_count == 1
+        assert youtube.videos.return_value.list.call_count == 1
+
+    def test_error_reason_mapped_to_message(self, youtube):
+        """Test that the API error reason selects the error message"""
+        content = json.dumps({
+            "error": {"message": "Conflict", "errors": [{"reason": "videoAlreadyInPlaylist"}]}
+        }).encode()
+        youtube.playlistItems.return_value.insert.return_value.execute.side_effect = (
+            HttpError(Mock(status=409, reason="Conflict"), content)
+        )
+        manager = PlaylistManager(youtube)
+
+        with pytest.raises(ValueError, match="already exists"):
+            manager.add_video(self.PLAYLIST_ID, "aaaaaaaaaaa")
+
+    def test_invalid_playlist_id_rejected(self, youtube):
+        """Test playlist ID format validation"""
+        manager = PlaylistManager(youtube)
+
+        with pytest.raises(ValueError):
+            manager.add_video("not a playlist", "aaaaaaaaaaa")
+        with pytest.raises(ValueError):
+            manager.add_video(self.PLAYLIST_ID + "\n", "aaaaaaaaaaa")
+
+    def test_special_playlist_ids_accepted(self, youtube):
+        """Test that IDs without a PL-style prefix pass validation"""
+        manager = PlaylistManager(youtube)
+
+        for playlist_id in ("LL", "WL", "OLAK5uy_kxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"):
+            manager._validate_playlist_id(playlist_id)
+
+
+class TestPlaylistSnapshotCache:
+    """Test the ETag-revalidated playlist snapshot"""
+
+    PLAYLIST_ID = "PLxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
+
+    def test_every_page_is_revalidated(self, youtube):
+        """Test that a 304 on the first page still re-reads the later pages"""
+        list_call = youtube.playlistItems.return_value.list
+        list_call.return_value.execute.side_effect = [
+            {
+                "etag": "etag-1",
+                "nextPageToken": "page-2",
+                "items": [{"snippet": {"resourceId": {"videoId": "aaaaaaaaaaa"}}}]
+            },
+            {
+                "etag": "etag-2",
+                "items": [{"snippet": {"resourceId": {"videoId": "bbbbbbbbbbb"}}}]
+            },
+            HttpError(Mock(status=304, reason="Not Modified"), b""),
+            {
+                "etag": "etag-2b",
+                "items": [{"snippet": {"resourceId": {"videoId": "ccccccccccc"}}}]
+            },
+        ]
+        manager = PlaylistManager(youtube)
+
+        first = manager._get_playlist_video_ids(self.PLAYLIST_ID)
+        second = manager._get_playlist_video_ids(self.PLAYLIST_ID)
+
+        assert first == {"aaaaaaaaaaa", "bbbbbbbbbbb"}
+        assert second == {"aaaaaaaaaaa", "ccccccccccc"}
+        assert list_call.return_value.execute.call_count == 4
+        etags = [c.args[1] for c in list_call.return_value.headers.__setitem__.call_args_list]
+        assert etags == ["etag-1", "etag-2"]
+
+    def test_contains_videos_sees_later_page_removal(self, youtube):
+        """Test that a video removed past the first page is not reported"""
+        first_page = {
+            "etag": "etag-1",
+            "nextPageToken": "page-2",
+            "items": [{"snippet": {"resourceId": {"videoId": "aaaaaaaaaaa"}}}]
+        }
+        list_call = youtube.playlistItems.return_value.list
+        list_call.return_value.execute.side_effect = [
+            first_page,
+            {
+                "etag": "etag-2",
+                "items": [{"snippet": {"resourceId": {"videoId": "bbbbbbbbbbb"}}}]
+            },
+            HttpError(Mock(status=304, reason="Not Modified"), b""),
+            {"etag": "etag-2b", "items": []},
+        ]
+        manager = PlaylistManager(youtube)
+        manager._get_playlist_video_ids(self.PLAYLIST_ID)
+
+        found = manager._contains_videos(self.PLAYLIST_ID, {"aaaaaaaaaaa", "bbbbbbbbbbb"})
+
+        assert found == {"aaaaaaaaaaa"}
+
+    def test_contains_videos_stops_when_all_found(self, youtube):
+        """Test that the membership scan stops paging early"""
+        list_call = youtube.playlistItems.return_value.list
+        list_call.return_value.execute.side_effect = [
+            {
+                "items": [{"snippet": {"resourceId": {"videoId": "aaaaaaaaaaa"}}}],
+                "nextPageToken": "page-2"
+            },
+        ]
+        manager = PlaylistManager(youtube)
+
+        found = manager._contains_videos(self.PLAYLIST_ID, {"aaaaaaaaaaa"})
+
+        assert found == {"aaaaaaaaaaa"}
+        assert list_call.return_value.execute.call_count == 1
+
+
+class TestRemoveVideosBatch:
+    """Test PlaylistManager.remove_videos_batch"""
+
+    def test_parallel_removal_collects_failures(self, youtube):
+        """Test that the worker pool reports every item"""
+        delete_call = youtube.playlistItems.return_value.delete
+
+        def execute_for(id):
+            request = MagicMock()
+            if id == "item_bad":
+                request.execute.side_effect = HttpError(Mock(status=404, reason="Not Found"), b"")
+            return request
+
+        delete_call.side_effect = execute_for
+        manager = PlaylistManager(youtube)
+
+        with patch.object(PlaylistManager, "_thread_http", return_value=None):
+            result = manager.remove_videos_batch(
+                ["item_a", "item_bad", "item_b"],
+                max_workers=3
+            )
+
+        assert sorted(result["removed"]) == ["item_a", "item_b"]
+        assert [f["playlist_item_id"] for f in result["failed"]] == ["item_bad"]
+        assert result["total"] == 3
+
+    def test_concurrent_removals_are_paced(self, youtube):
+        """Test that both concurrent paths take a write token per deletion"""
+        manager = PlaylistManager(youtube)
+
+        with patch.object(PlaylistManager, "_thread_http", return_value=None), \
+                patch("playlist.playlist_manager.WRITE_LIMITER") as limiter:
+            manager.remove_videos_batch(["item_a", "item_b", "item_c"], max_workers=3)
+            asyncio.run(manager.remove_videos_batch_async(["item_d", "item_e"]))
+
+        assert limiter.acquire.call_count == 5
+
+    def test_batch_api_groups_fifty_per_request(self, youtube):
+        """Test that deletions are sent as batch requests of at most 50"""
+        batches = []
+
+        def new_batch(callback):
+            batch = MagicMock()
+            added = []
+            batch.add.side_effect = lambda request, request_id: added.append(request_id)
+            batch.execute.side_effect = lambda: [callback(i, {}, None) for i in added]
+            batches.append(added)
+            return batch
+
+        youtube.new_batch_http_request.side_effect = new_batch
+        manager = PlaylistManager(youtube)
+        item_ids = [f"item_{i}" for i in range(120)]
+
+        result = manager.remove_videos_batch(item_ids, use_batch_api=True)
+
+        assert [len(b) for b in batches] == [50, 50, 20]
+        assert result["removed"] == item_ids
+        assert result["failed"] == []
+
+
+class TestPlaylistMetaCache:
+    """Test the shared playlist metadata cache"""
+
+    PLAYLIST_ID = "PLxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
+
+    @pytest.fixture
+    def playlist_resource(self):
+        return {
+            "id": self.PLAYLIST_ID,
+            "snippet": {
+                "title": "Old title",
+                "description": "",
+                "publishedAt": "2024-01-01T00:00:00Z",
+                "channelId": "UCxxxxxxxxxxxxxxxxxxxxxx",
+                "channelTitle": "Channel"
+            },
+            "status": {"privacyStatus": "private"},
+            "contentDetails": {"itemCount": 3}
+        }
+
+    def test_info_reads_share_one_fetch(self, youtube, playlist_resource):
+        """Test that repeated info reads reuse one playlists.list call"""
+        youtube.playlists.return_value.list.return_value.execute.return_value = {
+            "items": [playlist_resource]
+        }
+        updater = PlaylistUpdater(youtube, PlaylistMetaCache())
+
+        updater.get_playlist_info(self.PLAYLIST_ID)
+        updater.get_playlist_info(self.PLAYLIST_ID)
+
+        assert youtube.playlists.return_value.list.call_count == 1
+
+    def test_writes_read_fresh(self, youtube, playlist_resource):
+        """Test that writes ignore a cached copy edited elsewhere since"""
+        youtube.playlists.return_value.list.return_value.execute.return_value = {
+            "items": [dict(playlist_resource, contentDetails={"itemCount": 5})]
+        }
+        youtube.playlists.return_value.update.return_value.execute.return_value = {
+            "id": self.PLAYLIST_ID,
+            "snippet": playlist_resource["snippet"],
+            "status": {"privacyStatus": "public"}
+        }
+        cache = PlaylistMetaCache()
+        cache.put(self.PLAYLIST_ID, dict(
+            playlist_resource,
+            snippet=dict(playlist_resource["snippet"], title="Stale title")
+        ))
+        updater = PlaylistUpdater(youtube, cache)
+        reorderer = PlaylistReorderer(youtube, cache)
+
+        updater.update_playlist(self.PLAYLIST_ID, privacy_status="public")
+        with patch.object(reorderer, "move_video") as move_video:
+            reorderer.move_to_bottom(self.PLAYLIST_ID, "item_a")
+
+        body = youtube.playlists.return_value.update.call_args.kwargs["body"]
+        assert body["snippet"]["title"] == "Old title"
+        move_video.assert_called_once_with(self.PLAYLIST_ID, "item_a", 4)
+
+    def test_update_refreshes_entry(self, youtube, playlist_resource):
+        """Test that a successful update stores the written resource"""
+        youtube.playlists.return_value.list.return_value.execute.return_value = {
+            "items": [playlist_resource]
+        }
+        youtube.playlists.return_value.update.return_value.execute.return_value = {
+            "id": self.PLAYLIST_ID,
+            "snippet": dict(playlist_resource["snippet"], title="New title"),
+            "status": playlist_resource["status"]
+        }
+        updater = PlaylistUpdater(youtube, PlaylistMetaCache())
+
+        updater.update_playlist(self.PLAYLIST_ID, title="New title")
+        info = updater.get_playlist_info(self.PLAYLIST_ID)
+
+        assert youtube.playlists.return_value.list.call_count == 1
+        assert info["title"] == "New title"
+        assert info["item_count"] == 3
+
+    def test_unchanged_values_skip_update(self, youtube, playlist_resource):
+        """Test that re-sending the current values does not write"""
+        youtube.playlists.return_value.list.return_value.execute.return_value = {
+            "items": [playlist_resource]
+        }
+        updater = PlaylistUpdater(youtube, PlaylistMetaCache())
+
+        result = updater.update_playlist(
+            self.PLAYLIST_ID,
+            title="Old title",
+            privacy_status="private"
+        )
+
+        assert result["changes_made"] == []
+        assert not youtube.playlists.return_value.update.called
+
+    def test_stale_cached_value_does_not_skip_update(self, youtube, playlist_resource):
+        """Test that the no-op check compares against the live playlist"""
+        youtube.playlists.return_value.list.return_value.execute.return_value = {
+            "items": [playlist_resource]
+        }
+        youtube.playlists.return_value.update.return_value.execute.return_value = {
+            "id": self.PLAYLIST_ID,
+            "snippet": dict(playlist_resource["snippet"], title="New title"),
+            "status": playlist_resource["status"]
+        }
+        cache = PlaylistMetaCache()
+        cache.put(self.PLAYLIST_ID, dict(
+            playlist_resource,
+            snippet=dict(playlist_resource["snippet"], title="New title")
+        ))
+        updater = PlaylistUpdater(youtube, cache)
+
+        result = updater.update_playlist(self.PLAYLIST_ID, title="New title")
+
+        assert result["changes_made"] == ["title"]
+        assert youtube.playlists.return_value.update.called
+
+
+class TestTokenBucket:
+    """Test the write pacing token bucket"""
+
+    def test_burst_passes_then_waits(self):
+        """Test that only requests beyond the burst wait for a refill"""
+        with patch("playlist.token_bucket.time.monotonic", return_value=100.0), \
+                patch("playlist.token_bucket.time.sleep") as sleep:
+            bucket = TokenBucket(rate_per_sec=2, burst=3)
+            for _ in range(3):
+                bucket.acquire()
+            assert not sleep.called
+
+            bucket.acquire()
+            sleep.assert_called_once_with(0.5)
+
+
+class TestPlaylistReorderer:
+    """Test PlaylistReorderer move planning"""
+
+    @staticmethod
+    def _apply(order, moves):
+        order = list(order)
+        for item_id, position in moves:
+            order.remove(item_id)
+            order.insert(position, item_id)
+        return order
+
+    def test_plan_reaches_target_order(self):
+        """Test that applying the planned moves yields the target order"""
+        current = ["a", "b", "c", "d", "e"]
+        target = ["c", "a", "e", "b", "d"]
+
+        moves = _plan_moves(current, target)
+
+        assert self._apply(current, moves) == target
+
+    def test_single_displaced_item_needs_one_move(self):
+        """Test that items already in relative order are left in place"""
+        moves = _plan_moves(["a", "b", "c", "d"], ["b", "c", "d", "a"])
+
+        assert moves == [("a", 3)]
+
+    def test_adjacent_swap_needs_one_update(self, youtube):
+        """Test that swapping neighbours moves only the later item"""
+        youtube.playlistItems.return_value.list.return_value.execute.return_value = {
+            "items": [
+                {"id": f"item_{i}", "snippet": {"position": i, "resourceId": {"videoId": f"video_{i}"}}}
+                for i in (3, 4)
+            ]
+        }
+        youtube.playlistItems.return_value.update.return_value.execute.return_value = {
+            "snippet": {"position": 3}
+        }
+        reorderer = PlaylistReorderer(youtube)
+
+        result = reorderer.swap_videos("PLx", "item_3", "item_4")
+
+        youtube.playlistItems.return_value.update.assert_called_once()
+        assert result["item_1"]["new_position"] == 4
+        assert result["item_2"]["new_position"] == 3
+
+    def test_reverse_skips_forced_last_move(self, youtube):
+        """Test that reversing N items issues N - 1 updates"""
+        youtube.playlistItems.return_value.list.return_value.execute.return_value = {
+            "items": [
+                {"id": f"item_{i}", "snippet": {"resourceId": {"videoId": f"video_{i}"}}}
+                for i in range(4)
+            ]
+        }
+        youtube.playlistItems.return_value.update.return_value.execute.return_value = {
+            "snippet": {"position": 0}
+        }
+        reorderer = PlaylistReorderer(youtube)
+
+        result = reorderer.reverse_playlist("PLxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx")
+
+        # One listing page, no per-item lookups
+        assert youtube.playlistItems.return_value.list.call_count == 1
+        assert youtube.playlistItems.return_value.update.call_count == 3
+        assert result["reversed"] == 4
+        assert result["failed"] == 0
+
+    def test_naive_reverse_moves_every_item(self, youtube):
+        """Test that the naive strategy keeps the one-update-per-item behaviour"""
+        youtube.playlistItems.return_value.list.return_value.execute.return_value = {
+            "items": [
+                {"id": f"item_{i}", "snippet": {"resourceId": {"videoId": f"video_{i}"}}}
+                for i in range(4)
+            ]
+        }
+        youtube.playlistItems.return_value.update.return_value.execute.return_value = {
+            "snippet": {"position": 0}
+        }
+        reorderer = PlaylistReorderer(youtube)
+
+        result = reorderer.reverse_playlist("PLxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", strategy="naive")
+
+        assert youtube.playlistItems.return_value.update.call_count == 4
+        assert result["reversed"] == 4
+
+    def test_items_cache_reuses_unmodified_listing(self, youtube, tmp_path):
+        """Test that a 304 on revalidation serves the stored listing"""
+        items = [{"id": "item_0", "snippet": {"resourceId": {"videoId": "video_0"}}}]
+        request = youtube.playlistItems.return_value.list.return_value
+        request.headers = {}
+        request.execute.side_effect = [
+            {"etag": "etag-1", "items": items},
+            HttpError(Mock(status=304, reason="Not Modified"), b""),
+        ]
+        path = str(tmp_path / "items.sqlite3")
+        PlaylistReorderer(youtube, items_cache=PlaylistItemsCache(path))._get_all_playlist_items("PLx")
+
+        # A fresh cache on the same file simulates a restart
+        reorderer = PlaylistReorderer(youtube, items_cache=PlaylistItemsCache(path))
+        assert reorderer._get_all_playlist_items("PLx") == items
+        assert request.headers["If-None-Match"] == "etag-1"
+
+    def test_async_reverse_matches_sync_moves(self, youtube):
+        """Test that the async variant issues the same planned updates"""
+        youtube.playlistItems.return_value.list.return_value.execute.return_value = {
+            "items": [
+                {"id": f"item_{i}", "snippet": {"resourceId": {"videoId": f"video_{i}"}}}
+                for i in range(4)
+            ]
+        }
+        youtube.playlistItems.return_value.update.return_value.execute.return_value = {
+            "snippet": {"position": 0}
+        }
+        reorderer = PlaylistReorderer(youtube)
+
+        result = asyncio.run(
+            reorderer.reverse_playlist_async("PLxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx")
+        )
+
+        assert youtube.playlistItems.return_value.update.call_count == 3
+        assert result["reversed"] == 4
+
+
+# Run tests with: pytest tests/test_playlist.py -v
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
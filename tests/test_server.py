@@ -4,6 +4,7 @@ Integration tests for YouTube MCP Server
 Tests server endpoints and API interactions
 """
 
+import asyncio
 import pytest
 import os
 from unittest.mock import Mock, patch, MagicMock
@@ -14,6 +15,38 @@ os.environ['CACHE_ENABLED'] = 'false'
 os.environ['RATE_LIMIT_ENABLED'] = 'false'
 
 
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Keep each test off the persistent cache dir and other tests' cached responses"""
+    import server
+    from diskcache import Cache
+    from utils import cache as cache_module
+
+    manager = cache_module.cache_manager
+    disk_cache = None
+    if manager.enabled:
+        # config may have been loaded with the cache on by another test module
+        manager.memory_cache.clear()
+        manager._fresh_until.clear()
+        disk_cache = Cache(str(tmp_path / 'cache'))
+        monkeypatch.setattr(manager, 'disk_cache', disk_cache)
+
+    cache_module._negative_cache.clear()
+    for store in (
+        server._channel_handle_cache,
+        server._etag_responses,
+        server._etag_comment_pages,
+        server._thread_replies,
+        server.comment_prefetcher._tasks
+    ):
+        store.clear()
+
+    yield
+
+    if disk_cache is not None:
+        disk_cache.close()
+
+
 class TestServerInitialization:
     """Test server startup and configuration"""
     
@@ -43,12 +76,10 @@ class TestServerInitialization:
 class TestVideoTranscriptTool:
     """Test get_video_transcript tool"""
     
-    @patch('server.YouTubeTranscriptApi')
-    def test_get_transcript_with_valid_video(self, mock_transcript_api):
+    @patch('server._list_transcripts')
+    def test_get_transcript_with_valid_video(self, mock_list_transcripts):
         """Test transcript retrieval with valid video"""
         import server
-        # Access the underlying function from the MCP tool
-        get_video_transcript = server.mcp.tools['get_video_transcript'].fn
         
         # Mock transcript data
         mock_transcript = Mock()
@@ -61,10 +92,10 @@ class TestVideoTranscriptTool:
         
         mock_transcript_list = Mock()
         mock_transcript_list.find_transcript.return_value = mock_transcript
-        mock_transcript_api.list_transcripts.return_value = mock_transcript_list
+        mock_list_transcripts.return_value = mock_transcript_list
         
         # Test
-        result = get_video_transcript("dQw4w9WgXcQ")
+        result = asyncio.run(server.get_video_transcript.fn("dQw4w9WgXcQ"))
         
         assert result['success'] is True
         assert 'transcript' in result
@@ -72,9 +103,9 @@ class TestVideoTranscriptTool:
     
     def test_get_transcript_with_invalid_video_id(self):
         """Test transcript with invalid video ID"""
-        from server import get_video_transcript
+        import server
         
-        result = get_video_transcript("invalid")
+        result = asyncio.run(server.get_video_transcript.fn("invalid"))
         
         assert result['success'] is False
         assert 'error' in result
@@ -86,7 +117,7 @@ class TestVideoInfoTool:
     @patch('server.youtube')
     def test_get_video_info_success(self, mock_youtube):
         """Test video info retrieval"""
-        from server import get_video_info
+        import server
         
         # Mock API response
         mock_response = {
@@ -114,7 +145,7 @@ class TestVideoInfoTool:
         
         mock_youtube.videos.return_value.list.return_value.execute.return_value = mock_response
         
-        result = get_video_info("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        result = asyncio.run(server.get_video_info.fn("https://www.youtube.com/watch?v=dQw4w9WgXcQ"))
         
         assert result['success'] is True
         assert result['title'] == 'Test Video'
@@ -122,14 +153,13 @@ class TestVideoInfoTool:
     
     def test_get_video_info_not_found(self):
         """Test video info with non-existent video"""
-        from server import get_video_info
         import server
         
         # Mock empty response
-        with patch.object(server.youtube.videos(), 'list') as mock_list:
-            mock_list.return_value.execute.return_value = {'items': []}
+        with patch('server.youtube.videos') as mock_videos:
+            mock_videos.return_value.list.return_value.execute.return_value = {'items': []}
             
-            result = get_video_info("dQw4w9WgXcQ")
+            result = asyncio.run(server.get_video_info.fn("dQw4w9WgXcQ"))
             
             assert result['success'] is False
             assert 'error' in result
@@ -141,7 +171,7 @@ class TestChannelInfoTool:
     @patch('server.youtube')
     def test_get_channel_info_with_id(self, mock_youtube):
         """Test channel info with channel ID"""
-        from server import get_channel_info
+        import server
         
         # Mock API response
         mock_response = {
@@ -165,17 +195,18 @@ class TestChannelInfoTool:
         
         mock_youtube.channels.return_value.list.return_value.execute.return_value = mock_response
         
-        result = get_channel_info("UC_x5XG1OV2P6uZZ5FSM9Ttw")
+        result = asyncio.run(server.get_channel_info.fn("UC_x5XG1OV2P6uZZ5FSM9Ttw"))
         
         assert result['success'] is True
         assert result['title'] == 'Google Developers'
         assert result['subscriber_count'] == 1000000
     
     def test_get_channel_info_with_username(self):
-        """Test channel info with @username"""
-        from server import get_channel_info, resolve_channel_handle
+        """Test channel info with an unresolved @username takes one call"""
+        import server
         
-        with patch('server.resolve_channel_handle', return_value='UC123'):
+        with patch('server._cached_channel_handle', return_value=None), \
+                patch('server._remember_channel_handle'):
             with patch('server.youtube.channels') as mock_channels:
                 mock_channels.return_value.list.return_value.execute.return_value = {
                     'items': [{
@@ -193,8 +224,24 @@ class TestChannelInfoTool:
                     }]
                 }
                 
-                result = get_channel_info("@testchannel")
+                result = asyncio.run(server.get_channel_info.fn("@testchannel"))
                 assert result['success'] is True
+                assert mock_channels.return_value.list.call_count == 1
+                assert mock_channels.return_value.list.call_args.kwargs['forHandle'] == 'testchannel'
+    
+    @patch('server.youtube')
+    def test_resolve_channel_handle_is_cached(self, mock_youtube):
+        """Test that a resolved @handle is not looked up twice"""
+        import server
+        server._channel_handle_cache.clear()
+        
+        mock_youtube.channels.return_value.list.return_value.execute.return_value = {
+            'items': [{'id': 'UC123'}]
+        }
+        
+        assert server.resolve_channel_handle('TestChannel') == 'UC123'
+        assert server.resolve_channel_handle('testchannel') == 'UC123'
+        assert mock_youtube.channels.return_value.list.call_count == 1
 
 
 class TestSearchVideosTool:
@@ -203,7 +250,7 @@ class TestSearchVideosTool:
     @patch('server.youtube')
     def test_search_videos_basic(self, mock_youtube):
         """Test basic video search"""
-        from server import search_videos
+        import server
         
         # Mock API response
         mock_response = {
@@ -233,7 +280,7 @@ class TestSearchVideosTool:
         
         mock_youtube.search.return_value.list.return_value.execute.return_value = mock_response
         
-        result = search_videos("Python tutorial", max_results=10)
+        result = asyncio.run(server.search_videos.fn("Python tutorial", max_results=10))
         
         assert result['success'] is True
         assert result['result_count'] == 2
@@ -241,15 +288,57 @@ class TestSearchVideosTool:
     
     def test_search_videos_with_order(self):
         """Test search with custom order"""
-        from server import search_videos
+        import server
         
         with patch('server.youtube.search') as mock_search:
             mock_search.return_value.list.return_value.execute.return_value = {'items': []}
             
-            result = search_videos("test", order="viewCount")
+            result = asyncio.run(server.search_videos.fn("test", order="viewCount"))
             
             assert result['success'] is True
             assert result['order'] == 'viewCount'
+    
+    @patch('server.youtube')
+    def test_search_videos_enrich(self, mock_youtube):
+        """Test that enrich merges video details into the results"""
+        import server
+        
+        mock_youtube.search.return_value.list.return_value.execute.return_value = {
+            'items': [
+                {
+                    'id': {'videoId': 'abc123'},
+                    'snippet': {
+                        'title': 'Python Tutorial',
+                        'description': 'Learn Python',
+                        'channelId': 'UC123',
+                        'channelTitle': 'Code Academy',
+                        'publishedAt': '2024-01-01T00:00:00Z'
+                    }
+                }
+            ]
+        }
+        mock_youtube.videos.return_value.list.return_value.execute.return_value = {
+            'items': [
+                {
+                    'id': 'abc123',
+                    'snippet': {
+                        'title': 'Python Tutorial',
+                        'channelId': 'UC123',
+                        'channelTitle': 'Code Academy',
+                        'publishedAt': '2024-01-01T00:00:00Z',
+                        'categoryId': '27'
+                    },
+                    'contentDetails': {'duration': 'PT10M'},
+                    'statistics': {'viewCount': '1000', 'likeCount': '50', 'commentCount': '5'}
+                }
+            ]
+        }
+        
+        result = asyncio.run(server.search_videos.fn("Python enrich", enrich=True))
+        
+        assert result['success'] is True
+        assert result['videos'][0]['duration'] == 'PT10M'
+        assert result['videos'][0]['view_count'] == 1000
 
 
 class TestCommentsTool:
@@ -258,7 +347,7 @@ class TestCommentsTool:
     @patch('server.youtube')
     def test_get_comments_basic(self, mock_youtube):
         """Test comment retrieval"""
-        from server import get_video_comments
+        import server
         
         # Mock API response
         mock_response = {
@@ -283,11 +372,102 @@ class TestCommentsTool:
         
         mock_youtube.commentThreads.return_value.list.return_value.execute.return_value = mock_response
         
-        result = get_video_comments("dQw4w9WgXcQ", max_results=10)
+        result = asyncio.run(server.get_video_comments.fn("dQw4w9WgXcQ", max_results=10))
         
         assert result['success'] is True
         assert result['comment_count'] >= 0
         assert 'comments' in result
+    
+    @patch('server.youtube')
+    def test_get_comments_fetches_missing_replies(self, mock_youtube):
+        """Test that replies beyond the embedded ones are fetched per thread"""
+        import server
+        server._thread_replies.clear()
+        
+        reply_snippet = {
+            'authorDisplayName': 'User 2',
+            'textDisplay': 'Agreed',
+            'likeCount': 1,
+            'publishedAt': '2024-01-02T00:00:00Z'
+        }
+        mock_response = {
+            'items': [
+                {
+                    'id': 'thread_with_more_replies',
+                    'snippet': {
+                        'topLevelComment': {
+                            'snippet': {
+                                'authorDisplayName': 'User 1',
+                                'textDisplay': 'Great video!',
+                                'likeCount': 10,
+                                'publishedAt': '2024-01-01T00:00:00Z',
+                                'updatedAt': '2024-01-01T00:00:00Z'
+                            }
+                        },
+                        'totalReplyCount': 8
+                    },
+                    'replies': {
+                        'comments': [{'id': 'reply1', 'snippet': reply_snippet}]
+                    }
+                }
+            ]
+        }
+        
+        mock_youtube.commentThreads.return_value.list.return_value.execute.return_value = mock_response
+        mock_youtube.comments.return_value.list.return_value.execute.return_value = {
+            'items': [{'id': f'reply{i}', 'snippet': reply_snippet} for i in range(8)]
+        }
+        
+        result = asyncio.run(server.get_video_comments.fn("aBcDeFgHiJk", max_results=10))
+        
+        assert result['success'] is True
+        assert len(result['comments'][0]['replies']) == 8
+        call_kwargs = mock_youtube.comments.return_value.list.call_args.kwargs
+        assert call_kwargs['parentId'] == 'thread_with_more_replies'
+    
+    @patch('server.youtube')
+    def test_get_comments_caps_reply_fetches(self, mock_youtube):
+        """Test that missing replies are fetched for a bounded number of threads"""
+        import server
+        
+        reply_snippet = {
+            'authorDisplayName': 'User 2',
+            'textDisplay': 'Agreed',
+            'likeCount': 1,
+            'publishedAt': '2024-01-02T00:00:00Z'
+        }
+        mock_youtube.commentThreads.return_value.list.return_value.execute.return_value = {
+            'items': [
+                {
+                    'id': f'thread{i}',
+                    'snippet': {
+                        'topLevelComment': {
+                            'snippet': {
+                                'authorDisplayName': 'User 1',
+                                'textDisplay': 'Great video!',
+                                'likeCount': 10,
+                                'publishedAt': '2024-01-01T00:00:00Z',
+                                'updatedAt': '2024-01-01T00:00:00Z'
+                            }
+                        },
+                        'totalReplyCount': 8
+                    },
+                    'replies': {
+                        'comments': [{'id': f'reply{i}', 'snippet': reply_snippet}]
+                    }
+                }
+                for i in range(server.MAX_REPLY_FETCHES_PER_CALL + 5)
+            ]
+        }
+        mock_youtube.comments.return_value.list.return_value.execute.return_value = {
+            'items': [{'id': f'reply{i}', 'snippet': reply_snippet} for i in range(8)]
+        }
+        
+        result = asyncio.run(server.get_video_comments.fn("aBcDeFgHiJk", max_results=20))
+        
+        assert result['success'] is True
+        assert mock_youtube.comments.return_value.list.call_count == server.MAX_REPLY_FETCHES_PER_CALL
+        assert len(result['comments'][-1]['replies']) == 1
 
 
 class TestServerStatsTool:
@@ -295,9 +475,9 @@ class TestServerStatsTool:
     
     def test_get_server_stats(self):
         """Test server statistics retrieval"""
-        from server import get_server_stats
+        import server
         
-        result = get_server_stats()
+        result = server.get_server_stats.fn()
         
         assert result['success'] is True
         assert 'cache' in result
@@ -316,7 +496,7 @@ class TestErrorHandling:
     
     def test_network_error_handling(self):
         """Test network error handling"""
-        from server import get_video_info
+        import server
         from googleapiclient.errors import HttpError
         
         with patch('server.youtube.videos') as mock_videos:
@@ -326,18 +506,32 @@ class TestErrorHandling:
                 content=b'Server Error'
             )
             
-            result = get_video_info("dQw4w9WgXcQ")
+            result = asyncio.run(server.get_video_info.fn("dQw4w9WgXcQ"))
             
             assert result['success'] is False
             assert 'error' in result
 
+    def test_only_transient_errors_retried(self):
+        """Test that quota errors fail at once while 5xx/429 are retried"""
+        from server import _is_transient
+        from googleapiclient.errors import HttpError
+
+        for status in (429, 500, 503):
+            assert _is_transient(HttpError(resp=Mock(status=status), content=b'')) is True
+        for status in (400, 403, 404):
+            assert _is_transient(HttpError(resp=Mock(status=status), content=b'')) is False
+        assert _is_transient(ValueError()) is False
+
 
 class TestInputSanitization:
     """Test that inputs are properly sanitized"""
     
-    def test_malicious_input_rejected(self):
+    @patch('server.youtube')
+    def test_malicious_input_rejected(self, mock_youtube):
         """Test that malicious inputs are rejected"""
-        from server import search_videos
+        import server
+        
+        mock_youtube.search.return_value.list.return_value.execute.return_value = {'items': []}
         
         # Try various malicious inputs
         malicious_inputs = [
@@ -347,7 +541,7 @@ class TestInputSanitization:
         ]
         
         for malicious_input in malicious_inputs:
-            result = search_videos(malicious_input)
+            result = asyncio.run(server.search_videos.fn(malicious_input))
             # Should either reject or sanitize
             assert isinstance(result, dict)
 
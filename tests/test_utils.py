@@ -191,6 +191,12 @@ class TestValidators:
         text = "  Hello World  "
         result = sanitize_text(text)
         assert result == "Hello World"
+    
+    def test_sanitize_text_removes_zero_width_chars(self):
+        """Test zero-width and bidi character removal"""
+        text = "Hel\u200blo\ufeff Wor\u202eld"
+        result = sanitize_text(text)
+        assert result == "Hello World"
 
 
 class TestCacheManagement:
@@ -236,6 +242,50 @@ class TestCacheManagement:
         result = cache_manager.get("test_key")
         assert result is None
     
+    def test_cache_disk_entries_compressed(self, temp_cache_dir, monkeypatch):
+        """Test disk entries are stored compressed and read back from disk"""
+        monkeypatch.setenv("CACHE_DIR", temp_cache_dir)
+        from utils.cache import cache_manager
+        
+        if not cache_manager.enabled:
+            pytest.skip("Cache disabled")
+        
+        value = {"text": "transcript " * 1000}
+        cache_manager.set("compressed_key", value)
+        assert isinstance(cache_manager.disk_cache.get("compressed_key"), bytes)
+        
+        # Force the disk read path
+        cache_manager.memory_cache.pop("compressed_key", None)
+        assert cache_manager.get("compressed_key") == value
+        cache_manager.delete("compressed_key")
+    
+    def test_cache_bytes_value_read_back_from_disk(self, temp_cache_dir, monkeypatch):
+        """Test that a bytes value survives the disk tier unchanged"""
+        monkeypatch.setenv("CACHE_DIR", temp_cache_dir)
+        from utils.cache import cache_manager
+        
+        if not cache_manager.enabled:
+            pytest.skip("Cache disabled")
+        
+        for compress in (True, False):
+            cache_manager.set("bytes_key", b"\x89PNG raw", compress=compress)
+            cache_manager.memory_cache.pop("bytes_key", None)
+            assert cache_manager.get("bytes_key") == b"\x89PNG raw"
+        cache_manager.delete("bytes_key")
+    
+    def test_cache_freshness_kept_with_disk_entry(self, temp_cache_dir, monkeypatch):
+        """Test an entry stays fresh after its in-memory freshness is evicted"""
+        monkeypatch.setenv("CACHE_DIR", temp_cache_dir)
+        from utils.cache import cache_manager
+        
+        if not cache_manager.enabled or cache_manager.encryption_enabled:
+            pytest.skip("Plain disk cache disabled")
+        
+        cache_manager.set("fresh_key", {"data": "test"}, ttl=60)
+        cache_manager._fresh_until.pop("fresh_key")
+        assert cache_manager.is_fresh("fresh_key") is True
+        cache_manager.delete("fresh_key")
+    
     def test_cache_stats(self, temp_cache_dir, monkeypatch):
         """Test cache statistics"""
         monkeypatch.setenv("CACHE_DIR", temp_cache_dir)
@@ -244,6 +294,24 @@ class TestCacheManagement:
         stats = cache_manager.get_stats()
         assert "enabled" in stats
         assert "memory_size" in stats or stats["enabled"] is False
+    
+    def test_cache_stats_count_hits_and_misses(self, temp_cache_dir, monkeypatch):
+        """Test that lookups are counted in the statistics"""
+        monkeypatch.setenv("CACHE_DIR", temp_cache_dir)
+        from utils.cache import cache_manager
+        
+        if not cache_manager.enabled:
+            pytest.skip("Cache disabled")
+        
+        hits, misses = cache_manager.hits, cache_manager.misses
+        cache_manager.set("test_stats_key", {"data": 1})
+        cache_manager.get("test_stats_key")
+        cache_manager.get("test_stats_missing_key")
+        cache_manager.delete("test_stats_key")
+        
+        stats = cache_manager.get_stats()
+        assert stats["hits"] == hits + 1
+        assert stats["misses"] == misses + 1
 
 
 class TestRateLimiter:
@@ -311,6 +379,32 @@ class TestRateLimiter:
         if stats.get("enabled"):
             assert stats["calls_last_minute"] == 0
 
+    def test_quota_bucket(self):
+        """Test that the quota budget is charged by cost"""
+        from utils.rate_limiter import QuotaBucket
+
+        bucket = QuotaBucket(daily_limit=150)
+        assert bucket.available(100) == (True, None)
+
+        bucket.spend(100)
+        allowed, wait_time = bucket.available(100)
+        assert allowed is False
+        assert wait_time > 0
+        assert bucket.available(1) == (True, None)
+        assert bucket.get_stats()["units_remaining"] == 50
+
+        empty = QuotaBucket(daily_limit=0)
+        assert empty.available(1) == (False, float("inf"))
+
+    def test_quota_try_spend(self):
+        """Test that try_spend charges only when the units are available"""
+        from utils.rate_limiter import QuotaBucket
+
+        bucket = QuotaBucket(daily_limit=150)
+        assert bucket.try_spend(100) is True
+        assert bucket.try_spend(100) is False
+        assert bucket.get_stats()["units_remaining"] == 50
+
 
 class TestIntegration:
     """Integration tests for combined functionality"""
@@ -350,6 +444,344 @@ class TestIntegration:
         result = test_function()
         assert result["success"] is True
 
+    
+    def test_cached_decorator_async(self):
+        """Test cached decorator on a coroutine function"""
+        import asyncio
+        from utils.cache import cached
+        
+        @cached(ttl=60)
+        async def test_function(arg):
+            return {"success": True, "data": arg}
+        
+        result = asyncio.run(test_function("async_test"))
+        assert result["success"] is True
+        assert result["data"] == "async_test"
+    
+    def test_cached_decorator_stale_while_revalidate(self):
+        """Test stale results are served while refreshing in the background"""
+        import asyncio
+        from utils.cache import cached, cache_manager
+        
+        if not cache_manager.enabled:
+            pytest.skip("Cache disabled")
+        
+        calls = []
+        
+        @cached(ttl=60, stale_ok=True)
+        async def test_function(arg):
+            calls.append(arg)
+            return {"success": True, "count": len(calls)}
+        
+        async def run():
+            first = await test_function("swr_test")
+            # Expire the entry without dropping it
+            key = cache_manager._generate_key("test_function", "swr_test")
+            cache_manager._fresh_until[key] = 0
+            stale = await test_function("swr_test")
+            await asyncio.sleep(0.01)
+            refreshed = await test_function("swr_test")
+            cache_manager.delete(key)
+            return first, stale, refreshed
+        
+        first, stale, refreshed = asyncio.run(run())
+        assert stale["count"] == first["count"]
+        assert refreshed["count"] == first["count"] + 1
+        assert len(calls) == 2
+    
+    def test_cached_hits_served_without_quota(self, monkeypatch):
+        """Test that quota is checked and charged on cache misses only"""
+        import sys
+        from utils.cache import cached, cache_manager
+        from utils.rate_limiter import QuotaBucket, rate_limited
+        
+        if not cache_manager.enabled:
+            pytest.skip("Cache disabled")
+        
+        bucket = QuotaBucket(daily_limit=150)
+        # utils.rate_limiter as an attribute is the RateLimiter instance
+        monkeypatch.setattr(sys.modules["utils.rate_limiter"], "quota_bucket", bucket)
+        
+        @rate_limited(endpoint="quota_test", cost=100)
+        @cached(ttl=60)
+        def test_function(arg):
+            return {"success": True, "data": arg, "cached": False}
+        
+        assert test_function("hit")["cached"] is False
+        assert bucket.get_stats()["units_remaining"] == 50
+        
+        # The budget no longer covers a miss, but a hit needs none
+        assert test_function("hit")["cached"] is True
+        assert test_function("miss")["limit_type"] == "quota"
+        assert bucket.get_stats()["units_remaining"] == 50
+        
+        for arg in ("hit", "miss"):
+            cache_manager.delete(cache_manager._generate_key("test_function", arg))
+    
+    def test_stale_refresh_charged_to_quota(self, monkeypatch):
+        """Test that a background refresh is charged, and skipped without quota"""
+        import asyncio
+        import sys
+        from utils.cache import cached, cache_manager
+        from utils.rate_limiter import QuotaBucket, rate_limited
+        
+        if not cache_manager.enabled:
+            pytest.skip("Cache disabled")
+        
+        bucket = QuotaBucket(daily_limit=250)
+        monkeypatch.setattr(sys.modules["utils.rate_limiter"], "quota_bucket", bucket)
+        calls = []
+        
+        @rate_limited(endpoint="refresh_quota_test", cost=100)
+        @cached(ttl=60, stale_ok=True)
+        async def test_function(arg):
+            calls.append(arg)
+            return {"success": True, "cached": False}
+        
+        async def serve_stale():
+            await test_function("swr_quota")
+            key = cache_manager._generate_key("test_function", "swr_quota")
+            cache_manager._fresh_until[key] = 0
+            await test_function("swr_quota")
+            await asyncio.sleep(0.01)
+            cache_manager._fresh_until[key] = 0
+            await test_function("swr_quota")
+            await asyncio.sleep(0.01)
+            cache_manager.delete(key)
+        
+        asyncio.run(serve_stale())
+        # Miss and first refresh cost 100 each; the second refresh is skipped
+        assert len(calls) == 2
+        assert bucket.get_stats()["units_remaining"] == 50
+    
+    def test_cached_decorator_coalesces_misses(self):
+        """Test concurrent misses for the same arguments share one call"""
+        import asyncio
+        from utils.cache import cached, cache_manager
+        
+        calls = []
+        
+        @cached(ttl=60)
+        async def test_function(arg):
+            calls.append(arg)
+            await asyncio.sleep(0.01)
+            return {"success": True, "data": arg}
+        
+        async def run_all():
+            return await asyncio.gather(*(test_function("coalesce_test") for _ in range(5)))
+        
+        results = asyncio.run(run_all())
+        cache_manager.delete(cache_manager._generate_key("test_function", "coalesce_test"))
+        assert all(result["data"] == "coalesce_test" for result in results)
+        assert calls == ["coalesce_test"]
+    
+    def test_cached_decorator_normalize(self):
+        """Test equivalent arguments share one cache entry"""
+        from utils.cache import cached, cache_manager
+        
+        if not cache_manager.enabled:
+            pytest.skip("Cache disabled")
+        
+        calls = []
+        
+        @cached(ttl=60, normalize={"video_url": validate_video_url})
+        def test_function(video_url, language="en"):
+            calls.append(video_url)
+            return {"success": True, "video_id": validate_video_url(video_url)}
+        
+        test_function("dQw4w9WgXcQ")
+        test_function("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        test_function(video_url="https://youtu.be/dQw4w9WgXcQ", language="en")
+        cache_manager.delete(cache_manager._generate_key("test_function", "dQw4w9WgXcQ", "en"))
+        assert len(calls) == 1
+
+    def test_cached_decorator_ttl_from_result(self):
+        """Test ttl can be computed from the result"""
+        from utils.cache import cached, cache_manager
+
+        if not cache_manager.enabled:
+            pytest.skip("Cache disabled")
+
+        @cached(ttl=lambda result: 0.1 if result["live"] else 60)
+        def test_function(live):
+            return {"success": True, "live": live}
+
+        test_function(True)
+        test_function(False)
+        time.sleep(0.2)
+        assert cache_manager.is_fresh(cache_manager._generate_key("test_function", True)) is False
+        assert cache_manager.is_fresh(cache_manager._generate_key("test_function", False)) is True
+
+
+class TestBatchScheduler:
+    """Test request coalescing"""
+    
+    def test_concurrent_lookups_share_one_fetch(self):
+        """Test that concurrent lookups are fetched in one batch"""
+        import asyncio
+        from utils.batch_scheduler import BatchScheduler
+        
+        batches = []
+        
+        def fetch(ids):
+            batches.append(ids)
+            return {i: {"id": i} for i in ids if i != "missing"}
+        
+        async def lookup_all():
+            scheduler = BatchScheduler(fetch)
+            return await asyncio.gather(
+                *(scheduler.get(i) for i in ["a", "b", "a", "missing"])
+            )
+        
+        results = asyncio.run(lookup_all())
+        
+        assert batches == [["a", "b", "missing"]]
+        assert results == [{"id": "a"}, {"id": "b"}, {"id": "a"}, None]
+    
+    def test_full_batch_flushes_immediately(self):
+        """Test that batches never exceed the per-request ID cap"""
+        import asyncio
+        from utils.batch_scheduler import BatchScheduler
+        
+        batches = []
+        
+        def fetch(ids):
+            batches.append(ids)
+            return {}
+        
+        async def lookup_all():
+            scheduler = BatchScheduler(fetch, max_batch=50)
+            await asyncio.gather(*(scheduler.get(str(i)) for i in range(120)))
+        
+        asyncio.run(lookup_all())
+        
+        assert [len(batch) for batch in batches] == [50, 50, 20]
+    
+    def test_dispatch_tasks_are_held_until_done(self):
+        """Test that in-flight batches are referenced and released afterwards"""
+        import asyncio
+        import threading
+        from utils.batch_scheduler import BatchScheduler
+        
+        release = threading.Event()
+        
+        def fetch(ids):
+            release.wait(timeout=5)
+            return {i: i for i in ids}
+        
+        async def lookup():
+            scheduler = BatchScheduler(fetch)
+            pending = asyncio.ensure_future(scheduler.get("a"))
+            await asyncio.sleep(scheduler.max_wait * 2)
+            in_flight = len(scheduler._tasks)
+            release.set()
+            await pending
+            await asyncio.sleep(0)
+            return in_flight, len(scheduler._tasks)
+        
+        in_flight, remaining = asyncio.run(lookup())
+        
+        assert in_flight == 1
+        assert remaining == 0
+
+
+class TestPagePrefetcher:
+    """Test read-ahead of paginated calls"""
+    
+    def test_prefetched_page_is_used_once(self):
+        """Test that a prefetched page replaces exactly one fetch"""
+        import asyncio
+        from utils.prefetcher import PagePrefetcher
+        
+        calls = []
+        
+        def fetch(video_id, page_token):
+            calls.append(page_token)
+            return {"page": page_token}
+        
+        async def read_pages():
+            prefetcher = PagePrefetcher(fetch)
+            prefetcher.prefetch("video", "page_2")
+            first = await prefetcher.get("video", "page_2")
+            second = await prefetcher.get("video", "page_2")
+            return first, second
+        
+        first, second = asyncio.run(read_pages())
+        
+        assert first == second == {"page": "page_2"}
+        assert calls == ["page_2", "page_2"]
+    
+    def test_claimed_prefetch_refunded(self, monkeypatch):
+        """Test that a claimed prefetch leaves only the caller's own charge"""
+        import asyncio
+        import sys
+        from utils.prefetcher import PagePrefetcher
+        from utils.rate_limiter import QuotaBucket
+        
+        bucket = QuotaBucket(daily_limit=10)
+        monkeypatch.setattr(sys.modules["utils.rate_limiter"], "quota_bucket", bucket)
+        
+        async def read_pages():
+            prefetcher = PagePrefetcher(lambda video_id, page_token: {"page": page_token})
+            prefetcher.prefetch("video", "page_2")
+            prefetcher.prefetch("video", "page_3")
+            await prefetcher.get("video", "page_2")
+        
+        asyncio.run(read_pages())
+        
+        # page_2 was claimed (refunded); page_3 never was
+        assert bucket.get_stats()["units_remaining"] == 9
+    
+    def test_prefetch_skipped_without_quota(self, monkeypatch):
+        """Test that a prefetch the quota budget cannot cover is not started"""
+        import asyncio
+        import sys
+        from utils.prefetcher import PagePrefetcher
+        from utils.rate_limiter import QuotaBucket
+        
+        calls = []
+        
+        def fetch(video_id, page_token):
+            calls.append(page_token)
+            return {"page": page_token}
+        
+        async def read_page():
+            prefetcher = PagePrefetcher(fetch)
+            prefetcher.prefetch("video", "page_2")
+            return await prefetcher.get("video", "page_2")
+        
+        # utils.rate_limiter as an attribute is the RateLimiter instance
+        monkeypatch.setattr(
+            sys.modules["utils.rate_limiter"], "quota_bucket", QuotaBucket(daily_limit=0)
+        )
+        
+        assert asyncio.run(read_page()) == {"page": "page_2"}
+        assert calls == ["page_2"]
+
+
+class TestSingleflight:
+    """Test duplicate call suppression"""
+    
+    def test_concurrent_duplicates_run_once(self):
+        """Test that identical concurrent calls share one execution"""
+        import asyncio
+        from utils.singleflight import singleflight
+        
+        calls = []
+        
+        @singleflight()
+        async def lookup(video_id):
+            calls.append(video_id)
+            await asyncio.sleep(0.01)
+            return {"success": True, "video_id": video_id}
+        
+        async def run_all():
+            return await asyncio.gather(lookup("a"), lookup("a"), lookup("b"))
+        
+        results = asyncio.run(run_all())
+        
+        assert calls == ["a", "b"]
+        assert results[0] == results[1] == {"success": True, "video_id": "a"}
 
 # Run tests with: pytest tests/test_utils.py -v
 if __name__ == "__main__":
@@ -12,7 +12,9 @@ from .cache import (
     set_cached,
     delete_cached,
     clear_cache,
-    cache_stats
+    cache_stats,
+    get_negative,
+    set_negative
 )
 
 from .rate_limiter import (
@@ -21,6 +23,11 @@ from .rate_limiter import (
     check_rate_limit,
     record_api_call,
     get_rate_stats,
+    get_quota_stats,
+    check_quota,
+    charge_quota,
+    refund_quota,
+    spend_quota,
     reset_rate_limits
 )
 
@@ -36,14 +43,27 @@ from .validators import (
     sanitize_text
 )
 
-from .oauth_metadata import (
-    OAuthResourceMetadata,
-    WWWAuthenticateChallenge,
-    OAuthMetadataProvider,
-    BearerTokenValidator,
-    OAuthMiddleware,
-    create_oauth_config
-)
+from .batch_scheduler import BatchScheduler
+from .prefetcher import PagePrefetcher
+from .singleflight import singleflight
+
+# OAuth metadata (RFC 9728) is only used in HTTP mode, so it is imported
+# on first access instead of with the package
+_OAUTH_METADATA_NAMES = frozenset({
+    'OAuthResourceMetadata',
+    'WWWAuthenticateChallenge',
+    'OAuthMetadataProvider',
+    'BearerTokenValidator',
+    'OAuthMiddleware',
+    'create_oauth_config'
+})
+
+
+def __getattr__(name):
+    if name in _OAUTH_METADATA_NAMES:
+        from . import oauth_metadata
+        return getattr(oauth_metadata, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     # Cache
@@ -55,6 +75,8 @@ __all__ = [
     'delete_cached',
     'clear_cache',
     'cache_stats',
+    'get_negative',
+    'set_negative',
     
     # Rate Limiter
     'rate_limiter',
@@ -62,6 +84,11 @@ __all__ = [
     'check_rate_limit',
     'record_api_call',
     'get_rate_stats',
+    'get_quota_stats',
+    'check_quota',
+    'charge_quota',
+    'refund_quota',
+    'spend_quota',
     'reset_rate_limits',
     
     # Validators
@@ -75,6 +102,11 @@ __all__ = [
     'validate_order',
     'sanitize_text',
     
+    # Request coalescing
+    'BatchScheduler',
+    'PagePrefetcher',
+    'singleflight',
+    
     # OAuth Metadata (RFC 9728)
     'OAuthResourceMetadata',
     'WWWAuthenticateChallenge',
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Request coalescing for YouTube MCP Server
+Collects concurrent lookups by ID into one list call
+
+Features:
+- Flushes after a short wait or once a batch is full (50 IDs per request)
+- Concurrent lookups of the same ID share one result
+- Fetches run in a worker thread so the event loop is never blocked
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of IDs the Data API accepts in one list request
+MAX_IDS_PER_REQUEST = 50
+
+
+class BatchScheduler:
+    """
+    Coalesces lookups by ID into batched fetches
+
+    fetch receives a list of IDs and returns a dict of the items it found,
+    keyed by ID. Missing IDs resolve to None; a failed fetch raises its
+    exception in every waiting caller.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[List[str]], Dict[str, Any]],
+        max_batch: int = MAX_IDS_PER_REQUEST,
+        max_wait: float = 0.01
+    ):
+        """
+        Initialize batch scheduler
+
+        Args:
+            fetch: Blocking function that looks up a batch of IDs
+            max_batch: Flush as soon as this many IDs are pending
+            max_wait: Seconds to wait for more IDs before flushing
+        """
+        self._fetch = fetch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The event loop holds only weak references to tasks; keep dispatches alive
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Look up one ID as part of the next batch
+
+        Args:
+            key: ID to look up
+
+        Returns:
+            Item returned by fetch, or None if it was not found
+        """
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.max_wait, self._flush)
+
+        # A cancelled caller must not cancel the lookup for the others
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        """Dispatch all pending IDs as one batch"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: Dict[str, asyncio.Future]) -> None:
+        """Fetch one batch and resolve its futures"""
+        logger.debug("Dispatching batch of %d IDs", len(batch))
+        try:
+            results = await asyncio.to_thread(self._fetch, list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
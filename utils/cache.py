@@ -5,20 +5,36 @@ Implements hybrid caching strategy with memory and disk layers
 Includes automatic cleanup and size management
 """
 
+import asyncio
 import json
 import hashlib
+import inspect
 import logging
 import os
 import time
 import threading
-from typing import Any, Optional, Callable
+import zlib
+from typing import Any, Optional, Callable, Dict, Hashable, Union
 from functools import wraps
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from cachetools import TTLCache
+from cachetools import LRUCache, TTLCache
 from diskcache import Cache
 from config import config
+from utils.singleflight import singleflight
+from utils.rate_limiter import charge_quota, check_quota, spend_quota
+
+# Optional faster codecs for compressed entries
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 # Import encrypted cache (v2.1)
 try:
@@ -33,6 +49,37 @@ if not ENCRYPTION_AVAILABLE:
     logger.warning("⚠️  Encrypted cache not available - install cryptography package")
 
 
+# Compressed disk entries are tagged with their codec; values that are
+# bytes themselves are tagged as raw so reads can tell them apart
+_ZSTD_TAG = b"zst1"
+_ZLIB_TAG = b"zlb1"
+_RAW_TAG = b"raw1"
+
+
+def _compress_value(value: Any) -> bytes:
+    """Serialize a JSON-compatible value and compress it (zstd, else zlib)"""
+    data = orjson.dumps(value) if orjson else json.dumps(value).encode()
+    if zstandard:
+        return _ZSTD_TAG + zstandard.ZstdCompressor(level=3).compress(data)
+    return _ZLIB_TAG + zlib.compress(data, 6)
+
+
+def _decompress_value(blob: bytes) -> Any:
+    """Reverse _compress_value (or the raw tag of a bytes value)"""
+    tag, payload = blob[:4], blob[4:]
+    if tag == _RAW_TAG:
+        return payload
+    if tag == _ZSTD_TAG:
+        if zstandard is None:
+            raise ValueError("zstandard is required to read this entry")
+        data = zstandard.ZstdDecompressor().decompress(payload)
+    elif tag == _ZLIB_TAG:
+        data = zlib.decompress(payload)
+    else:
+        raise ValueError("Unknown compressed entry format")
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
 class CacheManager:
     """Manages two-tier caching: memory (fast) + disk (persistent) with automatic cleanup"""
     
@@ -40,6 +87,10 @@ class CacheManager:
         """Initialize cache manager with memory and disk caches"""
         self.enabled = config.cache.enabled
         
+        # Plain counters keep lookups cheap; stats and metrics read them
+        self.hits = 0
+        self.misses = 0
+        
         if self.enabled:
             # Memory cache - fast, limited size
             self.memory_cache = TTLCache(
@@ -58,12 +109,22 @@ class CacheManager:
                 )
                 logger.info("🔐 Using encrypted disk cache (Fernet/AES-128)")
             else:
-                self.disk_cache = Cache(config.cache.cache_dir)
+                # Evict least recently read entries once the size limit is reached
+                self.disk_cache = Cache(
+                    config.cache.cache_dir,
+                    size_limit=config.cache.max_disk_size_mb * 1024 * 1024,
+                    eviction_policy="least-recently-used"
+                )
                 if config.cache.encryption_enabled:
                     logger.warning("⚠️  Encryption enabled but cryptography not installed")
             
             self.encryption_enabled = use_encryption
             
+            # When each recently used entry stops being fresh (see is_fresh);
+            # sized like the memory tier, since the disk copy carries its own
+            self._fresh_until = LRUCache(maxsize=config.cache.max_memory_items)
+            self._fresh_lock = threading.Lock()
+            
             # Cleanup configuration
             self.max_disk_size_bytes = config.cache.max_disk_size_mb * 1024 * 1024
             self.cleanup_interval_seconds = config.cache.cleanup_interval_hours * 3600
@@ -114,50 +175,117 @@ class CacheManager:
         # Try memory cache first (fastest)
         value = self.memory_cache.get(key)
         if value is not None:
-            logger.debug(f"Cache HIT (memory): {key[:16]}...")
+            self.hits += 1
+            logger.debug("Cache HIT (memory): %.16s...", key)
             return value
         
         # Try disk cache
-        value = self.disk_cache.get(key)
+        if self.encryption_enabled:
+            value = self.disk_cache.get(key)
+        else:
+            value, fresh_until = self.disk_cache.get(key, tag=True)
+            if fresh_until is not None:
+                with self._fresh_lock:
+                    self._fresh_until[key] = fresh_until
+        if isinstance(value, bytes):
+            try:
+                value = _decompress_value(value)
+            except (ValueError, zlib.error) as e:
+                logger.warning(f"Dropping unreadable cache entry {key[:16]}...: {e}")
+                self.disk_cache.delete(key)
+                value = None
         if value is not None:
-            logger.debug(f"Cache HIT (disk): {key[:16]}...")
+            self.hits += 1
+            logger.debug("Cache HIT (disk): %.16s...", key)
             # Promote to memory cache
             self.memory_cache[key] = value
             return value
         
-        logger.debug(f"Cache MISS: {key[:16]}...")
+        self.misses += 1
+        logger.debug("Cache MISS: %.16s...", key)
         return None
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set value in both memory and disk caches"""
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        compress: bool = True,
+        stale_ttl: Optional[int] = None
+    ) -> None:
+        """
+        Set value in both memory and disk caches
+        
+        With compress=True (the default) the disk copy is stored as a
+        compressed JSON blob; values that are not JSON-serializable are
+        stored as they are, and bytes values are stored tagged as raw.
+        
+        The entry is fresh for ttl seconds. With stale_ttl the disk copy is
+        kept that long, so it can still be served as stale afterwards.
+        """
         if not self.enabled:
             return
         
         ttl = ttl or config.cache.ttl_seconds
+        fresh_until = time.time() + ttl
+        with self._fresh_lock:
+            self._fresh_until[key] = fresh_until
         
         # Store in both caches
         self.memory_cache[key] = value
+        if isinstance(value, bytes):
+            value = _RAW_TAG + value
+        elif compress:
+            try:
+                value = _compress_value(value)
+            except TypeError:
+                logger.debug("Storing uncompressed (not JSON-serializable): %.16s...", key)
+        
+        expire = max(ttl, stale_ttl or 0)
         
         # Encrypted cache uses different API
         if self.encryption_enabled:
-            self.disk_cache.set(key, value, ttl=ttl)
+            self.disk_cache.set(key, value, ttl=expire)
         else:
-            self.disk_cache.set(key, value, expire=ttl)
+            # The disk copy keeps its freshness as the entry tag, so it
+            # outlives eviction from _fresh_until and restarts
+            self.disk_cache.set(key, value, expire=expire, tag=fresh_until)
         
-        logger.debug(f"Cache SET: {key[:16]}... (ttl={ttl}s)")
+        logger.debug("Cache SET: %.16s... (ttl=%ss)", key, ttl)
         
         # Check if cleanup is needed
         self._check_cleanup_needed()
     
+    def is_fresh(self, key: str) -> bool:
+        """
+        Check whether an entry is still within its ttl
+        
+        Falls back to the freshness stored with the disk copy; entries of
+        the encrypted cache that are not tracked in memory count as stale.
+        """
+        if not self.enabled:
+            return False
+        
+        with self._fresh_lock:
+            fresh_until = self._fresh_until.get(key)
+        if fresh_until is None and not self.encryption_enabled:
+            _, fresh_until = self.disk_cache.get(key, tag=True)
+            if fresh_until is not None:
+                with self._fresh_lock:
+                    self._fresh_until[key] = fresh_until
+        return time.time() < (fresh_until or 0)
+    
     def delete(self, key: str) -> None:
         """Delete value from both caches"""
         if not self.enabled:
             return
         
         self.memory_cache.pop(key, None)
+        with self._fresh_lock:
+            self._fresh_until.pop(key, None)
         self.disk_cache.delete(key)
         
-        logger.debug(f"Cache DELETE: {key[:16]}...")
+        logger.debug("Cache DELETE: %.16s...", key)
     
     def clear(self) -> None:
         """Clear all caches"""
@@ -166,6 +294,8 @@ class CacheManager:
         
         self.memory_cache.clear()
         self.disk_cache.clear()
+        with self._fresh_lock:
+            self._fresh_until.clear()
         
         logger.info("Cache cleared")
     
@@ -196,6 +326,10 @@ class CacheManager:
         if not self.enabled:
             return 0
         
+        # diskcache tracks its size in metadata; only other stores are walked
+        if hasattr(self.disk_cache, "volume"):
+            return self.disk_cache.volume()
+        
         try:
             cache_dir = Path(config.cache.cache_dir)
             if not cache_dir.exists():
@@ -280,9 +414,13 @@ class CacheManager:
             return {"enabled": False}
         
         disk_size_bytes = self.get_disk_cache_size()
+        lookups = self.hits + self.misses
         
         stats = {
             "enabled": True,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
             "memory_size": len(self.memory_cache),
             "memory_maxsize": self.memory_cache.maxsize,
             "disk_size": len(self.disk_cache),
@@ -305,36 +443,201 @@ class CacheManager:
 cache_manager = CacheManager()
 
 
-def cached(ttl: Optional[int] = None):
+def cached(
+    ttl: Union[int, Callable[[Any], int], None] = None,
+    compress: bool = True,
+    stale_ok: bool = False,
+    normalize: Optional[Dict[str, Callable[[Any], Any]]] = None
+):
     """
     Decorator to cache function results
     
+    Args:
+        ttl: Seconds to keep results (config default if None), or a
+            function of the result returning them
+        compress: Store the disk copy compressed (see CacheManager.set)
+        stale_ok: Stale-while-revalidate; for a second ttl after a result
+            expires it is still returned, while a refresh runs in the background
+        normalize: Parameter name -> function giving its canonical value;
+            the key is then built from all parameters (defaults filled in),
+            so equivalent calls share one entry
+    
     Usage:
         @cached(ttl=3600)
         def expensive_function(arg1, arg2):
             # ... do work
             return result
+        
+        @cached(ttl=1800, normalize={"video_url": validate_video_url})
+        def get_video_info(video_url):
+            # ... URL and ID forms of a video share one entry
+    
+    Works on both plain functions and coroutine functions. Concurrent
+    misses for the same key share one call (see singleflight).
     """
+    ttl_for = ttl if callable(ttl) else lambda result: ttl
+    
     def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func) if normalize else None
+        
+        # Parameter layout, read once so cache hits skip Signature.bind
+        # (only for plain parameters; others are bound per call)
+        names = defaults = None
+        if signature is not None and all(
+            param.kind is param.POSITIONAL_OR_KEYWORD for param in signature.parameters.values()
+        ):
+            names = tuple(signature.parameters)
+            defaults = {
+                name: param.default for name, param in signature.parameters.items()
+                if param.default is not param.empty
+            }
+        
+        def bind(args, kwargs) -> Dict[str, Any]:
+            if names is None:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                return dict(bound.arguments)
+            if len(args) > len(names) or not kwargs.keys().isdisjoint(names[:len(args)]):
+                raise TypeError("invalid arguments")
+            arguments = {**defaults, **dict(zip(names, args)), **kwargs}
+            if len(arguments) != len(names):
+                raise TypeError("missing or unexpected arguments")
+            return {name: arguments[name] for name in names}
+        
+        def make_key(*args, **kwargs) -> str:
+            if signature is not None:
+                try:
+                    arguments = bind(args, kwargs)
+                    for name, canonical in normalize.items():
+                        arguments[name] = canonical(arguments[name])
+                    return cache_manager._generate_key(func.__name__, *arguments.values())
+                except Exception:
+                    # Invalid arguments are keyed as given; the call reports the error
+                    pass
+            return cache_manager._generate_key(func.__name__, *args, **kwargs)
+        
+        func = singleflight(key=make_key)(func)
+        
+        # Quota units per call, set by rate_limited when it wraps this
+        # function; checked and charged here so cache hits never need quota
+        deferred_quota = {"cost": 0}
+        
+        def rejected_for_quota():
+            cost = deferred_quota["cost"]
+            return check_quota(cost) if cost else None
+        
+        def charge(result):
+            cost = deferred_quota["cost"]
+            if cost and isinstance(result, dict) and result.get("success"):
+                charge_quota(cost)
+        
+        # Keys with a background refresh running (refreshes of sync
+        # functions run in threads, so it is guarded by a lock)
+        refreshing = set()
+        refreshing_lock = threading.Lock()
+        # The event loop holds only weak references to tasks; keep refreshes alive
+        refresh_tasks = set()
+        
+        def hit(result):
+            # Mark results served from cache (they cost no API quota)
+            if isinstance(result, dict) and "cached" in result:
+                return {**result, "cached": True}
+            return result
+        
+        def store(cache_key, result):
+            # Cache result if successful
+            if result and isinstance(result, dict) and result.get("success"):
+                result_ttl = ttl_for(result) or config.cache.ttl_seconds
+                stale_ttl = result_ttl * 2 if stale_ok else None
+                cache_manager.set(cache_key, result, ttl=result_ttl, compress=compress, stale_ttl=stale_ttl)
+        
+        def needs_refresh(cache_key):
+            if not stale_ok or cache_manager.is_fresh(cache_key):
+                return False
+            with refreshing_lock:
+                if cache_key in refreshing:
+                    return False
+                refreshing.add(cache_key)
+            # The refresh calls the API below rate_limited, so it is charged
+            # here, and skipped (the stale result still served) when short
+            cost = deferred_quota["cost"]
+            if cost and not spend_quota(cost):
+                with refreshing_lock:
+                    refreshing.discard(cache_key)
+                logger.debug("Serving stale %s result, quota too low to refresh: %.16s...", func.__name__, cache_key)
+                return False
+            logger.debug("Serving stale %s result, refreshing: %.16s...", func.__name__, cache_key)
+            return True
+        
+        if inspect.iscoroutinefunction(func):
+            async def refresh(cache_key, args, kwargs):
+                try:
+                    store(cache_key, await func(*args, **kwargs))
+                except Exception as e:
+                    logger.warning(f"Background refresh of {func.__name__} failed: {e}")
+                finally:
+                    with refreshing_lock:
+                        refreshing.discard(cache_key)
+            
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache_key = make_key(*args, **kwargs)
+                
+                cached_result = cache_manager.get(cache_key)
+                if cached_result is not None:
+                    if needs_refresh(cache_key):
+                        task = asyncio.ensure_future(refresh(cache_key, args, kwargs))
+                        refresh_tasks.add(task)
+                        task.add_done_callback(refresh_tasks.discard)
+                    return hit(cached_result)
+                
+                rejected = rejected_for_quota()
+                if rejected:
+                    return rejected
+                
+                result = await func(*args, **kwargs)
+                store(cache_key, result)
+                charge(result)
+                return result
+            
+            async_wrapper.deferred_quota = deferred_quota
+            return async_wrapper
+        
+        def refresh_sync(cache_key, args, kwargs):
+            try:
+                store(cache_key, func(*args, **kwargs))
+            except Exception as e:
+                logger.warning(f"Background refresh of {func.__name__} failed: {e}")
+            finally:
+                with refreshing_lock:
+                    refreshing.discard(cache_key)
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Generate cache key
-            cache_key = cache_manager._generate_key(func.__name__, *args, **kwargs)
+            cache_key = make_key(*args, **kwargs)
             
             # Try to get from cache
             cached_result = cache_manager.get(cache_key)
             if cached_result is not None:
-                return cached_result
+                if needs_refresh(cache_key):
+                    threading.Thread(
+                        target=refresh_sync, args=(cache_key, args, kwargs), daemon=True
+                    ).start()
+                return hit(cached_result)
+            
+            rejected = rejected_for_quota()
+            if rejected:
+                return rejected
             
             # Execute function
             result = func(*args, **kwargs)
-            
-            # Cache result if successful
-            if result and isinstance(result, dict) and result.get("success"):
-                cache_manager.set(cache_key, result, ttl=ttl)
+            store(cache_key, result)
+            charge(result)
             
             return result
         
+        wrapper.deferred_quota = deferred_quota
         return wrapper
     return decorator
 
@@ -344,15 +647,40 @@ def cache_key(*args, **kwargs) -> str:
     return cache_manager._generate_key("manual", *args, **kwargs)
 
 
+# Known-missing resources; @cached only stores successes, so without this
+# every repeated lookup of a missing video or transcript hits the API again
+_negative_cache: TTLCache = TTLCache(maxsize=100_000, ttl=3600)
+_negative_lock = threading.Lock()
+
+
+def get_negative(key: Hashable) -> Optional[dict]:
+    """Get the stored failure response for a resource known to be missing"""
+    with _negative_lock:
+        return _negative_cache.get(key)
+
+
+def set_negative(key: Hashable, response: dict) -> dict:
+    """Remember that a resource is missing for an hour; returns response"""
+    with _negative_lock:
+        _negative_cache[key] = response
+    return response
+
+
 # Convenience functions
 def get_cached(key: str) -> Optional[Any]:
     """Get value from cache"""
     return cache_manager.get(key)
 
 
-def set_cached(key: str, value: Any, ttl: Optional[int] = None) -> None:
+def set_cached(
+    key: str,
+    value: Any,
+    ttl: Optional[int] = None,
+    compress: bool = True,
+    stale_ttl: Optional[int] = None
+) -> None:
     """Set value in cache"""
-    cache_manager.set(key, value, ttl)
+    cache_manager.set(key, value, ttl, compress=compress, stale_ttl=stale_ttl)
 
 
 def delete_cached(key: str) -> None:
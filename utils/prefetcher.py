@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Read-ahead for paginated API calls in YouTube MCP Server
+Starts fetching the next page while the current one is being consumed
+
+Features:
+- One in-flight fetch per key, handed over to the caller that asks for it
+- Unclaimed fetches expire after a TTL
+- Each prefetch is charged to the quota budget, and skipped when it is short;
+  the charge is refunded when the page is claimed, since that call is charged
+- Fetches run in a worker thread so the event loop is never blocked
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Hashable
+
+from cachetools import TTLCache
+
+from .rate_limiter import refund_quota, spend_quota
+
+logger = logging.getLogger(__name__)
+
+
+class PagePrefetcher:
+    """
+    Keeps read-ahead fetches keyed by the arguments they were started with
+
+    fetch is a blocking function; each key is the tuple of its arguments.
+    A prefetched page is used at most once, and a failed prefetch falls
+    back to a fresh fetch.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Any],
+        maxsize: int = 128,
+        ttl: int = 300,
+        cost: int = 1
+    ):
+        """
+        Initialize page prefetcher
+
+        Args:
+            fetch: Blocking function that fetches one page
+            maxsize: Maximum number of pending prefetches kept
+            ttl: Seconds an unclaimed prefetch is kept
+            cost: Quota units charged per prefetch; no tool call pays for a
+                page that is never claimed, so the read-ahead pays up front
+                and is refunded once the page is claimed
+        """
+        self._fetch = fetch
+        self.cost = cost
+        self._tasks: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, *key: Hashable) -> Any:
+        """
+        Get a page, using a prefetched result when one is available
+
+        Args:
+            *key: Arguments passed to fetch
+        """
+        task = self._tasks.pop(key, None)
+        if task is not None:
+            try:
+                result = await asyncio.shield(task)
+                logger.debug("Prefetch hit: %s", key)
+                # The caller is charged for this page; drop the read-ahead charge
+                if self.cost:
+                    refund_quota(self.cost)
+                return result
+            except Exception as e:
+                logger.debug("Prefetch failed, fetching again: %s", e)
+
+        return await asyncio.to_thread(self._fetch, *key)
+
+    def prefetch(self, *key: Hashable) -> None:
+        """
+        Start fetching a page in the background
+
+        Args:
+            *key: Arguments passed to fetch
+        """
+        if key in self._tasks:
+            return
+        if self.cost and not spend_quota(self.cost):
+            logger.debug("Skipping prefetch, quota budget is low: %s", key)
+            return
+
+        task = asyncio.ensure_future(asyncio.to_thread(self._fetch, *key))
+        # Unclaimed tasks may fail unobserved; retrieve the error so it is not reported
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._tasks[key] = task
@@ -6,10 +6,14 @@ Protects against API quota exhaustion and abuse
 Features:
 - Global rate limiting (per-minute and per-hour)
 - Per-IP rate limiting (NEW in v2.1)
+- Shared daily API quota budget, charged per endpoint cost
 - Thread-safe implementation
 - Configurable limits
 """
 
+import asyncio
+import inspect
+import math
 import time
 import logging
 from typing import Callable, Optional, Dict, Tuple
@@ -56,7 +60,7 @@ class RateLimiter:
             }))
             
             # Track last cleanup time for IP entries
-            self.last_cleanup = time.time()
+            self.last_cleanup = time.monotonic()
             self.cleanup_interval = 3600  # Clean up stale IPs every hour
             
             # Thread safety
@@ -70,40 +74,34 @@ class RateLimiter:
         else:
             logger.info("Rate limiting disabled")
     
-    def _cleanup_old_calls(self, endpoint: str) -> None:
-        """Remove calls older than the time window (global)"""
-        current_time = time.time()
-        history = self.call_history[endpoint]
+    @staticmethod
+    def _expire(history: Dict[str, deque], current_time: float) -> None:
+        """Drop timestamps that fell out of the minute and hour windows"""
+        minute, hour = history['minute'], history['hour']
         
         # Remove minute-old calls
-        while history['minute'] and current_time - history['minute'][0] > 60:
-            history['minute'].popleft()
+        minute_cutoff = current_time - 60
+        while minute and minute[0] < minute_cutoff:
+            minute.popleft()
         
         # Remove hour-old calls
-        while history['hour'] and current_time - history['hour'][0] > 3600:
-            history['hour'].popleft()
+        hour_cutoff = current_time - 3600
+        while hour and hour[0] < hour_cutoff:
+            hour.popleft()
+    
+    def _cleanup_old_calls(self, endpoint: str, current_time: float) -> None:
+        """Remove calls older than the time window (global)"""
+        self._expire(self.call_history[endpoint], current_time)
     
-    def _cleanup_old_calls_for_ip(self, ip_address: str, endpoint: str) -> None:
+    def _cleanup_old_calls_for_ip(self, ip_address: str, endpoint: str, current_time: float) -> None:
         """Remove calls older than the time window for specific IP"""
-        current_time = time.time()
-        
         if ip_address not in self.ip_call_history:
             return
         
-        history = self.ip_call_history[ip_address][endpoint]
-        
-        # Remove minute-old calls
-        while history['minute'] and current_time - history['minute'][0] > 60:
-            history['minute'].popleft()
-        
-        # Remove hour-old calls
-        while history['hour'] and current_time - history['hour'][0] > 3600:
-            history['hour'].popleft()
+        self._expire(self.ip_call_history[ip_address][endpoint], current_time)
     
-    def _cleanup_stale_ips(self) -> None:
+    def _cleanup_stale_ips(self, current_time: float) -> None:
         """Remove IP entries with no recent activity"""
-        current_time = time.time()
-        
         # Only cleanup once per interval
         if current_time - self.last_cleanup < self.cleanup_interval:
             return
@@ -150,16 +148,17 @@ class RateLimiter:
         if not self.enabled:
             return True, None, None
         
+        # One clock read serves every window check below
+        current_time = time.monotonic()
+        
         with self.lock:
             # Periodic cleanup of stale IPs
-            self._cleanup_stale_ips()
+            self._cleanup_stale_ips(current_time)
             
             # Check global limits first
-            self._cleanup_old_calls(endpoint)
+            self._cleanup_old_calls(endpoint, current_time)
             history = self.call_history[endpoint]
             
-            current_time = time.time()
-            
             # Check global per-minute limit
             if len(history['minute']) >= self.calls_per_minute:
                 oldest_call = history['minute'][0]
@@ -182,7 +181,7 @@ class RateLimiter:
             
             # Check per-IP limits if enabled and IP provided
             if self.per_ip_enabled and ip_address:
-                self._cleanup_old_calls_for_ip(ip_address, endpoint)
+                self._cleanup_old_calls_for_ip(ip_address, endpoint, current_time)
                 ip_history = self.ip_call_history[ip_address][endpoint]
                 
                 # Check per-IP per-minute limit
@@ -222,9 +221,9 @@ class RateLimiter:
         if not self.enabled:
             return
         
+        current_time = time.monotonic()
+        
         with self.lock:
-            current_time = time.time()
-            
             # Record in global history
             history = self.call_history[endpoint]
             history['minute'].append(current_time)
@@ -237,15 +236,17 @@ class RateLimiter:
                 ip_history['hour'].append(current_time)
                 
                 logger.debug(
-                    f"Rate limit: {endpoint} from {ip_address} - "
-                    f"Global: {len(history['minute'])}/{self.calls_per_minute} (min), "
-                    f"Per-IP: {len(ip_history['minute'])}/{self.per_ip_calls_per_minute} (min)"
+                    "Rate limit: %s from %s - Global: %d/%d (min), Per-IP: %d/%d (min)",
+                    endpoint, ip_address,
+                    len(history['minute']), self.calls_per_minute,
+                    len(ip_history['minute']), self.per_ip_calls_per_minute
                 )
             else:
                 logger.debug(
-                    f"Rate limit: {endpoint} - "
-                    f"{len(history['minute'])}/{self.calls_per_minute} (minute), "
-                    f"{len(history['hour'])}/{self.calls_per_hour} (hour)"
+                    "Rate limit: %s - %d/%d (minute), %d/%d (hour)",
+                    endpoint,
+                    len(history['minute']), self.calls_per_minute,
+                    len(history['hour']), self.calls_per_hour
                 )
     
     def get_stats(
@@ -263,8 +264,10 @@ class RateLimiter:
         if not self.enabled:
             return {"enabled": False}
         
+        current_time = time.monotonic()
+        
         with self.lock:
-            self._cleanup_old_calls(endpoint)
+            self._cleanup_old_calls(endpoint, current_time)
             history = self.call_history[endpoint]
             
             stats = {
@@ -282,7 +285,7 @@ class RateLimiter:
             
             # Add per-IP stats if requested
             if self.per_ip_enabled and ip_address:
-                self._cleanup_old_calls_for_ip(ip_address, endpoint)
+                self._cleanup_old_calls_for_ip(ip_address, endpoint, current_time)
                 ip_history = self.ip_call_history[ip_address][endpoint]
                 
                 stats["per_ip"] = {
@@ -343,11 +346,119 @@ class RateLimiter:
                 logger.info("All rate limits reset")
 
 
+class QuotaBucket:
+    """
+    Token bucket of YouTube Data API quota units shared by all endpoints
+    
+    Holds up to one day of quota and refills continuously at the daily
+    rate, so bursts are allowed while the budget lasts and expensive calls
+    (search: 100 units) throttle the cheap ones once it runs low.
+    """
+    
+    def __init__(self, daily_limit: int):
+        """
+        Initialize quota bucket
+        
+        Args:
+            daily_limit: Quota units available per 24 hours
+        """
+        self.capacity = float(daily_limit)
+        self.refill_per_second = daily_limit / 86400
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = Lock()
+    
+    def _refill(self, current_time: float) -> None:
+        """Add the units accrued since the last refill (caller holds the lock)"""
+        elapsed = current_time - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+        self.last_refill = current_time
+    
+    def available(self, cost: int) -> Tuple[bool, Optional[float]]:
+        """
+        Check whether cost units are available
+        
+        Returns:
+            (allowed, seconds until they are available when not allowed;
+            infinite when the daily limit is 0)
+        """
+        current_time = time.monotonic()
+        with self.lock:
+            self._refill(current_time)
+            if self.tokens >= cost:
+                return True, None
+            if self.refill_per_second <= 0:
+                return False, math.inf
+            return False, (cost - self.tokens) / self.refill_per_second
+    
+    def spend(self, cost: int) -> None:
+        """Charge cost units"""
+        current_time = time.monotonic()
+        with self.lock:
+            self._refill(current_time)
+            self.tokens -= cost
+    
+    def refund(self, cost: int) -> None:
+        """Give back cost units charged for calls that turned out not to be needed"""
+        current_time = time.monotonic()
+        with self.lock:
+            self._refill(current_time)
+            self.tokens = min(self.capacity, self.tokens + cost)
+    
+    def try_spend(self, cost: int) -> bool:
+        """Charge cost units if they are available; returns whether it did"""
+        current_time = time.monotonic()
+        with self.lock:
+            self._refill(current_time)
+            if self.tokens < cost:
+                return False
+            self.tokens -= cost
+            return True
+    
+    def get_stats(self) -> Dict:
+        """Get remaining quota"""
+        current_time = time.monotonic()
+        with self.lock:
+            self._refill(current_time)
+            return {
+                "units_remaining": int(self.tokens),
+                "daily_limit": int(self.capacity)
+            }
+
+
+def _rejection(limit_type: Optional[str], wait_time: Optional[float]) -> Dict:
+    """Build the tool result for a call refused by a rate or quota limit"""
+    if wait_time is not None and not math.isfinite(wait_time):
+        # A zero daily limit never refills; waiting would not help
+        return {
+            "success": False,
+            "error": "Rate limit exceeded",
+            "limit_type": limit_type,
+            "wait_time": None,
+            "message": "No API quota is configured"
+        }
+    return {
+        "success": False,
+        "error": "Rate limit exceeded",
+        "limit_type": limit_type,
+        "wait_time": wait_time,
+        "message": f"Please wait {wait_time:.1f} seconds before retrying"
+    }
+
+
 # Global rate limiter instance
 rate_limiter = RateLimiter()
 
+# Global quota budget
+quota_bucket = QuotaBucket(config.youtube_api.quota_limit_daily)
 
-def rate_limited(endpoint: Optional[str] = None, wait: bool = False, check_ip: bool = True):
+
+def rate_limited(
+    endpoint: Optional[str] = None,
+    wait: bool = False,
+    check_ip: bool = True,
+    cost: int = 1
+):
     """
     Decorator to apply rate limiting to functions
     
@@ -355,46 +466,88 @@ def rate_limited(endpoint: Optional[str] = None, wait: bool = False, check_ip: b
         endpoint: Endpoint identifier (uses function name if None)
         wait: If True, wait when rate limited instead of raising error
         check_ip: If True, check per-IP rate limits (requires ip_address in kwargs)
+        cost: YouTube API quota units per call (0 for calls that use none);
+            results marked "cached" are not charged, and on @cached
+            functions quota is only checked and charged on a cache miss
     
     Usage:
         @rate_limited(endpoint="search", wait=True, check_ip=True)
         def search_videos(query, ip_address=None):
             # ... function code
+    
+    Works on both plain functions and coroutine functions.
     """
     def decorator(func: Callable) -> Callable:
         endpoint_name = endpoint or func.__name__
         
-        @wraps(func)
-        def wrapper(*args, **kwargs):
+        # @cached functions check and charge quota themselves, on misses
+        # only, so a cache hit is served even when the budget is spent
+        deferred_quota = getattr(func, "deferred_quota", None)
+        if deferred_quota is not None:
+            deferred_quota["cost"] = cost
+            quota_cost = 0
+        else:
+            quota_cost = cost
+        
+        def check(kwargs) -> Tuple[Optional[str], Optional[float], Optional[Dict]]:
+            """Return (ip_address, seconds to wait, rejection response)"""
             # Extract IP address from kwargs if available
             ip_address = kwargs.get('ip_address') if check_ip else None
             
             # Check rate limit
             allowed, wait_time, limit_type = rate_limiter.is_allowed(endpoint_name, ip_address)
             
+            # Then the shared quota budget, which applies even with rate
+            # limiting disabled since the API enforces it regardless
+            if allowed and quota_cost:
+                allowed, wait_time = quota_bucket.available(quota_cost)
+                limit_type = None if allowed else 'quota'
+            
             if not allowed:
                 error_msg = f"Rate limit exceeded ({limit_type or 'global'})"
                 if ip_address:
                     error_msg += f" for IP {ip_address}"
                 
-                if wait and wait_time:
+                if wait and wait_time and math.isfinite(wait_time):
                     logger.info(f"{error_msg}, waiting {wait_time:.1f}s...")
-                    time.sleep(wait_time)
-                else:
-                    return {
-                        "success": False,
-                        "error": "Rate limit exceeded",
-                        "limit_type": limit_type,
-                        "wait_time": wait_time,
-                        "message": f"Please wait {wait_time:.1f} seconds before retrying"
-                    }
-            
-            # Execute function
-            result = func(*args, **kwargs)
+                    return ip_address, wait_time, None
+                return ip_address, None, _rejection(limit_type, wait_time)
             
+            return ip_address, None, None
+        
+        def record(result, ip_address) -> None:
             # Record successful call
             if result and isinstance(result, dict) and result.get("success"):
                 rate_limiter.record_call(endpoint_name, ip_address)
+                if quota_cost and not result.get("cached"):
+                    quota_bucket.spend(quota_cost)
+        
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                ip_address, delay, rejected = check(kwargs)
+                if rejected:
+                    return rejected
+                if delay:
+                    await asyncio.sleep(delay)
+                
+                result = await func(*args, **kwargs)
+                record(result, ip_address)
+                return result
+            
+            return async_wrapper
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            ip_address, delay, rejected = check(kwargs)
+            if rejected:
+                return rejected
+            if delay:
+                time.sleep(delay)
+            
+            # Execute function
+            result = func(*args, **kwargs)
+            record(result, ip_address)
             
             return result
         
@@ -421,6 +574,36 @@ def get_rate_stats(endpoint: str = "default", ip_address: Optional[str] = None)
     return rate_limiter.get_stats(endpoint, ip_address)
 
 
+def get_quota_stats() -> Dict:
+    """Get remaining daily API quota"""
+    return quota_bucket.get_stats()
+
+
+def check_quota(cost: int) -> Optional[Dict]:
+    """Get the rejection response if cost units are not available, else None"""
+    allowed, wait_time = quota_bucket.available(cost)
+    return None if allowed else _rejection('quota', wait_time)
+
+
+def charge_quota(cost: int) -> None:
+    """Charge cost units for API calls already made"""
+    quota_bucket.spend(cost)
+
+
+def refund_quota(cost: int) -> None:
+    """Give back units charged up front that another call is charged for"""
+    quota_bucket.refund(cost)
+
+
+def spend_quota(cost: int) -> bool:
+    """
+    Charge quota for API calls made outside a rate_limited tool call
+    (background warm-ups, read-ahead); returns False, charging nothing,
+    when the budget cannot cover them
+    """
+    return quota_bucket.try_spend(cost)
+
+
 def reset_rate_limits(endpoint: Optional[str] = None, ip_address: Optional[str] = None) -> None:
     """Reset rate limits"""
     rate_limiter.reset(endpoint, ip_address)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Duplicate call suppression for YouTube MCP Server
+Identical concurrent calls share one execution ("singleflight")
+
+Features:
+- Works on coroutine functions (shared asyncio future) and plain
+  functions (shared concurrent future across threads)
+- The key is released as soon as the call finishes, so nothing is cached
+- Built into @cached, so cached functions need no extra decorator
+"""
+
+import asyncio
+import inspect
+import logging
+from concurrent.futures import Future
+from functools import wraps
+from threading import Lock
+from typing import Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _default_key(*args, **kwargs) -> Hashable:
+    """Key calls by their positional and keyword arguments"""
+    return args, tuple(sorted(kwargs.items()))
+
+
+def singleflight(key: Optional[Callable[..., Hashable]] = None):
+    """
+    Decorator letting only one call per key run at a time
+
+    Callers that arrive while a call with the same key is running wait for
+    it and receive its result (or exception) instead of running again.
+
+    Args:
+        key: Function of the call arguments returning a hashable key
+            (defaults to the arguments themselves)
+
+    Usage:
+        @singleflight(key=lambda username: username.lower())
+        def resolve_channel_handle(username):
+            # ... function code
+    """
+    make_key = key or _default_key
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            inflight: Dict[Hashable, asyncio.Future] = {}
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                call_key = make_key(*args, **kwargs)
+                future = inflight.get(call_key)
+                if future is not None:
+                    logger.debug("Joining in-flight call to %s", func.__name__)
+                    return await asyncio.shield(future)
+
+                future = asyncio.get_running_loop().create_future()
+                inflight[call_key] = future
+                try:
+                    result = await func(*args, **kwargs)
+                except BaseException as e:
+                    future.set_exception(e)
+                    # Mark the exception as retrieved when nobody joined
+                    future.exception()
+                    raise
+                else:
+                    future.set_result(result)
+                    return result
+                finally:
+                    inflight.pop(call_key, None)
+
+            return async_wrapper
+
+        thread_inflight: Dict[Hashable, Future] = {}
+        lock = Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            call_key = make_key(*args, **kwargs)
+            with lock:
+                future = thread_inflight.get(call_key)
+                leader = future is None
+                if leader:
+                    future = Future()
+                    thread_inflight[call_key] = future
+
+            if not leader:
+                logger.debug("Joining in-flight call to %s", func.__name__)
+                return future.result()
+
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                with lock:
+                    thread_inflight.pop(call_key, None)
+
+        return wrapper
+    return decorator
@@ -6,13 +6,41 @@ Validates and sanitizes all user inputs
 
 import re
 import logging
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Tuple, Union
 from urllib.parse import urlparse, parse_qs
 
 from config import config
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns - these run on nearly every tool call
+_VIDEO_ID_RE = re.compile(r'^[A-Za-z0-9_-]{11}$')
+_CHANNEL_ID_RE = re.compile(r'^UC[A-Za-z0-9_-]{22}$')
+_USERNAME_RE = re.compile(r'^[A-Za-z0-9_-]{3,30}$')
+_CHANNEL_PATH_RE = re.compile(r'/channel/([^/?]+)')
+_HANDLE_PATH_RE = re.compile(r'/@([^/?]+)')
+_API_KEY_RE = re.compile(r'^[A-Za-z0-9_-]{39}$')
+_SEARCH_QUERY_RE = re.compile(r'^[\w\s\-.,!?@#$%&()\[\]{}+=:;\'\"]*$', re.UNICODE)
+# ASCII/C1 control characters, zero-width characters and the RTL override
+_UNSAFE_CHARS_RE = re.compile('[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F\u200B-\u200D\uFEFF\u202E]')
+
+_YOUTUBE_HOSTS: FrozenSet[str] = frozenset({'www.youtube.com', 'youtube.com', 'm.youtube.com'})
+
+_VALID_ORDERS: Tuple[str, ...] = ('relevance', 'date', 'viewCount', 'rating', 'title')
+
+# Lowercased order (or common variation) -> API order value
+_ORDER_LOOKUP: Dict[str, str] = {
+    **{order.lower(): order for order in _VALID_ORDERS},
+    'views': 'viewCount',
+    'view': 'viewCount',
+    'recent': 'date',
+    'newest': 'date',
+    'oldest': 'date',
+    'popular': 'viewCount',
+    'top': 'rating'
+}
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
@@ -24,7 +52,7 @@ class InputValidator:
     
     def __init__(self):
         """Initialize validator with config"""
-        self.valid_languages = set(config.validation.valid_languages)
+        self.valid_languages = frozenset(config.validation.valid_languages)
         self.max_query_length = config.validation.max_query_length
         self.max_results_limit = config.validation.max_results_limit
         self.max_comments_limit = config.validation.max_comments_limit
@@ -48,7 +76,7 @@ class InputValidator:
         url_or_id = url_or_id.strip()
         
         # Check if it's already a valid video ID (11 chars, alphanumeric with - and _)
-        if re.match(r'^[A-Za-z0-9_-]{11}$', url_or_id):
+        if _VIDEO_ID_RE.match(url_or_id):
             return url_or_id
         
         # Parse as URL
@@ -56,17 +84,17 @@ class InputValidator:
             parsed = urlparse(url_or_id)
             
             # youtube.com/watch?v=...
-            if parsed.hostname in ('www.youtube.com', 'youtube.com', 'm.youtube.com'):
+            if parsed.hostname in _YOUTUBE_HOSTS:
                 query_params = parse_qs(parsed.query)
                 if 'v' in query_params and query_params['v']:
                     video_id = query_params['v'][0]
-                    if re.match(r'^[A-Za-z0-9_-]{11}$', video_id):
+                    if _VIDEO_ID_RE.match(video_id):
                         return video_id
             
             # youtu.be/...
             elif parsed.hostname == 'youtu.be':
                 video_id = parsed.path.lstrip('/')
-                if re.match(r'^[A-Za-z0-9_-]{11}$', video_id):
+                if _VIDEO_ID_RE.match(video_id):
                     return video_id
             
         except Exception as e:
@@ -96,26 +124,24 @@ class InputValidator:
         url_or_id = url_or_id.strip()
         
         # Check if it's a channel ID (starts with UC and is 24 chars)
-        if re.match(r'^UC[A-Za-z0-9_-]{22}$', url_or_id):
+        if _CHANNEL_ID_RE.match(url_or_id):
             return url_or_id
         
         # Check if it's @username format
-        if url_or_id.startswith('@') or '/@' in url_or_id:
-            # Extract username
-            if '/@' in url_or_id:
-                username = url_or_id.split('/@')[-1].split('?')[0].split('/')[0]
-            else:
-                username = url_or_id[1:]  # Remove @
-            
-            # Validate username format
-            if re.match(r'^[A-Za-z0-9_-]{3,30}$', username):
-                return url_or_id  # Return as-is for API resolution
+        if url_or_id.startswith('@'):
+            username = url_or_id[1:]  # Remove @
+        else:
+            match = _HANDLE_PATH_RE.search(url_or_id)
+            username = match.group(1) if match else None
+        
+        # Validate username format
+        if username and _USERNAME_RE.match(username):
+            return url_or_id  # Return as-is for API resolution
         
         # Check if it's a channel URL
-        if '/channel/' in url_or_id:
-            channel_id = url_or_id.split('/channel/')[-1].split('?')[0].split('/')[0]
-            if re.match(r'^UC[A-Za-z0-9_-]{22}$', channel_id):
-                return channel_id
+        match = _CHANNEL_PATH_RE.search(url_or_id)
+        if match and _CHANNEL_ID_RE.match(match.group(1)):
+            return match.group(1)
         
         raise ValidationError(
             f"Invalid YouTube channel URL or ID: {url_or_id[:50]}... "
@@ -176,7 +202,7 @@ class InputValidator:
         
         # Remove potentially dangerous characters
         # Allow alphanumeric, spaces, and common punctuation
-        if not re.match(r'^[\w\s\-.,!?@#$%&()\[\]{}+=:;\'\"]*$', query, re.UNICODE):
+        if not _SEARCH_QUERY_RE.match(query):
             raise ValidationError(
                 "Search query contains invalid characters"
             )
@@ -238,34 +264,19 @@ class InputValidator:
         Raises:
             ValidationError: If order is invalid
         """
-        valid_orders = ['relevance', 'date', 'viewCount', 'rating', 'title']
-        
         if not order or not isinstance(order, str):
             return 'relevance'  # Default
         
         order = order.strip().lower()
         
-        # Map common variations to valid values
-        order_map = {
-            'views': 'viewCount',
-            'view': 'viewCount',
-            'recent': 'date',
-            'newest': 'date',
-            'oldest': 'date',
-            'popular': 'viewCount',
-            'top': 'rating'
-        }
-        
-        order = order_map.get(order, order)
-        
-        # Check if order matches valid value (case-insensitive)
-        for valid_order in valid_orders:
-            if order.lower() == valid_order.lower():
-                return valid_order
+        # Case-insensitive match, including common variations
+        valid_order = _ORDER_LOOKUP.get(order)
+        if valid_order:
+            return valid_order
         
         raise ValidationError(
             f"Invalid order: {order}. "
-            f"Valid options: {', '.join(valid_orders)}"
+            f"Valid options: {', '.join(_VALID_ORDERS)}"
         )
     
     def sanitize_text(self, text: str, max_length: Optional[int] = None) -> str:
@@ -282,18 +293,11 @@ class InputValidator:
         if not text or not isinstance(text, str):
             return ""
         
-        # Remove ASCII control characters (except newlines and tabs)
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
-        
-        # Remove Unicode control characters
-        text = re.sub(r'[\x7F-\x9F\u200B-\u200D\uFEFF]', '', text)
-        
-        # Remove zero-width characters (obfuscation attempts)
-        text = text.replace('\u200B', '')  # Zero-width space
-        text = text.replace('\u200C', '')  # Zero-width non-joiner
-        text = text.replace('\u200D', '')  # Zero-width joiner
-        text = text.replace('\uFEFF', '')  # Zero-width no-break space
-        text = text.replace('\u202E', '')  # Right-to-left override
+        # Remove ASCII/Unicode control characters (except newlines and tabs)
+        # and zero-width/bidi characters used for obfuscation, in one pass.
+        # All of them are non-printable, so printable text skips the regex.
+        if not text.isprintable():
+            text = _UNSAFE_CHARS_RE.sub('', text)
         
         # Limit length if specified
         if max_length and len(text) > max_length:
@@ -306,19 +310,37 @@ class InputValidator:
 validator = InputValidator()
 
 
+# Successful validations of the same string are memoized; failures raise
+# and are not cached, so invalid input is always reported
+_validate_video_url_cached = lru_cache(maxsize=4096)(validator.validate_video_url)
+_validate_channel_id_cached = lru_cache(maxsize=4096)(validator.validate_channel_id)
+_validate_language_cached = lru_cache(maxsize=256)(validator.validate_language)
+
+# Short texts (author names, "Great video!"-style comments) repeat heavily
+# across responses; longer ones are sanitized directly to bound the memo size
+_SANITIZE_MEMO_MAX_LENGTH = 200
+_sanitize_text_cached = lru_cache(maxsize=1024)(validator.sanitize_text)
+
+
 # Convenience functions for easy import
 def validate_video_url(url_or_id: str) -> str:
     """Validate video URL or ID"""
+    if isinstance(url_or_id, str):
+        return _validate_video_url_cached(url_or_id)
     return validator.validate_video_url(url_or_id)
 
 
 def validate_channel_id(url_or_id: str) -> str:
     """Validate channel URL or ID"""
+    if isinstance(url_or_id, str):
+        return _validate_channel_id_cached(url_or_id)
     return validator.validate_channel_id(url_or_id)
 
 
 def validate_language(language: str) -> str:
     """Validate language code"""
+    if isinstance(language, str):
+        return _validate_language_cached(language)
     return validator.validate_language(language)
 
 
@@ -339,6 +361,8 @@ def validate_order(order: str) -> str:
 
 def sanitize_text(text: str, max_length: Optional[int] = None) -> str:
     """Sanitize text"""
+    if isinstance(text, str) and len(text) <= _SANITIZE_MEMO_MAX_LENGTH:
+        return _sanitize_text_cached(text, max_length)
     return validator.sanitize_text(text, max_length)
 
 
@@ -428,8 +452,7 @@ def validate_api_key_format(api_key: str) -> bool:
         return False
     
     # Should only contain alphanumeric, - and _
-    if not re.match(r'^[A-Za-z0-9_-]{39}
-, api_key):
+    if not _API_KEY_RE.match(api_key):
         return False
     
     return True
@@ -3,12 +3,43 @@ YouTube API Client Manager
 Handles both API Key (read-only) and OAuth2 (full access) authentication
 """
 
+import atexit
 import os
 import logging
+import ssl
+import threading
 from typing import Optional
+from urllib.parse import urlsplit
+import httplib2
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
 from dotenv import load_dotenv
 
+# Faster JSON decoding for API responses (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Pooled HTTP transport (optional; HTTP/2 needs the h2 package)
+try:
+    import httpx
+    import certifi  # installed with httpx; the CA bundle it verifies against
+except ImportError:
+    httpx = None
+
+try:
+    import google_auth_httplib2
+except ImportError:
+    google_auth_httplib2 = None
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Try to import OAuth2 (optional)
 try:
     from auth import OAuth2Manager
@@ -21,6 +52,183 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+class OrjsonModel(JsonModel):
+    """JsonModel that decodes response bodies with orjson"""
+    
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Not JSON - hand back the text, as JsonModel does
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+class HttpxAdapter:
+    """
+    httplib2.Http stand-in backed by a shared httpx.Client
+    
+    Implements the subset of the httplib2 interface that googleapiclient
+    and google-auth-httplib2 use. The underlying client is thread-safe and
+    keeps connections alive across requests and threads.
+    """
+    
+    def __init__(self, client: "httpx.Client"):
+        self._client = client
+        # Domain ("" for any) -> own client presenting a client certificate
+        self._cert_clients = {}
+        self.timeout = None
+        self.follow_redirects = True
+        self.redirect_codes = frozenset((301, 302, 303, 307, 308))
+        self.connections = {}
+    
+    def _client_for(self, uri: str) -> "httpx.Client":
+        if not self._cert_clients:
+            return self._client
+        authority = urlsplit(uri).netloc.lower()
+        return (
+            self._cert_clients.get(authority)
+            or self._cert_clients.get("")
+            or self._client
+        )
+    
+    def request(self, uri, method="GET", body=None, headers=None,
+                redirections=5, connection_type=None):
+        response = self._client_for(uri).request(
+            method,
+            uri,
+            content=body,
+            headers=headers,
+            follow_redirects=self.follow_redirects and redirections > 0
+        )
+        info = dict(response.headers)
+        info["status"] = str(response.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = response.reason_phrase
+        return resp, response.content
+    
+    def add_certificate(self, key, cert, domain, password=None):
+        """
+        Present a client certificate to domain ("" for every domain), as
+        httplib2.Http.add_certificate does
+        
+        The shared client cannot carry a certificate, so requests to that
+        domain go through a client of their own.
+        """
+        context = ssl.create_default_context(cafile=certifi.where())
+        context.load_cert_chain(certfile=cert, keyfile=key, password=password)
+        self._cert_clients[domain.lower()] = _new_httpx_client(verify=context)
+    
+    def close(self):
+        # The shared client is closed at exit; certificate clients are our own
+        for client in self._cert_clients.values():
+            client.close()
+
+
+_shared_httpx_client = None
+_shared_httpx_lock = threading.Lock()
+
+
+def _new_httpx_client(verify=True) -> "httpx.Client":
+    """Pooled client with the settings every API transport uses"""
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        verify=verify,
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        # With HTTP/2 concurrent requests multiplex over few connections
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+    )
+
+
+def _get_httpx_client() -> "httpx.Client":
+    """Process-wide pooled client, created on first use"""
+    global _shared_httpx_client
+    with _shared_httpx_lock:
+        if _shared_httpx_client is None:
+            _shared_httpx_client = _new_httpx_client()
+            atexit.register(close_http_client)
+        return _shared_httpx_client
+
+
+def close_http_client() -> None:
+    """Close the shared pooled client (a new one is created on next use)"""
+    global _shared_httpx_client
+    with _shared_httpx_lock:
+        if _shared_httpx_client is not None:
+            _shared_httpx_client.close()
+            _shared_httpx_client = None
+
+
+class ThreadLocalHttp:
+    """
+    httplib2.Http stand-in that gives each thread its own connections
+    
+    Used when httpx is not installed. httplib2.Http is not thread-safe, and
+    tool calls run API requests in worker threads; one keep-alive Http per
+    thread keeps connections reused without sharing them across threads.
+    """
+    
+    def __init__(self, credentials=None):
+        self._credentials = credentials
+        self._local = threading.local()
+    
+    def _http(self):
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = build_http()
+            if self._credentials is not None:
+                http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=http)
+            self._local.http = http
+        return http
+    
+    def request(self, *args, **kwargs):
+        return self._http().request(*args, **kwargs)
+    
+    def __getattr__(self, name):
+        # timeout, redirect_codes, ... of the calling thread's instance
+        return getattr(self._http(), name)
+    
+    def close(self):
+        http = getattr(self._local, "http", None)
+        if http is not None:
+            http.close()
+            self._local.http = None
+
+
+def api_http(credentials=None):
+    """
+    HTTP transport to pass to googleapiclient's build()
+    
+    Args:
+        credentials: OAuth2 credentials to authorize requests with
+    
+    Returns:
+        HttpxAdapter (wrapped in AuthorizedHttp when credentials are given),
+        ThreadLocalHttp when httpx is not installed, or None to use the
+        library default when google-auth-httplib2 is missing as well
+    """
+    if google_auth_httplib2 is None and credentials is not None:
+        return None
+    if httpx is None:
+        return ThreadLocalHttp(credentials)
+    
+    http = HttpxAdapter(_get_httpx_client())
+    if credentials is not None:
+        http = google_auth_httplib2.AuthorizedHttp(credentials, http=http)
+    return http
+
+
+def response_model() -> Optional[JsonModel]:
+    """
+    Model to pass to googleapiclient's build()
+    
+    Returns None (the library default) when orjson is not installed.
+    """
+    return OrjsonModel() if orjson is not None else None
+
+
 class YouTubeClient:
     """
     Unified YouTube API client supporting both authentication methods
@@ -53,11 +261,16 @@ class YouTubeClient:
         # Initialize API key client (always available for read operations)
         if self.api_key:
             try:
+                # Static discovery reads the document bundled with
+                # google-api-python-client, so startup makes no discovery request
                 self.youtube = build(
                     "youtube",
                     "v3",
                     developerKey=self.api_key,
-                    cache_discovery=False
+                    cache_discovery=False,
+                    static_discovery=True,
+                    model=response_model(),
+                    http=api_http()
                 )
                 logger.info("✅ YouTube API client (API key) initialized")
             except Exception as e: